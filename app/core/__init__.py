@@ -8,6 +8,8 @@ from .lifespan_services import (
     init_httpx_client,
     shutdown_httpx_client,
 )
+from .disconnect import run_until_disconnect
+from .offload import offload_cpu, get_offload_metrics, init_offload_pools, shutdown_offload_pools
 
 
 __all__ = [
@@ -20,4 +22,9 @@ __all__ = [
     "init_redis_client",
     "shutdown_redis_client",
     "get_redis_client",
+    "run_until_disconnect",
+    "offload_cpu",
+    "get_offload_metrics",
+    "init_offload_pools",
+    "shutdown_offload_pools",
 ]
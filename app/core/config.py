@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,6 +35,64 @@ class Settings(BaseSettings):
     REDIS_COOKIES_KEY: str
     REDIS_COOKIES_TTL: int  # TTL - это число (секунды)
 
+    # === Обогащение с ограничением по времени (budget_ms) ===
+    ENRICH_PENDING_TTL: int = 600  # Время хранения дозагруженных полей (секунды)
+    ENRICH_PENDING_WAIT: float = 30.0  # Сколько запрос продолжения ждёт готовности полей (секунды)
+
+    # === Идемпотентное обогащение ===
+    IDEMPOTENCY_RESULT_TTL: int = 60  # Сколько повторный запрос на обогащение получает готовый результат (секунды)
+    TIMELINE_CONCURRENCY: int = 3  # Сколько случаев хронологии пациента обогащается одновременно
+
+    # === Разбор выписного эпикриза ===
+    DISCHARGE_SUMMARY_CACHE_SIZE: int = 512  # Сколько разобранных эпикризов хранить в памяти воркера (0 - не хранить)
+
+    # === Справочник медицинских организаций ===
+    MEDICAL_ORG_FUZZY_THRESHOLD: float = 0.6  # Минимальное сходство наименований по триграммам (0..1)
+    MEDICAL_ORG_INN_FUZZY_THRESHOLD: float = 0.3  # То же среди организаций с ИНН или ОГРН направившей (0..1)
+
+    # === Справочники ===
+    REFERENCE_DATA_DIR: str = "data/reference"  # Каталог с обновлёнными справочниками (заменяют app/mapper)
+    REFERENCE_RELOAD_INTERVAL: int = 30  # Период проверки файлов справочников (секунды, 0 - не проверять)
+    REFERENCE_SYNC_ENABLED: bool = False
+    REFERENCE_SYNC_INTERVAL: int = 3600  # Период загрузки справочников из ЕВМИАС (секунды)
+    REFERENCE_SYNC_TTL: int = 7 * 86400  # Время хранения загруженных справочников в Redis (секунды)
+
+    # === Группировщик КСГ ===
+    KSG_DATA_DIR: str = "data/ksg"  # Каталог с таблицами КСГ (файл ksg_<KSG_YEAR>.json)
+
+    # === Вынос CPU-работы из цикла событий ===
+    OFFLOAD_THRESHOLD_BYTES: int = 256 * 1024  # Данные меньше этого размера обрабатываются сразу
+    OFFLOAD_THREAD_WORKERS: int = 2  # Размер пула потоков (0 - всё выполняется в цикле событий)
+    OFFLOAD_PROCESS_WORKERS: int = 0  # Размер пула процессов для чистого Python (0 - использовать пул потоков)
+
+    # === Поиск госпитализаций: кэш и локальный индекс ===
+    SEARCH_CACHE_TTL: int = 300  # Время хранения результатов поиска госпитализаций (секунды, 0 - без кэша)
+    SEARCH_SPLIT_CONCURRENCY: int = 4  # Сколько месячных отрезков поиска запрашивать одновременно
+    SEARCH_SEALED_CHUNK_TTL: int = 86400  # Время хранения результатов поиска за завершившиеся месяцы (секунды)
+    SEARCH_HANDLE_TTL: int = 3600  # Время хранения полных строк поиска для обогащения по handle (секунды)
+    SEARCH_ENRICH_SELECT: Literal["single", "latest"] = "single"  # Какую строку обогащать в /search-enrich
+    SEARCH_ENRICH_SPECULATIVE: bool = True  # Заранее обогащать первую строку, если найдено несколько
+    SEARCH_BATCH_CONCURRENCY: int = 2  # Сколько фамилий пакетного поиска искать одновременно
+    SEARCH_INDEX_ENABLED: bool = False
+    SEARCH_INDEX_PATH: str = "data/search_index.sqlite3"  # Файл SQLite с локальным индексом (общий для воркеров)
+    SEARCH_INDEX_SYNC_INTERVAL: int = 300  # Период синхронизации индекса с ЕВМИАС (секунды)
+    SEARCH_INDEX_MAX_AGE: int = 900  # Индекс старше этого (секунды) не используется для поиска
+    SEARCH_INDEX_OVERLAP_DAYS: int = 7  # Сколько последних дней выписки перезаписывается при каждой синхронизации
+
+    # === Отметки о заполнении и рабочий список ===
+    SUBMISSION_TTL: int = 90 * 86400  # Сколько хранится отметка о заполнении формы для случая (секунды)
+    WORKLIST_ENABLED: bool = False
+    WORKLIST_REFRESH_INTERVAL: int = 600  # Период обновления рабочего списка (секунды)
+    WORKLIST_WINDOW_DAYS: int = 14  # За сколько последних дней выписки строить рабочий список
+    WORKLIST_PREFETCH: bool = False  # Готовить обогащённые данные для случаев рабочего списка
+
+    # === Предварительная подготовка обогащённых данных ===
+    PRECOMPUTE_ENABLED: bool = False
+    PRECOMPUTE_HOUR: int = 3  # Час ежедневного запуска (локальное время)
+    PRECOMPUTE_WINDOW_DAYS: int = 3  # За сколько последних дней выписки готовить случаи
+    PRECOMPUTE_CONCURRENCY: int = 2  # Сколько случаев обогащается одновременно
+    PRECOMPUTE_TTL: int = 86400  # Время хранения подготовленных данных (секунды)
+
     # === Настройки безопасности и отладки ===
     CORS_ALLOW_REGEX: str = r"^chrome-extension://[a-z]{32}$"
     LOGS_LEVEL: str
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Awaitable, TypeVar
+
+from fastapi import HTTPException, Request
+
+from app.core import logger
+
+T = TypeVar("T")
+
+DISCONNECT_POLL_INTERVAL = 0.5  # секунды
+CLIENT_CLOSED_REQUEST = 499  # нестандартный статус nginx "клиент закрыл соединение"
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+
+async def run_until_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """
+    Выполняет работу обработчика и отменяет её, если клиент отключился (закрыл popup, ушёл со страницы).
+    Отмена доходит до запросов к ЕВМИАС и их повторов и освобождает соединения с ЕВМИАС.
+    Общие вычисления, которых ждут другие запросы (см. run_idempotent), при этом продолжаются.
+    """
+    work = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+
+    if work.done():
+        return work.result()
+
+    work.cancel()
+    try:
+        await work
+    except asyncio.CancelledError:
+        pass
+    logger.info(f"Клиент отключился, обработка {request.method} {request.url.path} отменена")
+    raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент закрыл соединение")
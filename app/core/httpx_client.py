@@ -7,6 +7,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from app.core import logger, get_settings
 from app.core.decorators import log_and_catch
+from app.core.offload import offload_cpu
 
 settings = get_settings()
 
@@ -133,8 +134,9 @@ class HTTPXClient:
 
         # --- Шаг 3: Обработка ответа ---
         # Ошибки здесь (кроме JSONDecodeError) будут пойманы @log_and_catch,
-        # но НЕ вызовут retry (т.к. не подходят под _is_retryable_exception)
-        processed_result = self._process_response(response, url)
+        # но НЕ вызовут retry (т.к. не подходят под _is_retryable_exception).
+        # Большие ответы разбираются в пуле потоков, чтобы не останавливать цикл событий
+        processed_result = await offload_cpu(self._process_response, response, url, size=len(response.content))
         return processed_result
 
 
@@ -0,0 +1,98 @@
+"""
+Вынос тяжёлой CPU-работы (разбор больших JSON-ответов, разбор шаблона эпикриза) из цикла событий.
+
+Работа с данными меньше OFFLOAD_THRESHOLD_BYTES выполняется сразу в цикле событий: передача в пул
+стоит дороже самой работы. Большие данные обрабатываются в пуле потоков (OFFLOAD_THREAD_WORKERS)
+или, для чистого Python-кода вроде регулярных выражений, в пуле процессов (OFFLOAD_PROCESS_WORKERS).
+В потоке такая работа держит GIL, но интерпретатор переключается между потоками каждые несколько
+миллисекунд, и остальные запросы воркера не ждут её окончания целиком. Пул процессов снимает и это
+ограничение ценой передачи данных между процессами. Если пул процессов не задан (0),
+работа для него выполняется в пуле потоков.
+
+Пулы создаются при старте приложения (init_offload_pools). До этого, например в скриптах,
+вся работа выполняется сразу. Счётчики и время выполнения по каждому виду работы
+возвращает get_offload_metrics.
+"""
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, TypeVar
+
+from app.core import get_settings, logger
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+_pools: Dict[str, Executor] = {}
+_metrics: Dict[str, Dict[str, float]] = {}
+
+
+def _record(kind: str, elapsed: float) -> None:
+    metrics = _metrics.setdefault(kind, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+    metrics["count"] += 1
+    metrics["total_s"] += elapsed
+    metrics["max_s"] = max(metrics["max_s"], elapsed)
+
+
+async def offload_cpu(func: Callable[..., T], *args: Any, size: int, process: bool = False) -> T:
+    """
+    Выполняет func(*args) в пуле, если размер обрабатываемых данных size не меньше OFFLOAD_THRESHOLD_BYTES,
+    иначе - сразу. process=True - работа на чистом Python (func и аргументы должны сериализоваться pickle).
+    """
+    pool = None
+    if size >= settings.OFFLOAD_THRESHOLD_BYTES:
+        pool = _pools.get("process") if process else None
+        pool = pool or _pools.get("thread")
+
+    start_time = time.perf_counter()
+    if pool is None:
+        result = func(*args)
+        _record("inline", time.perf_counter() - start_time)
+        return result
+
+    kind = "process" if isinstance(pool, ProcessPoolExecutor) else "thread"
+    result = await asyncio.get_running_loop().run_in_executor(pool, partial(func, *args))
+    _record(kind, time.perf_counter() - start_time)
+    return result
+
+
+def get_offload_metrics() -> Dict[str, Any]:
+    """Счётчики выполненной работы по видам (inline, thread, process): количество, суммарное и максимальное время."""
+    return {
+        "threshold_bytes": settings.OFFLOAD_THRESHOLD_BYTES,
+        "pools": {kind: getattr(pool, "_max_workers", None) for kind, pool in _pools.items()},
+        "tasks": {
+            kind: {
+                "count": int(metrics["count"]),
+                "avg_ms": round(metrics["total_s"] / metrics["count"] * 1000, 3),
+                "max_ms": round(metrics["max_s"] * 1000, 3),
+            }
+            for kind, metrics in _metrics.items()
+        },
+    }
+
+
+def init_offload_pools() -> None:
+    """Создаёт пулы потоков и процессов для тяжёлой CPU-работы."""
+    if settings.OFFLOAD_THREAD_WORKERS > 0:
+        _pools["thread"] = ThreadPoolExecutor(
+            max_workers=settings.OFFLOAD_THREAD_WORKERS, thread_name_prefix="offload"
+        )
+    if settings.OFFLOAD_PROCESS_WORKERS > 0:
+        # spawn, а не fork: процесс воркера уже запустил цикл событий и соединения
+        _pools["process"] = ProcessPoolExecutor(
+            max_workers=settings.OFFLOAD_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    logger.info(f"Пулы для CPU-работы созданы: потоков {settings.OFFLOAD_THREAD_WORKERS}, "
+                f"процессов {settings.OFFLOAD_PROCESS_WORKERS}, порог {settings.OFFLOAD_THRESHOLD_BYTES} байт")
+
+
+def shutdown_offload_pools() -> None:
+    """Останавливает пулы, не дожидаясь задач из очереди."""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown(wait=False, cancel_futures=True)
+    logger.info("Пулы для CPU-работы остановлены")
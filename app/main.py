@@ -10,8 +10,22 @@ from app.core import (
     shutdown_httpx_client,
     init_redis_client,
     shutdown_redis_client,
+    init_offload_pools,
+    shutdown_offload_pools,
 )
 from app.route import api_router
+from app.service import (
+    start_precompute_scheduler,
+    stop_precompute_scheduler,
+    start_search_index_sync,
+    stop_search_index_sync,
+    start_worklist_refresh,
+    stop_worklist_refresh,
+    start_reference_watch,
+    stop_reference_watch,
+    start_reference_sync,
+    stop_reference_sync,
+)
 
 settings = get_settings()
 
@@ -25,6 +39,12 @@ async def lifespan(app: FastAPI):
     logger.info("Запуск приложения...")
     await init_httpx_client(app)
     await init_redis_client(app)
+    init_offload_pools()
+    start_reference_watch(app)
+    start_precompute_scheduler(app)
+    start_search_index_sync(app)
+    start_worklist_refresh(app)
+    start_reference_sync(app)
     logger.info("Инициализация завершена.")
 
     # --- Приложение работает ---
@@ -32,6 +52,12 @@ async def lifespan(app: FastAPI):
 
     # --- Shutdown Phase ---
     logger.info("Завершение работы приложения...")
+    await stop_reference_sync(app)
+    await stop_worklist_refresh(app)
+    await stop_search_index_sync(app)
+    await stop_precompute_scheduler(app)
+    await stop_reference_watch(app)
+    shutdown_offload_pools()
     await shutdown_redis_client(app)
     await shutdown_httpx_client(app)
     logger.info("Ресурсы освобождены.")
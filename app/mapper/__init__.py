@@ -1,17 +0,0 @@
-from .bed_profile_mapper import bed_profile_correction_rules
-from .bed_profiles import bed_profiles
-from .department_codes import department_codes
-from .disease_outcome_ids import disease_outcome_ids
-from .medical_care_profile import medical_care_profile
-from .medical_care_profile_mapper import medical_care_profile_correction_rules
-from .medical_orgs import medical_orgs
-
-__all__ = [
-    "disease_outcome_ids",
-    "medical_orgs",
-    "department_codes",
-    "bed_profiles",
-    "bed_profile_correction_rules",
-    "medical_care_profile",
-    "medical_care_profile_correction_rules"
-]
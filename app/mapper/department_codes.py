@@ -1,13 +0,0 @@
-department_codes = {
-    "Дневной стационар": "36",
-    "Кардиологическое отделение": "21",
-    "Хирургическое отделение №1": "3",
-    "Хирургическое отделение №2": "13",
-    "Урологическое отделение": "5",
-    "Гинекологическое отделение": "7",
-    "Травматология": "26",
-    "Отделение реабилитации": "130",
-    "Неврология": "22",
-    "Гастроэнтерология": "27",
-    "Отделение терапии": "12"
-}
\ No newline at end of file
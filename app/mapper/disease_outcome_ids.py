@@ -1,19 +0,0 @@
-disease_outcome_ids = {
-    "3010101000000048": {"name": "Улучшение", "code": 401},
-    "3010101000000037": {"name": "Без перемен", "code": 103},
-    "3010101000000043": {"name": "Выздоровление", "code": 301},
-    "3010101000000051": {"name": "Осмотр", "code": 306},
-    "3010101000000041": {"name": "Без перемен", "code": 203},
-    "3010101000000049": {"name": "Без эффекта", "code": 402},
-    "3010101000000042": {"name": "Ухудшение", "code": 204},
-    "3010101000000046": {"name": "Без перемен", "code": 304},
-    "3010101000000039": {"name": "Выздоровление", "code": 201},
-    "3010101000000045": {"name": "Улучшение", "code": 303},
-    "3010101000000035": {"name": "Выздоровление", "code": 101},
-    "3010101000000040": {"name": "Улучшение", "code": 202},
-    "3010101000000050": {"name": "Ухудшение", "code": 403},
-    "3010101000000036": {"name": "Улучшение", "code": 102},
-    "3010101000000038": {"name": "Ухудшение", "code": 104},
-    "3010101000000044": {"name": "Ремиссия", "code": 302},
-    "3010101000000047": {"name": "Ухудшение", "code": 305},
-}
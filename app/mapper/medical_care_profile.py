@@ -1,50 +0,0 @@
-medical_care_profile = {
-    "аллергологии и иммунологии": {"Code": "3", "Name": "Аллергология и иммунология"},
-    "гастроэнтерологии": {"Code": "4", "Name": "Гастроэнтерология"},
-    "гериатрии": {"Code": "38", "Name": "Гериатрия"},
-    "детской онкологии": {"Code": "8", "Name": "Детская онкология"},
-    "детской хирургии": {"Code": "10", "Name": "Детская хирургия"},
-    "инфекционным болезням": {"Code": "12", "Name": "Инфекционные болезни"},
-    "кардиологии": {"Code": "13", "Name": "Кардиология"},
-    "колопроктологии": {"Code": "14", "Name": "Колопроктология"},
-    "неврологии": {"Code": "15", "Name": "Неврология"},
-    "нейрохирургии": {"Code": "16", "Name": "Нейрохирургия"},
-    "неонатологии": {"Code": "17", "Name": "Неонатология"},
-    "нефрологии": {"Code": "18", "Name": "Нефрология (без диализа)"},
-    "сурдологии-оториноларингологии": {"Code": "20", "Name": "Оториноларингология"},
-    "педиатрии": {"Code": "22", "Name": "Педиатрия"},
-    "торакальной хирургии": {"Code": "28", "Name": "Торакальная хирургия"},
-    "травматологии и ортопедии": {"Code": "29", "Name": "Травматология и ортопедия"},
-    "урологии": {"Code": "30", "Name": "Урология"},
-    "хирургии": {"Code": "31", "Name": "Хирургия"},
-    "детской урологии-андрологии": {"Code": "9", "Name": "Детская урология-андрология"},
-    "детской эндокринологии": {"Code": "11", "Name": "Детская эндокринология"},
-    "офтальмологии": {"Code": "21", "Name": "Офтальмология"},
-    "гематологии": {"Code": "5", "Name": "Гематология"},
-    "хирургии (абдоминальной)": {"Code": "32", "Name": "Хирургия (абдоминальная)"},
-    "хирургии (комбустиологии)": {"Code": "33", "Name": "Хирургия (комбустиология)"},
-    "челюстно-лицевой хирургии": {"Code": "34", "Name": "Челюстно-лицевая хирургия"},
-    "эндокринологии": {"Code": "35", "Name": "Эндокринология"},
-    "акушерскому делу": {"Code": "2", "Name": "Акушерство и гинекология"},
-    "онкологии": {"Code": "19", "Name": "Онкология"},
-    "ревматологии": {"Code": "24", "Name": "Ревматология"},
-    "дерматовенерологии": {"Code": "6", "Name": "Дерматовенерология"},
-    "медицинской реабилитации": {"Code": "37", "Name": "Медицинская реабилитация"},
-    "пульмонологии": {"Code": "23", "Name": "Пульмонология"},
-    "детской кардиологии": {"Code": "7", "Name": "Детская кардиология"},
-    "сердечно-сосудистой хирургии": {
-        "Code": "25",
-        "Name": "Сердечно-сосудистая хирургия",
-    },
-    "стоматологии детской": {"Code": "26", "Name": "Стоматология детская"},
-    "терапии": {"Code": "27", "Name": "Терапия"},
-    "хирургии (трансплантации органов и (или) тканей)": {
-        "Code": "41",
-        "Name": "Хирургия (трансплантация органов и (или) тканей)",
-    },
-    "акушерству и гинекологии (за исключением использования вспомогательных репродуктивных технологий и искусственного "
-    "прерывания беременности)":{
-        "Code": "2",
-        "Name": "Акушерство и гинекология"
-    }
-}
@@ -1,5 +0,0 @@
-medical_care_profile_correction_rules = {
-    "абдоминальной хирургии": "хирургии (абдоминальной)",
-    "нейрохирургические": "нейрохирургии",
-    "сосудистой хирургии": "сердечно-сосудистой хирургии",
-}
\ No newline at end of file
@@ -1,642 +0,0 @@
-medical_orgs = {
-    'ЧАСТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ПОЛИКЛИНИКА "РЖД-МЕДИЦИНА" ГОРОДА МУРМАНСК"': {
-        "registry_code": "00557500",
-        "code": "510051",
-        "name": 'ЧАСТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ПОЛИКЛИНИКА "РЖД-МЕДИЦИНА" ГОРОДА МУРМАНСК"',
-        "short_name": 'ЧУЗ "РЖД-МЕДИЦИНА" Г. МУРМАНСК',
-        "id": 17282163719,
-        "inn": "5190128421",
-        "kpp": "519001001",
-        "ogrn": "1045100176098",
-    },
-    'ЧАСТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ " ПОЛИКЛИНИКА "РЖД-МЕДИЦИНА" ГОРОДА МУРМАНСК': {
-        "registry_code": "00557500",
-        "code": "510051",
-        "name": 'ЧАСТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ " ПОЛИКЛИНИКА "РЖД-МЕДИЦИНА" ГОРОДА МУРМАНСК',
-        "short_name": 'ЧУЗ "РЖД-МЕДИЦИНА" Г. МУРМАНСК',
-        "id": 17282163719,
-        "inn": "5190128421",
-        "kpp": "519001001",
-        "ogrn": "1045100176098",
-    },
-    'ЧУЗ РЖД-Медицина г. Кандалакша': {
-        "registry_code": "00557500",
-        "code": "510051",
-        "name": 'ЧАСТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ " ПОЛИКЛИНИКА "РЖД-МЕДИЦИНА" ГОРОДА МУРМАНСК',
-        "short_name": 'ЧУЗ "РЖД-МЕДИЦИНА" Г. МУРМАНСК',
-        "id": 17282163719,
-        "inn": "5190128421",
-        "kpp": "519001001",
-        "ogrn": "1045100176098",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ЛЕЧЕБНО-ДИАГНОСТИЧЕСКИЙ ЦЕНТР МЕЖДУНАРОДНОГО ИНСТИТУТА БИОЛОГИЧЕСКИХ СИСТЕМ-МУРМАНСК"': {
-        "registry_code": "00558600",
-        "code": "510091",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ЛЕЧЕБНО-ДИАГНОСТИЧЕСКИЙ ЦЕНТР МЕЖДУНАРОДНОГО ИНСТИТУТА БИОЛОГИЧЕСКИХ СИСТЕМ-МУРМАНСК"',
-        "short_name": 'ООО "ЛДЦ МИБС-МУРМАНСК"',
-        "id": 17282163737,
-        "inn": "5190927022",
-        "kpp": "519001001",
-        "ogrn": "1115190000530",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "АЛЕКСАНДРИЯ"': {
-        "registry_code": "00558700",
-        "code": "510093",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "АЛЕКСАНДРИЯ"',
-        "short_name": 'ООО "АЛЕКСАНДРИЯ"',
-        "id": 17282163738,
-        "inn": "5106000105",
-        "kpp": "510601001",
-        "ogrn": "1135108000026",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "МРТ-ЭКСПЕРТ МУРМАНСК"': {
-        "registry_code": "00558900",
-        "code": "510097",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "МРТ-ЭКСПЕРТ МУРМАНСК"',
-        "short_name": 'ООО "МРТ-ЭКСПЕРТ МУРМАНСК"',
-        "id": 17282163739,
-        "inn": "5190927199",
-        "kpp": "519001001",
-        "ogrn": "1115190000705",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ДОБРЫЙ ДОКТОР"': {
-        "registry_code": "00560200",
-        "code": "510405",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ДОБРЫЙ ДОКТОР"',
-        "short_name": 'ООО "ДОБРЫЙ ДОКТОР"',
-        "id": 17282163745,
-        "inn": "5102045024",
-        "kpp": "510201001",
-        "ogrn": "1095102000069",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ВИКТОРИЯ-М"': {
-        "registry_code": "00560700",
-        "code": "510431",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ВИКТОРИЯ-М"',
-        "short_name": 'ООО "ВИКТОРИЯ-М"',
-        "id": 17282163750,
-        "inn": "5190168382",
-        "kpp": "519001001",
-        "ogrn": "1075190015174",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "МЕДСКАН"': {
-        "registry_code": "00561200",
-        "code": "510452",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "МЕДСКАН"',
-        "short_name": 'ООО "МЕДСКАН"',
-        "id": 17282163753,
-        "inn": "5190080931",
-        "kpp": "519001001",
-        "ogrn": "1195190003227",
-    },
-    'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 6" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"': {
-        "registry_code": "00556904",
-        "code": "999976",
-        "name": 'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 6" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": 'Филиал "МСЧ № 6" ФГБУЗ ЦМСЧ № 120 ФМБА России',
-        "id": 18023729442,
-        "inn": "5112000128",
-        "kpp": "511343001",
-        "ogrn": "1025100749112",
-    },
-    "ФГБУЗ  ЦМСЧ№120 ФИЛИАЛ МСЧ№6": {
-        "registry_code": "00556904",
-        "code": "999976",
-        "name": 'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 6" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": 'Филиал "МСЧ № 6" ФГБУЗ ЦМСЧ № 120 ФМБА России',
-        "id": 18023729442,
-        "inn": "5112000128",
-        "kpp": "511343001",
-        "ogrn": "1025100749112",
-    },
-    'Общество с ограниченной ответственностью "Санаторий-профилакторий "Ковдорский"': {
-        "registry_code": "00558200",
-        "code": "510070",
-        "name": 'Общество с ограниченной ответственностью "Санаторий-профилакторий "Ковдорский"',
-        "short_name": 'ООО "СП "Ковдорский"',
-        "id": 18104978985,
-        "inn": "5104908614",
-        "kpp": "510401001",
-        "ogrn": "1035100038060",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ОФТАЛЬМОЛОГИЧЕСКИЙ ЦЕНТР МУРМАНСКОЙ ОБЛАСТИ"': {
-        "registry_code": "01065000",
-        "code": "-",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ "ОФТАЛЬМОЛОГИЧЕСКИЙ ЦЕНТР МУРМАНСКОЙ ОБЛАСТИ"',
-        "short_name": 'ООО "ОЦМО"',
-        "id": 18115318138,
-        "inn": "5190088360",
-        "kpp": "519001001",
-        "ogrn": "1215100004646",
-    },
-    'Общество с ограниченной ответственностью "Колабыт"': {
-        "registry_code": "00558500",
-        "code": "510089",
-        "name": 'Общество с ограниченной ответственностью "Колабыт"',
-        "short_name": 'ООО "Колабыт"',
-        "id": 18482307375,
-        "inn": "5190308230",
-        "kpp": "510701001",
-        "ogrn": "1025100652785",
-    },
-    '"НАУЧНО-ИССЛЕДОВАТЕЛЬСКАЯ ЛАБОРАТОРИЯ ФЕДЕРАЛЬНОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ НАУКИ "СЕВЕРО-ЗАПАДНЫЙ НАУЧНЫЙ ЦЕНТР ГИГИЕНЫ И ОБЩЕСТВЕННОГО ЗДОРОВЬЯ"': {
-        "registry_code": "01034701",
-        "code": "991074",
-        "name": '"НАУЧНО-ИССЛЕДОВАТЕЛЬСКАЯ ЛАБОРАТОРИЯ ФЕДЕРАЛЬНОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ НАУКИ "СЕВЕРО-ЗАПАДНЫЙ НАУЧНЫЙ ЦЕНТР ГИГИЕНЫ И ОБЩЕСТВЕННОГО ЗДОРОВЬЯ"',
-        "short_name": 'НИЛ ФБУН "СЗНЦ гигиены и общественного здоровья"',
-        "id": 19451349965,
-        "inn": "7815001513",
-        "kpp": "510302001",
-        "ogrn": "1037843133316",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ КЛИНИЧЕСКИЙ МНОГОПРОФИЛЬНЫЙ ЦЕНТР"': {
-        "registry_code": "01074500",
-        "code": "510457",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ КЛИНИЧЕСКИЙ МНОГОПРОФИЛЬНЫЙ ЦЕНТР"',
-        "short_name": "ГОБУЗ МОКМЦ",
-        "id": 19516573472,
-        "inn": "5190080385",
-        "kpp": "519001001",
-        "ogrn": "1195190002402",
-    },
-    'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 5 ИМ. СВЯТИТЕЛЯ НИКОЛАЯ АРХИЕПИСКОПА МИРЛИКИЙСКОГО ЧУДОТВОРЦА" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО- САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО- БИОЛОГИЧЕСКОГО АГЕНТСТВА"': {
-        "registry_code": "00556903",
-        "code": "999975",
-        "name": 'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 5 ИМ. СВЯТИТЕЛЯ НИКОЛАЯ АРХИЕПИСКОПА МИРЛИКИЙСКОГО ЧУДОТВОРЦА" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО- САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО- БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": 'Филиал "МСЧ № 5" ФГБУЗ ЦМСЧ № 120 ФМБА России',
-        "id": 19637774168,
-        "inn": "5112000128",
-        "kpp": "511643001",
-        "ogrn": "1025100749112",
-    },
-    'Филиал "Медико-санитарная часть № 5 им. Святителя Николая архиепископа Мирликийского Чудотворца" Федерального государственного бюджетного учреждения здравоохранения «Центральная медико-санитарная часть № 120 Федерального медико-биологического агентства»': {
-        "registry_code": "00556903",
-        "code": "999975",
-        "name": 'ФИЛИАЛ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 5 ИМ. СВЯТИТЕЛЯ НИКОЛАЯ АРХИЕПИСКОПА МИРЛИКИЙСКОГО ЧУДОТВОРЦА" ФЕДЕРАЛЬНОГО ГОСУДАРСТВЕННОГО БЮДЖЕТНОГО УЧРЕЖДЕНИЯ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО- САНИТАРНАЯ ЧАСТЬ № 120 ФЕДЕРАЛЬНОГО МЕДИКО- БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": 'Филиал "МСЧ № 5" ФГБУЗ ЦМСЧ № 120 ФМБА России',
-        "id": 19637774168,
-        "inn": "5112000128",
-        "kpp": "511643001",
-        "ogrn": "1025100749112",
-    },
-    'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 118 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"': {
-        "registry_code": "00556800",
-        "code": "990192",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 118 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ МСЧ № 118 ФМБА РОССИИ",
-        "id": 19697966928,
-        "inn": "5117100091",
-        "kpp": "511701001",
-        "ogrn": "1025100816872",
-    },
-    "ФГБУЗ МСЧ 118 ФМБА": {
-        "registry_code": "00556800",
-        "code": "990192",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 118 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ МСЧ № 118 ФМБА РОССИИ",
-        "id": 19697966928,
-        "inn": "5117100091",
-        "kpp": "511701001",
-        "ogrn": "1025100816872",
-    },
-    'Федеральное государственное бюджетное учреждение здравоохранения "Медико-санитарная часть № 118 Федерального медико-биологического агентства"': {
-        "registry_code": "00556800",
-        "code": "990192",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ № 118 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ МСЧ № 118 ФМБА РОССИИ",
-        "id": 19697966928,
-        "inn": "5117100091",
-        "kpp": "511701001",
-        "ogrn": "1025100816872",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ОЛЕНЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00557300",
-        "code": "510046",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ОЛЕНЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "ОЦРБ"',
-        "id": 20006799783,
-        "inn": "5108900020",
-        "kpp": "510801001",
-        "ogrn": "1025100676325",
-    },
-    'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ КАЗЕННОЕ УЧРЕЖДЕНИЕ "1469 ВОЕННО-МОРСКОЙ КЛИНИЧЕСКИЙ ГОСПИТАЛЬ" МИНИСТЕРСТВА ОБОРОНЫ РОССИЙСКОЙ ФЕДЕРАЦИИ': {
-        "registry_code": "00305900",
-        "code": "990290",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ КАЗЕННОЕ УЧРЕЖДЕНИЕ "1469 ВОЕННО-МОРСКОЙ КЛИНИЧЕСКИЙ ГОСПИТАЛЬ" МИНИСТЕРСТВА ОБОРОНЫ РОССИЙСКОЙ ФЕДЕРАЦИИ',
-        "short_name": 'ФГКУ "1469 ВМКГ" МИНОБОРОНЫ РОССИИ',
-        "id": 20008181468,
-        "inn": "5110500541",
-        "kpp": "511001001",
-        "ogrn": "1025100713153",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИЦИНСКИЙ ЦЕНТР "БЕЛАЯ РОЗА"': {
-        "registry_code": "00561600",
-        "code": "510456",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИЦИНСКИЙ ЦЕНТР "БЕЛАЯ РОЗА"',
-        "short_name": 'ГОБУЗ "МЦ "БЕЛАЯ РОЗА"',
-        "id": 20047070765,
-        "inn": "5190085707",
-        "kpp": "519001001",
-        "ogrn": "1215100000389",
-    },
-    'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ СГК "ИЗОВЕЛА"': {
-        "registry_code": "00558100",
-        "code": "510069",
-        "name": 'ОБЩЕСТВО С ОГРАНИЧЕННОЙ ОТВЕТСТВЕННОСТЬЮ СГК "ИЗОВЕЛА"',
-        "short_name": 'ООО СГК "ИЗОВЕЛА"',
-        "id": 20521272044,
-        "inn": "5101307220",
-        "kpp": "511801001",
-        "ogrn": "1025100510104",
-    },
-    'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ №120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"': {
-        "registry_code": "00556900",
-        "code": "990249",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ №120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ ЦМСЧ №120 ФМБА РОССИИ",
-        "id": 20521448678,
-        "inn": "5112000128",
-        "kpp": "511201001",
-        "ogrn": "1025100749112",
-    },
-    'Федеральное государственное бюджетное учреждение здравоохранения "Центральная медико-санитарная часть № 120 Федерального медико-биологического агентства"': {
-        "registry_code": "00556900",
-        "code": "990249",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ №120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ ЦМСЧ №120 ФМБА РОССИИ",
-        "id": 20521448678,
-        "inn": "5112000128",
-        "kpp": "511201001",
-        "ogrn": "1025100749112",
-    },
-    "ФМБА ФГБУЗ ЦГ №120 г. Снежногорск": {
-        "registry_code": "00556900",
-        "code": "990249",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ МЕДИКО-САНИТАРНАЯ ЧАСТЬ №120 ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ ЦМСЧ №120 ФМБА РОССИИ",
-        "id": 20521448678,
-        "inn": "5112000128",
-        "kpp": "511201001",
-        "ogrn": "1025100749112",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЛОВОЗЕРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00556200",
-        "code": "510014",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЛОВОЗЕРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "ЛЦРБ"',
-        "id": 20555204512,
-        "inn": "5106050177",
-        "kpp": "510601001",
-        "ogrn": "1025100676710",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ СТАНЦИЯ СКОРОЙ МЕДИЦИНСКОЙ ПОМОЩИ"': {
-        "registry_code": "00560400",
-        "code": "510419",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ СТАНЦИЯ СКОРОЙ МЕДИЦИНСКОЙ ПОМОЩИ"',
-        "short_name": "ГОБУЗ МОССМП",
-        "id": 20623331442,
-        "inn": "5190060773",
-        "kpp": "519001001",
-        "ogrn": "1165190056646",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КОЛЬСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00556100",
-        "code": "510013",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КОЛЬСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "КОЛЬСКАЯ ЦРБ"',
-        "id": 20633329735,
-        "inn": "5105032633",
-        "kpp": "510501001",
-        "ogrn": "1125105001361",
-    },
-    "ГОБУЗ Кольская ЦРБ Мурманская область": {
-        "registry_code": "00556100",
-        "code": "510013",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КОЛЬСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "КОЛЬСКАЯ ЦРБ"',
-        "id": 20633329735,
-        "inn": "5105032633",
-        "kpp": "510501001",
-        "ogrn": "1125105001361",
-    },
-    "ГОБУЗ кольская ЦРБ": {
-        "registry_code": "00556100",
-        "code": "510013",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КОЛЬСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "КОЛЬСКАЯ ЦРБ"',
-        "id": 20633329735,
-        "inn": "5105032633",
-        "kpp": "510501001",
-        "ogrn": "1125105001361",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ ОНКОЛОГИЧЕСКИЙ ДИСПАНСЕР"': {
-        "registry_code": "00556600",
-        "code": "510035",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ ОНКОЛОГИЧЕСКИЙ ДИСПАНСЕР"',
-        "short_name": 'ГОБУЗ "МООД"',
-        "id": 20649626323,
-        "inn": "5191500674",
-        "kpp": "519001001",
-        "ogrn": "1035100156740",
-    },
-    'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ НАУКИ ФЕДЕРАЛЬНЫЙ ИССЛЕДОВАТЕЛЬСКИЙ ЦЕНТР "КОЛЬСКИЙ НАУЧНЫЙ ЦЕНТР РОССИЙСКОЙ АКАДЕМИИ НАУК"': {
-        "registry_code": "00557400",
-        "code": "990248",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ НАУКИ ФЕДЕРАЛЬНЫЙ ИССЛЕДОВАТЕЛЬСКИЙ ЦЕНТР "КОЛЬСКИЙ НАУЧНЫЙ ЦЕНТР РОССИЙСКОЙ АКАДЕМИИ НАУК"',
-        "short_name": "ФИЦ КНЦ РАН",
-        "id": 20677174767,
-        "inn": "5101100280",
-        "kpp": "511801001",
-        "ogrn": "1025100508333",
-    },
-    'ФЕДЕРАЛЬНОЕ КАЗЕННОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ МИНИСТЕРСТВА ВНУТРЕННИХ ДЕЛ РОССИЙСКОЙ ФЕДЕРАЦИИ ПО МУРМАНСКОЙ ОБЛАСТИ"': {
-        "registry_code": "00559900",
-        "code": "510168",
-        "name": 'ФЕДЕРАЛЬНОЕ КАЗЕННОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МЕДИКО-САНИТАРНАЯ ЧАСТЬ МИНИСТЕРСТВА ВНУТРЕННИХ ДЕЛ РОССИЙСКОЙ ФЕДЕРАЦИИ ПО МУРМАНСКОЙ ОБЛАСТИ"',
-        "short_name": 'ФКУЗ "МСЧ МВД РОССИИ ПО МУРМАНСКОЙ ОБЛАСТИ"',
-        "id": 20723290164,
-        "inn": "5190147953",
-        "kpp": "519001001",
-        "ogrn": "1065190052982",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ КЛИНИЧЕСКАЯ БОЛЬНИЦА ИМЕНИ П.А. БАЯНДИНА"': {
-        "registry_code": "00557000",
-        "code": "510041",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ КЛИНИЧЕСКАЯ БОЛЬНИЦА ИМЕНИ П.А. БАЯНДИНА"',
-        "short_name": 'ГОБУЗ "МОКБ ИМ. П.А. БАЯНДИНА"',
-        "id": 20782931414,
-        "inn": "5190800114",
-        "kpp": "519001001",
-        "ogrn": "1025100868440",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ МЕЖРАЙОННАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"': {
-        "registry_code": "01076400",
-        "code": "510006",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ МЕЖРАЙОННАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"',
-        "short_name": 'ГОАУЗ "МОМСП"',
-        "id": 20797322932,
-        "inn": "5108004218",
-        "kpp": "510801001",
-        "ogrn": "1225100003479",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "АПАТИТСКАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"': {
-        "registry_code": "00559400",
-        "code": "510111",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "АПАТИТСКАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"',
-        "short_name": 'ГОАУЗ "АПАТИТСКАЯ СП"',
-        "id": 20797323584,
-        "inn": "5101700706",
-        "kpp": "511801001",
-        "ogrn": "1025100508267",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"': {
-        "registry_code": "00559700",
-        "code": "510121",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ СТОМАТОЛОГИЧЕСКАЯ ПОЛИКЛИНИКА"',
-        "short_name": 'ГОАУЗ "МОСП"',
-        "id": 20799970423,
-        "inn": "5190068500",
-        "kpp": "519001001",
-        "ogrn": "1175190001810",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 2"': {
-        "registry_code": "00559200",
-        "code": "510102",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 2"',
-        "short_name": 'ГОБУЗ "МГП № 2"',
-        "id": 20799971175,
-        "inn": "5190069367",
-        "kpp": "519001001",
-        "ogrn": "1175190003086",
-    },
-    "МУРМАНСКАЯ ГП №2": {
-        "registry_code": "00559200",
-        "code": "510102",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 2"',
-        "short_name": 'ГОБУЗ "МГП № 2"',
-        "id": 20799971175,
-        "inn": "5190069367",
-        "kpp": "519001001",
-        "ogrn": "1175190003086",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 1"': {
-        "registry_code": "00559100",
-        "code": "510101",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 1"',
-        "short_name": 'ГОБУЗ "МГП № 1"',
-        "id": 20799980286,
-        "inn": "5190069335",
-        "kpp": "519001001",
-        "ogrn": "1175190003031",
-    },
-    "Мурманская Городская поликлиника №1": {
-        "registry_code": "00559100",
-        "code": "510101",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ПОЛИКЛИНИКА № 1"',
-        "short_name": 'ГОБУЗ "МГП № 1"',
-        "id": 20799980286,
-        "inn": "5190069335",
-        "kpp": "519001001",
-        "ogrn": "1175190003031",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ ЛЕЧЕБНО-РЕАБИЛИТАЦИОННЫЙ ЦЕНТР"': {
-        "registry_code": "00556700",
-        "code": "510036",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ ЛЕЧЕБНО-РЕАБИЛИТАЦИОННЫЙ ЦЕНТР"',
-        "short_name": 'ГОАУЗ "МОЛРЦ"',
-        "id": 20799980384,
-        "inn": "5190103890",
-        "kpp": "519001001",
-        "ogrn": "1025100871180",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ МЕДИЦИНСКИЙ ЦЕНТР"': {
-        "registry_code": "00557900",
-        "code": "510062",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ ОБЛАСТНОЙ МЕДИЦИНСКИЙ ЦЕНТР"',
-        "short_name": 'ГОАУЗ "МОМЦ"',
-        "id": 20825203414,
-        "inn": "5190046539",
-        "kpp": "519001001",
-        "ogrn": "1155190003760",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ АВТОНОМНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МОНЧЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00557200",
-        "code": "510045",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МОНЧЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": "ГОБУЗ МЦРБ",
-        "id": 20868793918,
-        "inn": "5107914486",
-        "kpp": "510701001",
-        "ogrn": "1135107000082",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МОНЧЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00557200",
-        "code": "510045",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МОНЧЕГОРСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": "ГОБУЗ МЦРБ",
-        "id": 20868793918,
-        "inn": "5107914486",
-        "kpp": "510701001",
-        "ogrn": "1135107000082",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА ЗАТО Г.СЕВЕРОМОРСК"': {
-        "registry_code": "00555800",
-        "code": "510008",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА ЗАТО Г.СЕВЕРОМОРСК"',
-        "short_name": 'ГОБУЗ "ЦРБ ЗАТО Г.СЕВЕРОМОРСК"',
-        "id": 20889975916,
-        "inn": "5110100984",
-        "kpp": "511001001",
-        "ogrn": "1025100711350",
-    },
-    'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ МНОГОПРОФИЛЬНЫЙ ЦЕНТР ИМЕНИ Н.И. ПИРОГОВА ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"': {
-        "registry_code": "00556400",
-        "code": "990191",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ МНОГОПРОФИЛЬНЫЙ ЦЕНТР ИМЕНИ Н.И. ПИРОГОВА ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ ММЦ ИМ. Н.И. ПИРОГОВА ФМБА РОССИИ",
-        "id": 20891515158,
-        "inn": "5190053159",
-        "kpp": "519001001",
-        "ogrn": "1157746943661",
-    },
-    'Федеральное государственное бюджетное учреждение здравоохранения "Мурманский многопрофильный центр имени Н.И. Пирогова Федерального медико-биологического агентства"': {
-"       registry_code": "00556400",
-        "code": "990191",
-        "name": 'ФЕДЕРАЛЬНОЕ ГОСУДАРСТВЕННОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКИЙ МНОГОПРОФИЛЬНЫЙ ЦЕНТР ИМЕНИ Н.И. ПИРОГОВА ФЕДЕРАЛЬНОГО МЕДИКО-БИОЛОГИЧЕСКОГО АГЕНТСТВА"',
-        "short_name": "ФГБУЗ ММЦ ИМ. Н.И. ПИРОГОВА ФМБА РОССИИ",
-        "id": 20891515158,
-        "inn": "5190053159",
-        "kpp": "519001001",
-        "ogrn": "1157746943661",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 5"': {
-        "registry_code": "00559800",
-        "code": "510152",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 5"',
-        "short_name": 'ГОБУЗ "МГДП № 5"',
-        "id": 20910241748,
-        "inn": "5190306427",
-        "kpp": "519001001",
-        "ogrn": "1025100853348",
-    },
-    "ГОБУЗ МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 5": {
-        "registry_code": "00559800",
-        "code": "510152",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 5"',
-        "short_name": 'ГОБУЗ "МГДП № 5"',
-        "id": 20910241748,
-        "inn": "5190306427",
-        "kpp": "519001001",
-        "ogrn": "1025100853348",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КАНДАЛАКШСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00555900",
-        "code": "510009",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КАНДАЛАКШСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "КАНДАЛАКШСКАЯ ЦРБ"',
-        "id": 20910242843,
-        "inn": "5102007438",
-        "kpp": "510201001",
-        "ogrn": "1145102000372",
-    },
-    'Государственное областное бюджетное учреждение здравоохранения "Кандалакшская центральная районная больница"': {
-        "registry_code": "00555900",
-        "code": "510009",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "КАНДАЛАКШСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "КАНДАЛАКШСКАЯ ЦРБ"',
-        "id": 20910242843,
-        "inn": "5102007438",
-        "kpp": "510201001",
-        "ogrn": "1145102000372",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 1"': {
-        "registry_code": "00559000",
-        "code": "510098",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 1"',
-        "short_name": 'ГОБУЗ "МГДП № 1"',
-        "id": 20910243000,
-        "inn": "5190024856",
-        "kpp": "519001001",
-        "ogrn": "1135190010427",
-    },
-    "МГДП № 1 г МУРМАНСК": {
-        "registry_code": "00559000",
-        "code": "510098",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 1"',
-        "short_name": 'ГОБУЗ "МГДП № 1"',
-        "id": 20910243000,
-        "inn": "5190024856",
-        "kpp": "519001001",
-        "ogrn": "1135190010427",
-    },
-    "ГО БУЗ МУРМАНСКАЯ ГДП 1": {
-        "registry_code": "00559000",
-        "code": "510098",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 1"',
-        "short_name": 'ГОБУЗ "МГДП № 1"',
-        "id": 20910243000,
-        "inn": "5190024856",
-        "kpp": "519001001",
-        "ogrn": "1135190010427",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 4"': {
-        "registry_code": "00559300",
-        "code": "510109",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ГОРОДСКАЯ ДЕТСКАЯ ПОЛИКЛИНИКА № 4"',
-        "short_name": "ГОБУЗ МГДП № 4",
-        "id": 20910243937,
-        "inn": "5190404008",
-        "kpp": "519001001",
-        "ogrn": "1025100865184",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ ДЕТСКАЯ КЛИНИЧЕСКАЯ БОЛЬНИЦА"': {
-        "registry_code": "00556500",
-        "code": "510033",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ ДЕТСКАЯ КЛИНИЧЕСКАЯ БОЛЬНИЦА"',
-        "short_name": "ГОБУЗ МОДКБ",
-        "id": 21004118220,
-        "inn": "5192150013",
-        "kpp": "519001001",
-        "ogrn": "1025100861433",
-    },
-    'ГОБУЗ " Мурманская областная детская клиническая больница"': {
-        "registry_code": "00556500",
-        "code": "510033",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "МУРМАНСКАЯ ОБЛАСТНАЯ ДЕТСКАЯ КЛИНИЧЕСКАЯ БОЛЬНИЦА"',
-        "short_name": "ГОБУЗ МОДКБ",
-        "id": 21004118220,
-        "inn": "5192150013",
-        "kpp": "519001001",
-        "ogrn": "1025100861433",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "АПАТИТСКО-КИРОВСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00555700",
-        "code": "510007",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "АПАТИТСКО-КИРОВСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "АПАТИТСКО-КИРОВСКАЯ ЦРБ"',
-        "id": 21042501671,
-        "inn": "5118000861",
-        "kpp": "511801001",
-        "ogrn": "1125118000864",
-    },
-    'Государственное областное бюджетное учреждение здравоохранения "Апатитско-Кировская центральная городская больница"': {
-        "registry_code": "00555700",
-        "code": "510007",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "АПАТИТСКО-КИРОВСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "АПАТИТСКО-КИРОВСКАЯ ЦРБ"',
-        "id": 21042501671,
-        "inn": "5118000861",
-        "kpp": "511801001",
-        "ogrn": "1125118000864",
-    },
-    'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ПЕЧЕНГСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"': {
-        "registry_code": "00556000",
-        "code": "510010",
-        "name": 'ГОСУДАРСТВЕННОЕ ОБЛАСТНОЕ БЮДЖЕТНОЕ УЧРЕЖДЕНИЕ ЗДРАВООХРАНЕНИЯ "ПЕЧЕНГСКАЯ ЦЕНТРАЛЬНАЯ РАЙОННАЯ БОЛЬНИЦА"',
-        "short_name": 'ГОБУЗ "ПЕЧЕНГСКАЯ ЦРБ"',
-        "id": 21042502809,
-        "inn": "5109800090",
-        "kpp": "510901001",
-        "ogrn": "1025100688250",
-    },
-}
@@ -1,7 +1,20 @@
-from .extension import ExtensionStartedData, EnrichmentRequestData
+from .extension import (
+    ExtensionStartedData,
+    EnrichmentRequestData,
+    SearchEnrichRequestData,
+    BatchSearchRequestData,
+    SubmissionData,
+    KsgCaseData,
+    KsgBatchRequestData,
+)
 
 
 __all__ = [
     "ExtensionStartedData",
-    "EnrichmentRequestData"
+    "EnrichmentRequestData",
+    "SearchEnrichRequestData",
+    "BatchSearchRequestData",
+    "SubmissionData",
+    "KsgCaseData",
+    "KsgBatchRequestData",
 ]
\ No newline at end of file
@@ -1,37 +1,121 @@
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List, Literal
 
 from pydantic import BaseModel, Field, constr, model_validator
 
 
+def _format_date_range(data: dict) -> dict:
+    """Собирает dis_date_range в формате ЕВМИАС из start_date и end_date (YYYY-MM-DD)."""
+    start_date = data.get("start_date")
+    end_date = data.get("end_date")
+
+    if start_date and end_date:
+        try:
+            start = datetime.strptime(start_date, "%Y-%m-%d")
+            end = datetime.strptime(end_date, "%Y-%m-%d")
+
+            if start > end:
+                raise ValueError("Дата начала не может быть позже даты окончания")
+
+            data["dis_date_range"] = f"{start.strftime('%d.%m.%Y')} - {end.strftime('%d.%m.%Y')}"
+        except ValueError as e:
+            raise ValueError(f"Ошибка в диапазоне дат: {e}")
+
+    return data
+
+
 class ExtensionStartedData(BaseModel):
     """Модель для стартовых данных"""
     last_name: str = Field(..., description="Фамилия пациента", examples=["АЛЕЙНИКОВ"])
     start_date: Optional[str] = Field(None, description="Дата начала периода в формате YYYY-MM-DD", examples=[""])
     end_date: Optional[str] = Field(None, description="Дата окончания периода в формате YYYY-MM-DD", examples=[""])
     dis_date_range: Optional[str] = Field(None, description="Диапазон дат госпитализации", examples=[""])
+    first_name: Optional[str] = Field(None, description="Имя пациента или его начало", examples=[""])
+    birthday: Optional[date] = Field(None, description="Дата рождения в формате YYYY-MM-DD", examples=[""])
+    fresh: bool = Field(False, description="Искать сразу в ЕВМИАС, минуя локальный индекс и кэш поиска")
 
     @model_validator(mode="before") # noqa
     @classmethod
     def validate_and_format_date_range(cls, data: dict) -> dict:
-        start_date = data.get("start_date")
-        end_date = data.get("end_date")
+        if data.get("birthday") == "":
+            data["birthday"] = None
+        return _format_date_range(data)
 
-        if start_date and end_date:
-            try:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d")
 
-                if start > end:
-                    raise ValueError("Дата начала не может быть позже даты окончания")
+class EnrichmentRequestData(BaseModel):
+    """Модель данных для получения данных от фронтенда"""
+    started_data: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Оригинальные данные о событии/пациенте из ЕВМИАС. Не нужны, если передан handle",
+    )
+    handle: Optional[str] = Field(
+        None,
+        description="Дескриптор строки из результатов поиска (ключ 'handle'), вместо started_data",
+        max_length=64,
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Какие поля вычислить: ключи ответа, короткие имена полей формы или имена групп "
+                    "(patient, dates, department, diagnoses, services, discharge_summary). По умолчанию - все",
+        examples=[["department", "IshodV012"]],
+    )
 
-                data["dis_date_range"] = f"{start.strftime('%d.%m.%Y')} - {end.strftime('%d.%m.%Y')}"
-            except ValueError as e:
-                raise ValueError(f"Ошибка в диапазоне дат: {e}")
+    @model_validator(mode="after")
+    def validate_source(self) -> "EnrichmentRequestData":
+        if self.started_data is None and not self.handle:
+            raise ValueError("Нужно передать started_data или handle")
+        return self
 
-        return data
 
+class SearchEnrichRequestData(ExtensionStartedData):
+    """Модель для поиска с обогащением найденной госпитализации в одном запросе"""
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Какие поля вычислить при обогащении (как в EnrichmentRequestData). По умолчанию - все",
+    )
 
-class EnrichmentRequestData(BaseModel):
-    """Модель данных для получения данных от фронтенда"""
-    started_data: Dict[str, Any] = Field(..., description="Оригинальные данные о событии/пациенте из ЕВМИАС")
+
+class BatchSearchRequestData(BaseModel):
+    """Модель для поиска по списку фамилий (например, по дневному списку выписки)"""
+    last_names: List[str] = Field(
+        ..., min_length=1, max_length=100, description="Фамилии пациентов", examples=[["АЛЕЙНИКОВ", "ИВАНОВ"]]
+    )
+    start_date: Optional[str] = Field(None, description="Дата начала периода в формате YYYY-MM-DD", examples=[""])
+    end_date: Optional[str] = Field(None, description="Дата окончания периода в формате YYYY-MM-DD", examples=[""])
+    dis_date_range: Optional[str] = Field(None, description="Диапазон дат госпитализации", examples=[""])
+    fresh: bool = Field(False, description="Искать сразу в ЕВМИАС, минуя локальный индекс и кэш поиска")
+
+    @model_validator(mode="before") # noqa
+    @classmethod
+    def validate_and_format_date_range(cls, data: dict) -> dict:
+        return _format_date_range(data)
+
+
+class SubmissionData(BaseModel):
+    """Модель отметки о заполнении формы для госпитализации"""
+    event_id: str = Field(..., min_length=1, max_length=32, description="EvnPS_id госпитализации",
+                          examples=["3010101234567890"])
+    status: Literal["filled", "failed"] = Field(
+        "filled", description="filled - форма заполнена расширением, failed - заполнение не удалось"
+    )
+
+
+class KsgCaseData(BaseModel):
+    """Модель случая для группировки по КСГ"""
+    case_id: Optional[str] = Field(None, max_length=64, description="Идентификатор случая, возвращается в ответе",
+                                   examples=["3010101234567890"])
+    diagnosis: str = Field(..., min_length=1, max_length=16, description="Код основного диагноза по МКБ-10",
+                           examples=["K80.1"])
+    services: List[str] = Field(
+        [], max_length=100, description="Коды услуг (операций) из medical_service_data", examples=[["A16.14.009"]]
+    )
+    bed_days: int = Field(..., ge=0, le=100_000, description="Число койко-дней (дней лечения)", examples=[7])
+    age: int = Field(..., ge=0, le=150, description="Возраст пациента (полных лет)", examples=[54])
+    medical_care_conditions: Literal["1", "2"] = Field(
+        "1", description="Условия оказания помощи: 1 - стационар, 2 - дневной стационар"
+    )
+
+
+class KsgBatchRequestData(BaseModel):
+    """Модель пакета случаев для группировки по КСГ (например, за месяц)"""
+    cases: List[KsgCaseData] = Field(..., min_length=1, max_length=100_000, description="Случаи")
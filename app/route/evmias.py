@@ -5,7 +5,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 
 from app.core import get_settings, HTTPXClient, get_http_service
 from app.core.decorators import route_handler
@@ -18,6 +18,7 @@ from app.service import (
     fetch_operations_data,
     fetch_additional_diagnosis,
     fetch_patient_discharge_summary,
+    fetch_evmias_directory,
 )
 
 settings = get_settings()
@@ -117,11 +118,13 @@ async def medical_records_by_event_id(
         cookies: Annotated[dict[str, str], Depends(set_cookies)],
         http_service: Annotated[HTTPXClient, Depends(get_http_service)],
         event_id: str = Path(..., description="id события"),
+        include_raw: bool = Query(False, description="Добавить в ответ исходный ответ ЕВМИАС (ключ raw)"),
 ):
     return await fetch_patient_discharge_summary(
         cookies=cookies,
         http_service=http_service,
-        event_id=event_id
+        event_id=event_id,
+        include_raw=include_raw,
     )
 
 
@@ -134,32 +137,9 @@ async def result_disease(
         cookies: Annotated[dict[str, str], Depends(set_cookies)],
         http_service: Annotated[HTTPXClient, Depends(get_http_service)],
 ):
-    url = settings.BASE_URL
-    headers = HEADERS
-
-    params = {
-        "c": "MongoDBWork",
-        "m": "getData",
-        "object": "ResultDesease",
-    }
-
-    data = {
-        "ResultDesease_id": "",
-        "ResultDesease_Code": "",
-        "ResultDesease_Name": "",
-        "object": "ResultDesease",
-    }
-
-    response = await http_service.fetch(
-        url=url,
-        method="POST",
-        cookies=cookies,
-        headers=headers,
-        params=params,
-        data=data,
+    response_json = await fetch_evmias_directory(
+        cookies, http_service, "ResultDesease", ["ResultDesease_id", "ResultDesease_Code", "ResultDesease_Name"]
     )
-
-    response_json = response.get("json", {})
     result = {}
     for item in response_json:
         id_ = item["ResultDesease_id"]
@@ -1,14 +1,56 @@
-from typing import List, Dict, Any, Annotated
+import os
+from datetime import date
+from typing import List, Dict, Any, Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Header, Request
+from fastapi.responses import StreamingResponse, JSONResponse
 
-from app.core import get_settings, HTTPXClient, get_http_service, logger
+from app.core import (
+    get_settings,
+    HTTPXClient,
+    get_http_service,
+    get_redis_client,
+    run_until_disconnect,
+    get_offload_metrics,
+    offload_cpu,
+    logger,
+)
 from app.core.decorators import route_handler
-from app.model import ExtensionStartedData, EnrichmentRequestData
+from app.model import (
+    ExtensionStartedData,
+    EnrichmentRequestData,
+    SearchEnrichRequestData,
+    BatchSearchRequestData,
+    SubmissionData,
+    KsgCaseData,
+    KsgBatchRequestData,
+)
 from app.service import (
     set_cookies,
     fetch_started_data,
-    enrich_data,
+    paginate_started_data,
+    stream_started_data,
+    enrich_data_with_failures,
+    stream_enriched_data,
+    enrich_data_within_budget,
+    get_pending_enrichment,
+    load_prepared_enrichment,
+    enrichment_idempotency_key,
+    run_idempotent,
+    slim_search_rows,
+    resolve_enrichment_request,
+    search_and_enrich,
+    stream_search_batch,
+    build_patient_timeline,
+    record_submission,
+    load_submission,
+    get_worklist,
+    get_worker_reference_versions,
+    get_sync_report,
+    get_ksg_tables,
+    group_case,
+    group_cases,
 )
 
 settings = get_settings()
@@ -17,29 +59,128 @@ router = APIRouter(prefix="/extension", tags=["Расширение"])
 
 SEARCH_PERIOD_START_DATE = settings.SEARCH_PERIOD_START_DATE
 
+# Примерный размер одного случая в теле запроса группировки (байты) - для выбора выполнения в пуле
+KSG_CASE_SIZE = 128
+
 
 @route_handler(debug=settings.DEBUG_ROUTE)
 @router.post(
     path="/search",
     summary="Получить список пациентов по фильтру",
-    description="Получить список пациентов по фильтру",
+    description="Получить список пациентов по фильтру. С параметром limit ответ разбивается на страницы: "
+                "{items, next_cursor, total}, следующая страница запрашивается с cursor=next_cursor",
 )
 async def search_patients_hospitals(
+        request: Request,
         patient: ExtensionStartedData,
         cookies: Annotated[dict[str, str], Depends(set_cookies)],
-        http_service: Annotated[HTTPXClient, Depends(get_http_service)]
-) -> List[Dict[str, Any]]:
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        limit: Optional[int] = Query(None, ge=1, le=500, description="Размер страницы. Без него - весь список"),
+        cursor: Optional[str] = Query(None, pattern=r"^\d+$", description="Курсор страницы из next_cursor"),
+        full_rows: bool = Query(False, description="Вернуть полные строки ЕВМИАС вместо сокращённых с handle"),
+) -> List[Dict[str, Any]] | Dict[str, Any]:
     """
     Получить список госпитализаций пациентов по фильтру
     """
     logger.info("Запрос на поиск пациентов")
-    result = await fetch_started_data(patient=patient, cookies=cookies, http_service=http_service)
+    result = await run_until_disconnect(request, fetch_started_data(
+        patient=patient, cookies=cookies, http_service=http_service, redis_client=redis_client
+    ))
 
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Данные не найдены"
         )
+    if limit is not None:
+        page = paginate_started_data(result, limit, cursor)
+        if not full_rows:
+            page["items"] = await slim_search_rows(redis_client, page["items"])
+        return page
+    return result if full_rows else await slim_search_rows(redis_client, result)
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/search/stream",
+    summary="Получить список пациентов по фильтру (потоково, NDJSON)",
+    description="Отдаёт госпитализации по одной на строку (NDJSON) по мере получения из ЕВМИАС, "
+                "от новых выписок к старым. При ошибке последней строкой приходит {\"error\": \"...\"}",
+    response_class=StreamingResponse,
+)
+async def stream_search_patients_hospitals(
+        patient: ExtensionStartedData,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        full_rows: bool = Query(False, description="Отдавать полные строки ЕВМИАС вместо сокращённых с handle"),
+) -> StreamingResponse:
+    """
+    Получить список госпитализаций пациентов по фильтру, отдавая строки по мере получения
+    """
+    logger.info("Запрос на потоковый поиск пациентов")
+    return StreamingResponse(
+        stream_started_data(patient, cookies, http_service, redis_client, slim=not full_rows),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/search-batch",
+    summary="Найти госпитализации по списку фамилий (потоково, NDJSON)",
+    description="Ищет каждую фамилию из списка за один диапазон дат и отдаёт результаты строками NDJSON "
+                "по мере готовности: {\"last_name\": ..., \"rows\": [...]} или {\"last_name\": ..., \"error\": ...}",
+    response_class=StreamingResponse,
+)
+async def search_batch_patients_hospitals(
+        batch: BatchSearchRequestData,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        full_rows: bool = Query(False, description="Отдавать полные строки ЕВМИАС вместо сокращённых с handle"),
+) -> StreamingResponse:
+    """
+    Найти госпитализации по списку фамилий
+    """
+    return StreamingResponse(
+        stream_search_batch(batch, cookies, http_service, redis_client, slim=not full_rows),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/search-enrich",
+    summary="Найти госпитализацию и сразу обогатить данные",
+    description="Выполняет поиск и, если найдена одна госпитализация, обогащает её в том же запросе. "
+                "Если найдено несколько, возвращает список, а обогащение самой свежей запускает заранее "
+                "(её handle - в speculative_handle)",
+    response_model=Dict[str, Any],
+)
+async def search_and_enrich_for_front(
+        request: Request,
+        search_request: SearchEnrichRequestData,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+) -> Dict[str, Any]:
+    """
+    Найти госпитализацию и сразу обогатить данные
+    """
+    logger.info("Запрос на поиск с обогащением")
+    result = await run_until_disconnect(
+        request, search_and_enrich(search_request, cookies, http_service, redis_client)
+    )
+
+    if not result["rows"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Данные не найдены"
+        )
     return result
 
 
@@ -51,14 +192,41 @@ async def search_patients_hospitals(
     response_model=Dict[str, Any]
 )
 async def enrich_started_data_for_front(
+        request: Request,
         enrich_request: EnrichmentRequestData,
         cookies: Annotated[dict[str, str], Depends(set_cookies)],
-        http_service: Annotated[HTTPXClient, Depends(get_http_service)]
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        budget_ms: Optional[int] = Query(
+            None,
+            ge=1,
+            description="Бюджет времени ответа в мс. Не готовые к этому сроку поля отдаются "
+                        "по токену продолжения из ключа 'pending' через GET /extension/enrich-data/{token}",
+        ),
+        idempotency_key: Optional[str] = Header(
+            None,
+            alias="Idempotency-Key",
+            description="Ключ идемпотентности. Повторы определяются по нему вместе с EvnPS_id и содержимым "
+                        "запроса, без него - только по EvnPS_id и содержимому",
+        ),
 ) -> Dict[str, Any]:
     """
     Обогатить данные для фронта
     """
-    result = await enrich_data(enrich_request, cookies, http_service)
+    enrich_request = await resolve_enrichment_request(redis_client, enrich_request)
+    prepared = await load_prepared_enrichment(redis_client, enrich_request)
+    if prepared:
+        return prepared
+
+    if budget_ms is not None:
+        work = enrich_data_within_budget(enrich_request, cookies, http_service, redis_client, budget_ms)
+    else:
+        work = run_idempotent(
+            redis_client,
+            enrichment_idempotency_key(enrich_request, idempotency_key),
+            lambda: enrich_data_with_failures(enrich_request, cookies, http_service),
+        )
+    result = await run_until_disconnect(request, work)
 
     if not result:
         raise HTTPException(
@@ -66,3 +234,266 @@ async def enrich_started_data_for_front(
             detail="Не удалось обогатить данные"
         )
     return result
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/enrich-data/stream",
+    summary="Обогатить данные для фронта (потоково, SSE)",
+    description="Отдаёт события Server-Sent Events по группам полей по мере их готовности: "
+                "patient, dates, department, diagnoses, services, discharge_summary, затем done",
+    response_class=StreamingResponse,
+)
+async def stream_enriched_data_for_front(
+        enrich_request: EnrichmentRequestData,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+) -> StreamingResponse:
+    """
+    Обогатить данные для фронта, отдавая группы полей по мере готовности
+    """
+    enrich_request = await resolve_enrichment_request(redis_client, enrich_request)
+    return StreamingResponse(
+        stream_enriched_data(enrich_request, cookies, http_service),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/enrich-data/{token}",
+    summary="Получить поля, отложенные при обогащении с бюджетом времени",
+    description="Возвращает оставшиеся поля по токену продолжения. "
+                "Если поля ещё не готовы по истечении ожидания - статус 202 и список ожидаемых групп",
+    response_model=Dict[str, Any],
+)
+async def get_pending_enriched_data(
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        token: str = Path(..., description="Токен продолжения", pattern=r"^[0-9a-f]{32}$"),
+) -> Dict[str, Any] | JSONResponse:
+    """
+    Получить поля, отложенные при обогащении с бюджетом времени
+    """
+    state = await get_pending_enrichment(redis_client, token)
+
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Токен продолжения не найден или истёк"
+        )
+    if state.get("status") == "pending":
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=state)
+    if state.get("status") != "ready":
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Не удалось дозагрузить данные"
+        )
+    return state["data"]
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/patient/{person_id}/timeline",
+    summary="Хронология госпитализаций пациента",
+    description="Все госпитализации пациента за период (от ранних к поздним) с полями с кодами: "
+                "даты, отделение, профиль койки, диагноз, результат и исход",
+    response_model=Dict[str, Any],
+)
+async def get_patient_timeline(
+        request: Request,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        person_id: str = Path(..., description="Person_id пациента в ЕВМИАС", max_length=32),
+        start_date: Optional[date] = Query(None, description="Дата начала периода выписки"),
+        end_date: Optional[date] = Query(None, description="Дата окончания периода выписки"),
+) -> Dict[str, Any]:
+    """
+    Хронология госпитализаций пациента
+    """
+    dis_date_range = None
+    if start_date and end_date:
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Дата начала не может быть позже даты окончания"
+            )
+        dis_date_range = f"{start_date.strftime('%d.%m.%Y')} - {end_date.strftime('%d.%m.%Y')}"
+
+    result = await run_until_disconnect(
+        request, build_patient_timeline(person_id, cookies, http_service, redis_client, dis_date_range)
+    )
+
+    if not result or not result["stays"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Госпитализации пациента не найдены"
+        )
+    return result
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/submissions",
+    summary="Отметить заполнение формы для госпитализации",
+    description="Расширение сообщает, что форма для госпитализации заполнена (или заполнить её не удалось). "
+                "Заполненные госпитализации исключаются из рабочего списка",
+    response_model=Dict[str, Any],
+)
+async def post_submission(
+        submission: SubmissionData,
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+) -> Dict[str, Any]:
+    """
+    Отметка о заполнении формы
+    """
+    return await record_submission(redis_client, submission.event_id, submission.status)
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/submissions/{event_id}",
+    summary="Отметка о заполнении формы для госпитализации",
+    response_model=Dict[str, Any],
+)
+async def get_submission(
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+        event_id: str = Path(..., description="EvnPS_id госпитализации", max_length=32),
+) -> Dict[str, Any]:
+    """
+    Отметка о заполнении формы
+    """
+    submission = await load_submission(redis_client, event_id)
+    if submission is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Отметки о заполнении формы для госпитализации нет"
+        )
+    return submission
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/worklist",
+    summary="Рабочий список незаполненных выписок",
+    description="Госпитализации, выписанные за последние WORKLIST_WINDOW_DAYS дней, для которых форма ещё "
+                "не заполнена (от новых выписок к старым). Строки сокращённые, для обогащения передаётся handle",
+    response_model=Dict[str, Any],
+)
+async def get_discharge_worklist(
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+) -> Dict[str, Any]:
+    """
+    Рабочий список незаполненных выписок
+    """
+    worklist = await get_worklist(http_service, redis_client)
+    if worklist is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Рабочий список формируется, повторите запрос позже"
+        )
+    return worklist
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/metrics/offload",
+    summary="Статистика выноса CPU-работы из цикла событий",
+    description="Сколько задач разбора выполнено сразу (inline), в пуле потоков и в пуле процессов, "
+                "среднее и максимальное время. Данные одного воркера (pid в ответе)",
+    response_model=Dict[str, Any],
+)
+async def offload_metrics() -> Dict[str, Any]:
+    """
+    Статистика выноса CPU-работы
+    """
+    return {"pid": os.getpid(), **get_offload_metrics()}
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/reference/versions",
+    summary="Версии загруженных справочников",
+    description="Версии справочников (профили коек, исходы, профили медпомощи, медицинские организации, "
+                "правила сопоставления), загруженных каждым воркером. current_pid - воркер, ответивший на запрос",
+    response_model=Dict[str, Any],
+)
+async def reference_versions(
+        redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+) -> Dict[str, Any]:
+    """
+    Версии справочников по воркерам
+    """
+    return await get_worker_reference_versions(redis_client)
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.get(
+    path="/reference/sync",
+    summary="Синхронизация справочников с ЕВМИАС",
+    description="Время последней загрузки справочников из ЕВМИАС и расхождения с нашими: new - id без "
+                "сопоставления (используется код ЕВМИАС), changed - другой код в ЕВМИАС, missing - id, "
+                "которых нет в ЕВМИАС. Данные одного воркера (pid в ответе)",
+    response_model=Dict[str, Any],
+)
+async def reference_sync_report() -> Dict[str, Any]:
+    """
+    Отчёт о синхронизации справочников с ЕВМИАС
+    """
+    return get_sync_report()
+
+
+def _require_ksg_tables() -> Dict[str, Any]:
+    tables = get_ksg_tables()
+    if tables is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Таблицы КСГ за {settings.KSG_YEAR} год не загружены"
+        )
+    return tables
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/ksg",
+    summary="КСГ и стоимость случая",
+    description="Группирует случай по основному диагнозу, кодам услуг, числу койко-дней, возрасту и условиям "
+                "оказания помощи по таблицам КСГ года KSG_YEAR и рассчитывает стоимость",
+    response_model=Dict[str, Any],
+)
+async def ksg_case(case: KsgCaseData) -> Dict[str, Any]:
+    """
+    Группировка одного случая по КСГ
+    """
+    tables = _require_ksg_tables()
+    result = group_case(
+        tables, case.diagnosis, case.services, case.bed_days, case.age, case.medical_care_conditions
+    )
+    return {"year": tables["year"], "version": tables["version"], "case_id": case.case_id, **result}
+
+
+@route_handler(debug=settings.DEBUG_ROUTE)
+@router.post(
+    path="/ksg/batch",
+    summary="КСГ и стоимость пакета случаев",
+    description="Группирует пакет случаев (до 100 000, например за месяц) по таблицам КСГ года KSG_YEAR. "
+                "Результаты - в порядке случаев в запросе, с их case_id. Случай без подходящей группы - ksg: null",
+    response_model=Dict[str, Any],
+)
+async def ksg_batch(batch: KsgBatchRequestData) -> Dict[str, Any]:
+    """
+    Группировка пакета случаев по КСГ
+    """
+    tables = _require_ksg_tables()
+    cases = [case.model_dump() for case in batch.cases]
+    results = await offload_cpu(group_cases, tables, cases, size=len(cases) * KSG_CASE_SIZE)
+    return {
+        "year": tables["year"],
+        "version": tables["version"],
+        "total_cost": round(sum(result["cost"] or 0 for result in results), 2),
+        "ungrouped": sum(result["ksg"] is None for result in results),
+        "results": results,
+    }
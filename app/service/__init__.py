@@ -14,8 +14,34 @@ from .evmias.request import (
     fetch_operations_data,
     fetch_additional_diagnosis,
     fetch_patient_discharge_summary,
+    fetch_evmias_directory,
 )
-from .extension.enrich import enrich_data
+from .reference.icd import compile_icd_rules, icd_range_codes, match_icd
+from .reference.medical_orgs import find_medical_org, normalize_org_name
+from .reference.mapping_rules import compile_mapping_rules, resolve_department
+from .reference.store import (
+    get_reference,
+    get_reference_index,
+    register_reference_index,
+    reload_reference_data,
+    get_reference_versions,
+    get_worker_reference_versions,
+    start_reference_watch,
+    stop_reference_watch,
+)
+from .reference.evmias_sync import (
+    get_synced_reference,
+    get_sync_report,
+    sync_evmias_directories,
+    start_reference_sync,
+    stop_reference_sync,
+)
+from .reference.ksg import compile_ksg_tables, get_ksg_tables, group_case, group_cases
+from .extension.enrich import enrich_data, enrich_data_with_failures, stream_enriched_data
+from .extension.batch_mapper import map_cases_columnar
+from .extension.handles import slim_search_rows, resolve_enrichment_request
+from .extension.idempotency import enrichment_idempotency_key, run_idempotent
+from .extension.partial import enrich_data_within_budget, get_pending_enrichment
 from .extension.helpers import (
     get_referred_organization,
     get_medical_care_condition,
@@ -23,13 +49,37 @@ from .extension.helpers import (
     get_medical_care_form,
     get_bed_profile_code,
     get_outcome_code,
+    get_corrected_outcome_code,
     get_disease_type_code,
     get_department_name,
     get_department_code,
     get_medical_care_profile,
     get_valid_additional_diagnosis,
 )
-from .extension.started import fetch_started_data
+from .extension.started import (
+    fetch_started_data,
+    search_hospitalizations,
+    paginate_started_data,
+    stream_started_data,
+)
+from .extension.search_enrich import search_and_enrich
+from .extension.search_batch import stream_search_batch
+from .extension.timeline import build_patient_timeline
+from .extension.search_sync import sync_search_index, start_search_index_sync, stop_search_index_sync
+from .extension.worklist import (
+    record_submission,
+    load_submission,
+    get_worklist,
+    refresh_worklist,
+    start_worklist_refresh,
+    stop_worklist_refresh,
+)
+from .extension.precompute import (
+    load_prepared_enrichment,
+    run_precompute,
+    start_precompute_scheduler,
+    stop_precompute_scheduler,
+)
 
 __all__ = [
     "sanitize_medical_service_entry",
@@ -42,6 +92,7 @@ __all__ = [
     "get_medical_care_form",
     "get_bed_profile_code",
     "get_outcome_code",
+    "get_corrected_outcome_code",
     "get_disease_type_code",
     "get_department_name",
     "get_department_code",
@@ -52,9 +103,62 @@ __all__ = [
     "fetch_referral_data",
     "fetch_disease_data",
     "fetch_referred_org_by_id",
+    "find_medical_org",
+    "normalize_org_name",
+    "compile_icd_rules",
+    "icd_range_codes",
+    "match_icd",
+    "get_reference",
+    "get_reference_index",
+    "register_reference_index",
+    "reload_reference_data",
+    "get_reference_versions",
+    "get_worker_reference_versions",
+    "start_reference_watch",
+    "stop_reference_watch",
+    "get_synced_reference",
+    "get_sync_report",
+    "sync_evmias_directories",
+    "start_reference_sync",
+    "stop_reference_sync",
+    "compile_mapping_rules",
+    "resolve_department",
+    "compile_ksg_tables",
+    "get_ksg_tables",
+    "group_case",
+    "group_cases",
     "fetch_started_data",
+    "search_hospitalizations",
+    "paginate_started_data",
+    "stream_started_data",
     "fetch_operations_data",
     "fetch_additional_diagnosis",
     "fetch_patient_discharge_summary",
+    "fetch_evmias_directory",
     "enrich_data",
+    "enrich_data_with_failures",
+    "stream_enriched_data",
+    "map_cases_columnar",
+    "enrich_data_within_budget",
+    "slim_search_rows",
+    "resolve_enrichment_request",
+    "enrichment_idempotency_key",
+    "run_idempotent",
+    "get_pending_enrichment",
+    "load_prepared_enrichment",
+    "run_precompute",
+    "start_precompute_scheduler",
+    "stop_precompute_scheduler",
+    "search_and_enrich",
+    "stream_search_batch",
+    "build_patient_timeline",
+    "sync_search_index",
+    "start_search_index_sync",
+    "stop_search_index_sync",
+    "record_submission",
+    "load_submission",
+    "get_worklist",
+    "refresh_worklist",
+    "start_worklist_refresh",
+    "stop_worklist_refresh",
 ]
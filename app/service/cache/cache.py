@@ -0,0 +1,39 @@
+"""
+Вспомогательные функции для хранения JSON-значений в Redis.
+Кэш необязателен для работы сервиса, поэтому ошибки Redis логируются и не пробрасываются.
+"""
+import json
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core import logger
+
+
+async def load_json(redis_client: redis.Redis, key: str) -> Any | None:
+    """Загружает и декодирует JSON-значение по ключу. Возвращает None, если ключа нет или он невалиден."""
+    try:
+        raw_value = await redis_client.get(key)
+    except RedisError as e:
+        logger.error(f"Ошибка Redis при чтении ключа '{key}': {e}")
+        return None
+
+    if raw_value is None:
+        return None
+
+    try:
+        return json.loads(raw_value)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        logger.error(f"Невалидный JSON в Redis (ключ: '{key}'): {e}")
+        return None
+
+
+async def save_json(redis_client: redis.Redis, key: str, value: Any, ttl: int) -> bool:
+    """Сохраняет значение в виде JSON с временем жизни ttl (секунды). Возвращает True при успехе."""
+    try:
+        await redis_client.set(key, json.dumps(value, ensure_ascii=False), ex=ttl)
+        return True
+    except (RedisError, TypeError, ValueError) as e:
+        logger.error(f"Не удалось сохранить ключ '{key}' в Redis: {e}")
+        return False
@@ -0,0 +1,198 @@
+"""
+Разбор шаблона выписного эпикриза (XmlTemplate6E/getXmlTemplateForEvnXml) на блоки диагнозов.
+
+Шаблон - HTML с заголовками блоков ("Диагноз основной", "Осложнения", "Сопутствующие заболевания")
+и маркерами вида @#@ИмяМаркера@#@, значения которых лежат в xmlData. Блок - текст от заголовка
+до ближайшего следующего известного заголовка (BOUNDARY_LABELS) или до конца шаблона.
+
+Все регулярные выражения скомпилированы один раз при импорте. Заголовки и границы блоков находятся
+одним проходом по шаблону, затем каждый блок один раз просматривается на маркеры и HTML-теги.
+Результат совпадает с прежним разбором регулярными выражениями по каждому блоку
+(проверяется скриптом scripts/bench_discharge_parser.py на сохранённых эпикризах).
+
+Разобранные эпикризы хранятся в памяти воркера (до DISCHARGE_SUMMARY_CACHE_SIZE штук) по EvnXml_id
+и хэшу содержимого, поэтому повторное обогащение того же случая не разбирает документ заново,
+а изменённый в ЕВМИАС документ разбирается как новый. Разбор большого шаблона выполняется
+вне цикла событий (app/core/offload.py).
+"""
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List
+
+from app.core import get_settings
+from app.core.offload import offload_cpu
+
+settings = get_settings()
+
+# Заголовки блоков. Порядок вариантов важен: при совпадении в одной позиции берётся первый
+PRIMARY_LABELS = ["Диагноз основной", "Основное заболевание"]
+COMPLICATION_LABELS = ["Осложнения основного заболевания", "Осложнения"]
+CONCOMITANT_LABELS = ["Сопутствующие заболевания"]
+
+# Прочие заголовки и маркеры, которыми заканчивается блок (заголовки осложнений и сопутствующих - тоже)
+BOUNDARY_LABELS = [
+    "Внешняя причина при травмах",
+    "Дополнительные сведения о заболевании",
+    "@#@ОсложненияОсновногоДиагнозаДвижРасш",
+    "ОсновногоДиагнозаДвижРасш",
+    "@#@СопутствующиеДиагнозы",
+    "@#@КодОсновногоДиагнозаДвижения",
+    "Состояние при поступлении:",
+    "основного: ",
+    "@#@НаименованиеОсновногоДиагнозаДвижения",
+]
+
+SECTIONS = ("primary", "complication", "concomitant")
+
+LABEL_KINDS = {
+    **{label: "primary" for label in PRIMARY_LABELS},
+    **{label: "complication" for label in COMPLICATION_LABELS},
+    **{label: "concomitant" for label in CONCOMITANT_LABELS},
+    **{label: "boundary" for label in BOUNDARY_LABELS},
+}
+LOWER_LABEL_KINDS = {label.lower(): kind for label, kind in LABEL_KINDS.items()}
+
+# Заголовок любого вида. Поиск продолжается со следующего символа после начала найденного заголовка,
+# поэтому находятся и вложенные друг в друга заголовки (например, "Осложнения" внутри
+# "@#@ОсложненияОсновногоДиагнозаДвижРасш"). В одной позиции заголовки разных видов совпасть не могут,
+# поэтому вид заголовка определяется по найденному тексту.
+# Поиск без учёта регистра ведётся по шаблону в нижнем регистре: это в несколько раз быстрее re.IGNORECASE.
+# Если str.lower() меняет длину шаблона или в нём есть варианты кириллических букв, которые
+# re.IGNORECASE считает равными обычным (U+1C80-U+1C86), поиск идёт с re.IGNORECASE по исходному шаблону
+LOWER_LABEL_RE = re.compile("|".join(re.escape(label) for label in LOWER_LABEL_KINDS))
+LABEL_RE = re.compile(
+    "|".join(f"(?P<{kind}>{'|'.join(re.escape(label) for label in labels)})" for kind, labels in (
+        ("primary", PRIMARY_LABELS),
+        ("complication", COMPLICATION_LABELS),
+        ("concomitant", CONCOMITANT_LABELS),
+        ("boundary", BOUNDARY_LABELS),
+    )),
+    re.IGNORECASE,
+)
+CASE_VARIANTS = [chr(code) for code in range(0x1C80, 0x1C87)]
+
+# Пробелы и двоеточие между заголовком и содержимым блока
+LABEL_SEPARATOR_RE = re.compile(r"\s*:?\s*")
+# Маркер значения из xmlData или HTML-тег (тег не переходит на следующую строку)
+CONTENT_TOKEN_RE = re.compile(r"@#@(\w+)@#@|<.*?>")
+MARKER_RE = re.compile(r"@#@(\w+)@#@")
+
+DIABETES = "Сахарный диабет"
+
+
+def highlight_diabetes(text: str | None) -> str | None:
+    """Выделяет жирным упоминания сахарного диабета."""
+    return text.replace(DIABETES, f"<b>{DIABETES}</b>") if text else text
+
+
+def combine_parts(*args):
+    """Объединяет несколько текстовых частей в одну строку, игнорируя пустые."""
+    valid_parts = [str(part).strip() for part in args if part]
+    return " ".join(valid_parts) if valid_parts else None
+
+
+def _find_sections(template: str) -> Dict[str, str]:
+    """Возвращает сырое содержимое каждого найденного блока (от заголовка до следующей границы)."""
+    folded = template.lower()
+    fast = len(folded) == len(template) and not any(variant in template for variant in CASE_VARIANTS)
+    label_re, text = (LOWER_LABEL_RE, folded) if fast else (LABEL_RE, template)
+
+    starts: Dict[str, int] = {}
+    ends: Dict[str, int] = {}
+    match = label_re.search(text)
+    while match:
+        kind = LOWER_LABEL_KINDS[match.group()] if fast else match.lastgroup
+        if kind != "primary":
+            for open_kind, content_start in starts.items():
+                if open_kind not in ends and match.start() >= content_start:
+                    ends[open_kind] = match.start()
+        if kind != "boundary" and kind not in starts:
+            starts[kind] = LABEL_SEPARATOR_RE.match(template, match.end()).end()
+        elif len(ends) == len(SECTIONS):
+            break
+        match = label_re.search(text, match.start() + 1)
+
+    return {kind: template[content_start:ends.get(kind, len(template))] for kind, content_start in starts.items()}
+
+
+def _parse_section(raw_section: str, xml_data: Dict[str, Any]) -> str | None:
+    """Убирает из блока маркеры и HTML-теги и добавляет к тексту значения маркеров из xmlData."""
+    text_parts = []
+    marker_values = []
+    position = 0
+    for match in CONTENT_TOKEN_RE.finditer(raw_section):
+        text_parts.append(raw_section[position:match.start()])
+        position = match.end()
+        marker_name = match.group(1)
+        if marker_name is not None:
+            marker_values.append(xml_data.get(marker_name))
+        else:
+            # Маркеры внутри тега тоже учитываются
+            text_parts.append(" ")
+            marker_values.extend(xml_data.get(name) for name in MARKER_RE.findall(match.group()))
+    text_parts.append(raw_section[position:])
+
+    text = " ".join("".join(text_parts).split())
+    return combine_parts(text, *marker_values)
+
+
+def parse_discharge_summary(template: str, xml_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Извлекает из шаблона и xmlData выписного эпикриза поля для формы (ключ 'pure' ответа)."""
+    sections = _find_sections(template or "")
+    primary, complication, concomitant = (
+        _parse_section(sections.get(kind, ""), xml_data) for kind in SECTIONS
+    )
+
+    return {
+        "diagnos": highlight_diabetes(xml_data.get("diagnos")),
+        "primary_diagnosis": primary,
+        "primary_complication": highlight_diabetes(complication),
+        "concomitant_diseases": highlight_diabetes(concomitant),
+        "item_90": xml_data.get("specMarker_90"),
+        "item_94": xml_data.get("specMarker_94"),
+        "item_272": xml_data.get("specMarker_272"),
+        "item_284": xml_data.get("specMarker_284"),
+        "item_659": highlight_diabetes(xml_data.get("specMarker_659")),
+        "item_145": xml_data.get("specMarker_145"),
+        "AdditionalInf": xml_data.get("AdditionalInf"),
+    }
+
+
+_parsed_cache: "OrderedDict[tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+
+def discharge_summary_hash(template: str, xml_data: Dict[str, Any]) -> str:
+    """Хэш содержимого эпикриза (шаблон и значения маркеров)."""
+    digest = hashlib.sha256((template or "").encode("utf-8"))
+    digest.update(json.dumps(xml_data, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def parse_discharge_summary_cached(
+        document_id: str,
+        template: str,
+        xml_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    То же, что parse_discharge_summary, но результат для документа с тем же EvnXml_id
+    и тем же содержимым берётся из памяти, а большой шаблон разбирается вне цикла событий.
+    """
+    parse = partial(
+        offload_cpu, parse_discharge_summary, template, xml_data, size=len(template or ""), process=True
+    )
+    if settings.DISCHARGE_SUMMARY_CACHE_SIZE <= 0 or not document_id:
+        return await parse()
+
+    key = (str(document_id), discharge_summary_hash(template, xml_data))
+    pure = _parsed_cache.get(key)
+    if pure is None:
+        pure = await parse()
+        _parsed_cache[key] = pure
+        if len(_parsed_cache) > settings.DISCHARGE_SUMMARY_CACHE_SIZE:
+            _parsed_cache.popitem(last=False)
+    else:
+        _parsed_cache.move_to_end(key)
+    return dict(pure)
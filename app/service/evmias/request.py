@@ -1,9 +1,9 @@
-import re
 from datetime import datetime
 from typing import List, Dict, Any
 
 from app.core import get_settings, HTTPXClient, logger
 from app.core.decorators import log_and_catch
+from .discharge_parser import parse_discharge_summary_cached
 from .helpers import (
     filter_operations_from_services,
     process_diagnosis_list,
@@ -128,6 +128,21 @@ async def fetch_referred_org_by_id(
     return response_json[0] if isinstance(response_json, list) and response_json else {}
 
 
+@log_and_catch(debug=settings.DEBUG_HTTP)
+async def fetch_evmias_directory(
+        cookies: dict[str, str], http_service: HTTPXClient, object_name: str, fields: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Загружает справочник ЕВМИАС (MongoDBWork/getData), например ResultDesease.
+    fields - запрашиваемые поля записей.
+    """
+    params = {"c": "MongoDBWork", "m": "getData", "object": object_name}
+    data = {**{field: "" for field in fields}, "object": object_name}
+
+    response_json = await _make_api_post_request(cookies, http_service, params, data)
+    return response_json if isinstance(response_json, list) else []
+
+
 # ============== Начало - Получаем только операции (если они есть) из списка оказанных услуг ==============
 async def _fetch_all_medical_services(
         cookies: dict[str, str], http_service: HTTPXClient, event_id: str
@@ -220,32 +235,16 @@ async def fetch_additional_diagnosis(
 # ============== Конец - Получаем дополнительные диагнозы (если они есть) из движения в ЕВМИАС ==========
 
 # ============== Старт - Получаем выписной эпикриз из ЕВМИАС ============================================
-def clean_html(raw_html):
-    """Удаляет HTML-теги, лишние пробелы и переносы строк."""
-    if not raw_html:
-        return ""
-    # Удаляем все HTML-теги
-    text = re.sub(r'<.*?>', ' ', raw_html)
-    # Заменяем множественные пробелы и переносы строк на один пробел
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
-
-
-def combine_parts(*args):
-    """Объединяет несколько текстовых частей в одну строку, игнорируя пустые."""
-    # Фильтруем пустые или None значения и удаляем лишние пробелы
-    valid_parts = [str(part).strip() for part in args if part]
-    return " ".join(valid_parts) if valid_parts else None
-
-
 @log_and_catch(debug=settings.DEBUG_HTTP)
 async def fetch_patient_discharge_summary(
         cookies: dict[str, str],
         http_service: HTTPXClient,
         event_id: str,
+        include_raw: bool = False,
 ) -> Dict[str, Any] | None:
     """
     Выполняет многоступенчатый процесс получения и обработки данных из выписного эпикриза.
+    Ответ ЕВМИАС целиком (ключ 'raw') возвращается только при include_raw - для отладки.
     """
     logger.info(f"Начинаем получать данные из выписного эпикриза для event_id: {event_id}")
 
@@ -307,89 +306,9 @@ async def fetch_patient_discharge_summary(
     xml_data = raw_discharge_summary_data.get("xmlData", {})
     template_raw = raw_discharge_summary_data.get("template", "")
 
-    # -- 1. Определяем все возможные заголовки и "стоп-слова" --
-    # Возможные заголовки для каждого блока (через | для regex)
-    LABELS_PRIMARY = r"Диагноз основной|Основное заболевание" # noqa
-    LABELS_COMPLICATION = r"Осложнения основного заболевания|Осложнения" # noqa
-    LABELS_CONCOMITANT = r"Сопутствующие заболевания" # noqa
-
-    # Все возможные заголовки, которые могут идти *после* наших блоков. Они служат "якорями" конца.
-    STOP_LABELS = [ # noqa
-        LABELS_COMPLICATION,
-        LABELS_CONCOMITANT,
-        r"Внешняя причина при травмах",
-        r"Дополнительные сведения о заболевании",
-        r"@#@ОсложненияОсновногоДиагнозаДвижРасш",
-        r"ОсновногоДиагнозаДвижРасш",
-        r"@#@СопутствующиеДиагнозы",
-        r"@#@КодОсновногоДиагнозаДвижения",
-        r"Состояние при поступлении:",
-        r"основного: ",
-        r"@#@НаименованиеОсновногоДиагнозаДвижения"
-    ]
-    # Объединяем все стоп-заголовки в один паттерн для поиска конца блока
-    STOP_PATTERN = r"(?:" + "|".join(STOP_LABELS) + r")" # noqa
-
-    def extract_raw_section(template, start_labels_pattern):
-        """Извлекает сырое содержимое блока между его заголовком и следующим известным заголовком."""
-        # Паттерн: (группа 1: заголовок) \s*:? (группа 2: содержимое) (?= группа 3: следующий заголовок или конец строки)
-        pattern = rf"({start_labels_pattern})\s*:?\s*(.*?)(?={STOP_PATTERN}|$)"
-        match = re.search(pattern, template, re.DOTALL | re.IGNORECASE)
-        return match.group(2).strip() if match else ""
-
-    # -- 3. Извлекаем сырое содержимое для каждого блока --
-
-    raw_primary = extract_raw_section(template_raw, LABELS_PRIMARY)
-    raw_complication = extract_raw_section(template_raw, LABELS_COMPLICATION)
-    raw_concomitant = extract_raw_section(template_raw, LABELS_CONCOMITANT)
-
-    # -- 4. Извлекаем текст и значения маркеров из сырых блоков --
-
-    marker_pattern = r"@#@([\w\d]+)@#@"
-
-    # Обработка основного диагноза
-    primary_text = clean_html(re.sub(marker_pattern, '', raw_primary))
-    primary_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_primary)]
-    primary_diagnosis = combine_parts(primary_text, *primary_markers)
-
-    # Обработка осложнений
-    complication_text = clean_html(re.sub(marker_pattern, '', raw_complication))
-    complication_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_complication)]
-    primary_complication = combine_parts(complication_text, *complication_markers)
-    if primary_complication:
-        primary_complication = primary_complication.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
-
-    # Обработка сопутствующих
-    concomitant_text = clean_html(re.sub(marker_pattern, '', raw_concomitant))
-    concomitant_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_concomitant)]
-    concomitant_diseases = combine_parts(concomitant_text, *concomitant_markers)
-    if concomitant_diseases:
-        concomitant_diseases = concomitant_diseases.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
-
-    diagnos = xml_data.get("diagnos")
-    if diagnos:
-        diagnos = diagnos.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
-
-    item_659 = xml_data.get("specMarker_659")
-    if item_659:
-        item_659 = item_659.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
-
-    result = {
-        "pure": {
-            "diagnos": diagnos,
-            "primary_diagnosis": primary_diagnosis,
-            "primary_complication": primary_complication,
-            "concomitant_diseases": concomitant_diseases,
-            "item_90": xml_data.get("specMarker_90"),
-            "item_94": xml_data.get("specMarker_94"),
-            "item_272": xml_data.get("specMarker_272"),
-            "item_284": xml_data.get("specMarker_284"),
-            "item_659": item_659,
-            "item_145": xml_data.get("specMarker_145"),
-            "AdditionalInf": xml_data.get("AdditionalInf"),
-        },
-        "raw": raw_discharge_summary_data,
-    }
+    result = {"pure": await parse_discharge_summary_cached(data["EvnXml_id"], template_raw, xml_data)}
+    if include_raw:
+        result["raw"] = raw_discharge_summary_data
 
     logger.info(f"Эпикриз успешно обработан для event_id: {event_id}.")
     return result
@@ -0,0 +1,118 @@
+"""
+Сопоставление полей ЕВМИАС с кодами формы для пакета случаев (выгрузки на тысячи случаев).
+
+Вход - столбцы: имя поля ЕВМИАС -> список значений по случаям (все столбцы одной длины, отсутствующий
+столбец - None у всех случаев). Каждый столбец (или набор столбцов, от которых зависит значение)
+раскладывается на уникальные значения и номера значений по случаям. Значение вычисляется один раз
+на уникальное значение функцией map_* из app/service/extension/helpers.py (той же, что вызывают функции
+get_* для одного случая) и раскладывается обратно по номерам. В выгрузке за месяц отделений, диагнозов
+и дат - десятки и сотни, поэтому вычислений на порядки меньше, чем случаев, и нет корутины на каждое
+поле каждого случая.
+
+Результат совпадает с последовательным вызовом функций helpers.py для каждого случая (как в enrich_data).
+Отличие одно: дата госпитализации не строкой даёт None, а не исключение.
+"""
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from app.core import logger
+from app.service.extension.helpers import (
+    map_bed_profile,
+    map_corrected_outcome_code,
+    map_direction_date,
+    map_disease_type_code,
+    map_medical_care_form,
+    map_medical_care_profile,
+    map_outcome_code,
+)
+from app.service.reference.mapping_rules import department_by_name, resolve_department
+
+# Поля ЕВМИАС, из которых собираются коды: started_data, movement, referral, disease
+BATCH_INPUT_FIELDS = (
+    "LpuSection_Name",
+    "EvnPS_setDate",
+    "LpuSectionBedProfile_Name",
+    "Diag_Code",
+    "LpuSectionProfile_Name",
+    "PrehospType_id",
+    "ResultDesease_id",
+    "DeseaseType_id",
+)
+
+
+def _factorize(*columns: Sequence[Any]) -> Tuple[List[tuple], List[int]]:
+    """
+    Уникальные сочетания значений столбцов и номер сочетания для каждого случая.
+    Значения различаются и по типу: 2 и "2" дают разные коды, как и при поиске по str(значение).
+    Несколько столбцов раскладываются по отдельности, сочетания ищутся по номерам их значений.
+    """
+    numbers: Dict[tuple, int] = {}
+    if len(columns) == 1:
+        codes = [numbers.setdefault(key, len(numbers)) for key in zip(map(type, columns[0]), columns[0])]
+        return [(value,) for _, value in numbers], codes
+
+    factorized = [_factorize(column) for column in columns]
+    keys = zip(*(column_codes for _, column_codes in factorized))
+    codes = [numbers.setdefault(key, len(numbers)) for key in keys]
+    uniques = [
+        tuple(column_uniques[number][0] for (column_uniques, _), number in zip(factorized, key))
+        for key in numbers
+    ]
+    return uniques, codes
+
+
+def _map_unique(func: Callable[..., Any], *columns: Sequence[Any]) -> List[Any]:
+    """func от значений столбцов для каждого случая, вычисленная один раз на уникальное сочетание."""
+    uniques, codes = _factorize(*columns)
+    results = [func(*values) for values in uniques]
+    return [results[code] for code in codes]
+
+
+def _department(lpu_section_name: Any) -> Tuple[str | None, str | None, str]:
+    """Название, код и условия оказания помощи отделения, как у get_department_name и следующих за ней."""
+    name = resolve_department(lpu_section_name)["name"]
+    department = department_by_name(name)
+    return name, department["code"] if name else None, department["medical_care_conditions"]
+
+
+def map_cases_columnar(columns: Dict[str, Sequence[Any]]) -> Dict[str, List[Any]]:
+    """
+    Коды формы для пакета случаев по столбцам полей ЕВМИАС (BATCH_INPUT_FIELDS).
+    Возвращает столбцы: department_name, department_code, medical_care_conditions, direction_date,
+    medical_care_form, bed_profile_code, bed_profile_name, medical_care_profile, disease_type_code, outcome_code.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Столбцы разной длины: {sorted(lengths)}")
+    size = lengths.pop() if lengths else 0
+    missing = [None] * size
+    column = {name: columns.get(name, missing) for name in BATCH_INPUT_FIELDS}
+
+    departments = _map_unique(_department, column["LpuSection_Name"])
+    department_names = [name for name, _, _ in departments]
+    medical_care_conditions = [conditions for _, _, conditions in departments]
+    bed_profiles = _map_unique(
+        map_bed_profile, column["LpuSectionBedProfile_Name"], column["Diag_Code"], department_names
+    )
+    bed_profile_names = [bed_profile_name for _, bed_profile_name in bed_profiles]
+    outcome_codes = _map_unique(map_outcome_code, column["ResultDesease_id"])
+    result = {
+        "department_name": department_names,
+        "department_code": [code for _, code, _ in departments],
+        "medical_care_conditions": medical_care_conditions,
+        "direction_date": _map_unique(
+            lambda value: map_direction_date(value) if isinstance(value, str) else None, column["EvnPS_setDate"]
+        ),
+        "medical_care_form": _map_unique(map_medical_care_form, column["PrehospType_id"]),
+        "bed_profile_code": [bed_profile_code for bed_profile_code, _ in bed_profiles],
+        "bed_profile_name": bed_profile_names,
+        "medical_care_profile": _map_unique(
+            map_medical_care_profile, column["LpuSectionProfile_Name"], bed_profile_names
+        ),
+        "disease_type_code": _map_unique(map_disease_type_code, column["DeseaseType_id"]),
+        "outcome_code": _map_unique(map_corrected_outcome_code, outcome_codes, medical_care_conditions),
+    }
+
+    unmapped = {name: values.count(None) for name, values in result.items() if None in values}
+    if unmapped:
+        logger.debug(f"Пакетное сопоставление {size} случаев, без значения: {unmapped}")
+    return result
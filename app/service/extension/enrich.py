@@ -1,8 +1,8 @@
 import asyncio
-import re
-from typing import Annotated, Dict, Any, Awaitable
+import json
+from typing import Annotated, Dict, Any, Awaitable, AsyncIterator, Callable
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 
 from app.core import HTTPXClient, get_http_service, logger
 from app.model import EnrichmentRequestData
@@ -24,6 +24,7 @@ from app.service.extension.helpers import (
     get_direction_date,
     get_bed_profile_code,
     get_outcome_code,
+    get_corrected_outcome_code,
     get_disease_type_code,
     get_department_name,
     get_department_code,
@@ -31,6 +32,17 @@ from app.service.extension.helpers import (
     get_valid_additional_diagnosis,
 )
 
+# Группы полей в порядке, в котором их удобно заполнять на форме ГИС ОМС.
+# По группам отдаются события в потоковом режиме (SSE).
+ENRICHMENT_GROUPS = (
+    "patient",  # идентификация пациента
+    "dates",  # даты направления и лечения
+    "department",  # отделение, профили, условия и форма оказания помощи
+    "diagnoses",  # основной диагноз, результат и исход, доп. диагнозы
+    "services",  # операции
+    "discharge_summary",  # выписной эпикриз
+)
+
 
 async def _safe_gather(*tasks: Awaitable[Any]) -> list[Any | None]:
     """
@@ -84,103 +96,420 @@ async def _fetch_and_process_additional_diagnosis(
     return valid_additional_diagnosis
 
 
-async def enrich_data(
-        enrich_request: EnrichmentRequestData,
-        cookies: Annotated[dict[str, str], Depends(set_cookies)],
-        http_service: Annotated[HTTPXClient, Depends(get_http_service)]
-) -> Dict[str, Any]:
-    logger.info(f"Запрос на обогащение получен.")
+class EnrichmentContext:
+    """
+    Контекст обогащения одного случая госпитализации.
+
+    Лениво запускает запросы к ЕВМИАС и вычисление промежуточных значений (источники).
+    Каждый источник выполняется один раз, сколько бы полей от него ни зависело,
+    поэтому группы полей можно собирать независимо и параллельно.
+
+    Если задан список fields, вычисляются только эти поля и только нужные им запросы к ЕВМИАС.
+    """
+
+    def __init__(
+            self,
+            started_data: Dict[str, Any],
+            cookies: dict[str, str],
+            http_service: HTTPXClient,
+            fields: list[str] | None = None,
+    ):
+        self.started_data = started_data
+        self.cookies = cookies
+        self.http_service = http_service
+        self.person_id = started_data.get("Person_id")
+        self.event_id = started_data.get("EvnPS_id")
+        self.fields = select_enriched_fields(fields)
+        self.groups = tuple(group for group in ENRICHMENT_GROUPS if enriched_field_keys([group], self.fields))
+        # Источники, завершившиеся с ошибкой (их поля получили значения по умолчанию)
+        self.failed_sources: set[str] = set()
+        self._tasks: dict[str, asyncio.Future] = {}
+
+    def _ensure_task(self, name: str) -> asyncio.Future:
+        task = self._tasks.get(name)
+        if task is None:
+            task = asyncio.create_task(self._run_source(name), name=f"enrich:{name}:{self.event_id}")
+            self._tasks[name] = task
+        return task
+
+    def prefetch(self) -> None:
+        """Сразу запускает все запросы к ЕВМИАС, которые понадобятся для выбранных полей."""
+        upstream_calls = upstream_calls_for(self.fields)
+        logger.debug(f"event_id: {self.event_id}, запросы к ЕВМИАС для {len(self.fields)} полей: {upstream_calls}")
+        for name in upstream_calls:
+            self._ensure_task(name)
+
+    async def get(self, name: str, default: Any = None) -> Any:
+        """
+        Возвращает значение источника, запуская его при первом обращении.
+        Если источник завершился с ошибкой или вернул пустое значение - возвращает default.
+        """
+        # shield: отмена одного из ожидающих не должна отменять источник, нужный другим полям
+        result = await asyncio.shield(self._ensure_task(name))
+        return result if result is not None else default
+
+    async def _run_source(self, name: str) -> Any:
+        try:
+            return await _SOURCES[name](self)
+        except Exception as e:
+            self.failed_sources.add(name)
+            logger.exception(f"Источник '{name}' для event_id {self.event_id} завершился с ошибкой: "
+                             f"{type(e).__name__} — {e}")
+            return None
+
+    def cancel(self) -> None:
+        """Отменяет все ещё выполняющиеся источники."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+
+
+# ============== Источники данных для обогащения ==============
+async def _load_person(ctx: EnrichmentContext) -> dict:
+    return await fetch_person_data(ctx.cookies, ctx.http_service, ctx.person_id)
+
+
+async def _load_movement(ctx: EnrichmentContext) -> dict:
+    return await fetch_movement_data(ctx.cookies, ctx.http_service, ctx.event_id)
+
+
+async def _load_referral(ctx: EnrichmentContext) -> dict:
+    return await fetch_referral_data(ctx.cookies, ctx.http_service, ctx.event_id)
+
+
+async def _load_operations(ctx: EnrichmentContext) -> list[dict[str, str]]:
+    return await fetch_operations_data(ctx.cookies, ctx.http_service, ctx.event_id)
+
+
+async def _load_discharge_summary(ctx: EnrichmentContext) -> dict:
+    discharge_summary = await fetch_patient_discharge_summary(ctx.cookies, ctx.http_service, ctx.event_id)
+    return discharge_summary.get("pure") if discharge_summary else {}
+
+
+async def _load_disease(ctx: EnrichmentContext) -> dict:
+    return await fetch_disease_data(ctx.cookies, ctx.http_service, await ctx.get("movement", {}))
+
+
+async def _load_additional_diagnosis(ctx: EnrichmentContext) -> list[dict[str, str]]:
+    referred_data = await ctx.get("referral", {})
+    return await _fetch_and_process_additional_diagnosis(ctx.cookies, ctx.http_service, referred_data)
+
+
+async def _load_referred_organization(ctx: EnrichmentContext) -> str | None:
+    return await get_referred_organization(ctx.cookies, ctx.http_service, await ctx.get("referral", {}))
+
+
+async def _load_department_name(ctx: EnrichmentContext) -> str | None:
+    return await get_department_name(ctx.started_data)
+
+
+async def _load_medical_care_conditions(ctx: EnrichmentContext) -> str:
+    return await get_medical_care_condition(await ctx.get("department_name"))
+
+
+async def _load_bed_profile(ctx: EnrichmentContext) -> tuple[str | None, str | None]:
+    movement_data = await ctx.get("movement", {})
+    return await get_bed_profile_code(movement_data, await ctx.get("department_name"))
+
+
+async def _load_outcome_code(ctx: EnrichmentContext) -> str | None:
+    outcome_code = await get_outcome_code(await ctx.get("disease", {}))
+    return await get_corrected_outcome_code(outcome_code, await ctx.get("medical_care_conditions"))
+
+
+_SOURCES: dict[str, Callable[[EnrichmentContext], Awaitable[Any]]] = {
+    "person": _load_person,
+    "movement": _load_movement,
+    "referral": _load_referral,
+    "operations": _load_operations,
+    "discharge_summary": _load_discharge_summary,
+    "disease": _load_disease,
+    "additional_diagnosis": _load_additional_diagnosis,
+    "referred_organization": _load_referred_organization,
+    "department_name": _load_department_name,
+    "medical_care_conditions": _load_medical_care_conditions,
+    "bed_profile": _load_bed_profile,
+    "outcome_code": _load_outcome_code,
+}
+
+
+# ============== Вычисление полей обогащённых данных ==============
+FieldResolver = Callable[[EnrichmentContext], Awaitable[Any]]
+
+
+def _constant(value: Any) -> FieldResolver:
+    async def resolve(_ctx: EnrichmentContext) -> Any:
+        return value
+    return resolve
+
+
+def _source(name: str, default: Any = None) -> FieldResolver:
+    async def resolve(ctx: EnrichmentContext) -> Any:
+        return await ctx.get(name, default)
+    return resolve
+
+
+def _started_field(key: str, default: Any = None) -> FieldResolver:
+    async def resolve(ctx: EnrichmentContext) -> Any:
+        return ctx.started_data.get(key, default)
+    return resolve
+
+
+def _source_field(name: str, key: str, default: Any = None) -> FieldResolver:
+    async def resolve(ctx: EnrichmentContext) -> Any:
+        return (await ctx.get(name, {})).get(key, default)
+    return resolve
+
+
+async def _resolve_direction_date(ctx: EnrichmentContext) -> str | None:
+    return await get_direction_date(ctx.started_data.get("EvnPS_setDate"))
+
 
-    started_data = enrich_request.started_data
-    person_id = started_data.get("Person_id")
-    event_id = started_data.get("EvnPS_id")
-    logger.debug(f"Извлечены данные: person_id={person_id}, event_id={event_id}")
+async def _resolve_card_number(ctx: EnrichmentContext) -> str:
+    return ctx.started_data.get("EvnPS_NumCard", "").split(" ")[0]
 
-    results = await _safe_gather(
-        fetch_person_data(cookies, http_service, person_id),
-        fetch_movement_data(cookies, http_service, event_id),
-        fetch_referral_data(cookies, http_service, event_id),
-        fetch_operations_data(cookies, http_service, event_id),
-        fetch_patient_discharge_summary(cookies, http_service, event_id),
 
-    )
-    person_data, movement_data, referred_data, medical_service_data, discharge_summary = results
+async def _resolve_medical_care_form(ctx: EnrichmentContext) -> str | None:
+    return await get_medical_care_form(await ctx.get("referral", {}))
 
-    person_data = person_data or {}
-    movement_data = movement_data or {}
-    referred_data = referred_data or {}
-    medical_service_data = medical_service_data or []
-    pure_discharge_summary = discharge_summary.get("pure") if discharge_summary else {}
+
+async def _resolve_medical_care_profile(ctx: EnrichmentContext) -> str | None:
+    _, corrected_bed_profile_name = await ctx.get("bed_profile", (None, None))
+    return await get_medical_care_profile(await ctx.get("movement", {}), corrected_bed_profile_name)
+
+
+async def _resolve_department_code(ctx: EnrichmentContext) -> str | None:
+    return await get_department_code(await ctx.get("department_name"))
+
+
+async def _resolve_bed_profile_code(ctx: EnrichmentContext) -> str | None:
+    bed_profile_code, _ = await ctx.get("bed_profile", (None, None))
+    return bed_profile_code
+
+
+async def _resolve_disease_type_code(ctx: EnrichmentContext) -> str | None:
+    return await get_disease_type_code(await ctx.get("disease", {}))
+
+
+async def _resolve_discharge_summary(ctx: EnrichmentContext) -> dict:
+    pure_discharge_summary = dict(await ctx.get("discharge_summary", {}))
 
     # если есть данные об операции, то убираем данные о них из эпикриза, что бы не было дублирования,
     # это для случаев когда в эпикризе есть данные об операции, а в медстатистике нет
-    if medical_service_data:
+    if await ctx.get("operations"):
         pure_discharge_summary["item_145"] = None
+    return pure_discharge_summary
+
+
+# Поля ответа в порядке их следования: (ключ, группа, запросы к ЕВМИАС, функция вычисления значения).
+# Запросы к ЕВМИАС - имена источников, которые обращаются к ЕВМИАС (прямо или через зависимый источник).
+_ENRICHED_FIELDS: list[tuple[str, str, tuple[str, ...], FieldResolver]] = [
+    ("input[name='ReferralHospitalizationNumberTicket']", "dates", (),
+     _constant("б/н")),
+    ("input[name='ReferralHospitalizationDateTicket']", "dates", (),
+     _resolve_direction_date),
+    ("input[name='ReferralHospitalizationMedIndications']", "dates", (),
+     _constant("001")),
+    ("input[name='Enp']", "patient", ("person",),
+     _source_field("person", "Person_EdNum", "")),
+    ("input[name='DateBirth']", "patient", (),
+     _started_field("Person_Birthday", "")),
+    ("input[name='Gender']", "patient", ("person",),
+     _source_field("person", "Sex_Name", "")),
+    ("input[name='TreatmentDateStart']", "dates", (),
+     _started_field("EvnPS_setDate")),
+    ("input[name='TreatmentDateEnd']", "dates", (),
+     _started_field("EvnPS_disDate")),
+    ("input[name='VidMpV008']", "department", (),
+     _constant("31")),
+    ("input[name='HospitalizationInfoV006']", "department", (),
+     _source("medical_care_conditions")),
+    ("input[name='HospitalizationInfoV014']", "department", ("referral",),
+     _resolve_medical_care_form),
+    ("input[name='HospitalizationInfoSpecializedMedicalProfile']", "department", ("movement",),
+     _resolve_medical_care_profile),
+    ("input[name='HospitalizationInfoSubdivision']", "department", (),
+     _constant("Стационар")),
+    ("input[name='HospitalizationInfoNameDepartment']", "department", (),
+     _source("department_name")),
+    ("input[name='HospitalizationInfoOfficeCode']", "department", (),
+     _resolve_department_code),
+    ("input[name='HospitalizationInfoV020']", "department", ("movement",),
+     _resolve_bed_profile_code),
+    ("input[name='HospitalizationInfoDiagnosisMainDisease']", "diagnoses", ("movement",),
+     _source_field("movement", "Diag_Code", "")),
+    ("input[name='CardNumber']", "patient", (),
+     _resolve_card_number),
+    ("input[name='ResultV009']", "diagnoses", ("movement",),
+     _source_field("movement", "LeaveType_Code")),
+    ("input[name='IshodV012']", "diagnoses", ("movement", "disease"),
+     _source("outcome_code")),
+    ("input[name='HospitalizationInfoC_ZABV027']", "diagnoses", ("movement", "disease"),
+     _resolve_disease_type_code),
+    ("input[name='ReferralHospitalizationSendingDepartment']", "department", ("referral", "referred_organization"),
+     _source("referred_organization")),
+    ("additional_diagnosis_data", "diagnoses", ("referral", "additional_diagnosis"),
+     _source("additional_diagnosis", [])),
+    ("medical_service_data", "services", ("operations",),
+     _source("operations", [])),
+    ("discharge_summary", "discharge_summary", ("discharge_summary", "operations"),
+     _resolve_discharge_summary),
+]
+
+# Допустимые имена при выборе полей: полный ключ и короткое имя поля формы (например, 'Enp')
+_FIELD_ALIASES: dict[str, str] = {
+    alias: key
+    for key, *_ in _ENRICHED_FIELDS
+    for alias in (key, key.removeprefix("input[name='").removesuffix("']"))
+}
+
+
+def select_enriched_fields(fields: list[str] | None) -> list[str]:
+    """
+    Преобразует запрошенный список полей в ключи ответа (в порядке их следования).
+    Принимает полные ключи, короткие имена полей формы и имена групп. Пустой список - все поля.
+    """
+    all_keys = [key for key, *_ in _ENRICHED_FIELDS]
+    if not fields:
+        return all_keys
+
+    selected, unknown = set(), []
+    for name in fields:
+        if name in ENRICHMENT_GROUPS:
+            selected.update(enriched_field_keys([name]))
+        elif name in _FIELD_ALIASES:
+            selected.add(_FIELD_ALIASES[name])
+        else:
+            unknown.append(name)
+
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Неизвестные поля для обогащения: {', '.join(unknown)}"
+        )
+    return [key for key in all_keys if key in selected]
+
+
+def enriched_field_keys(
+        groups: tuple[str, ...] | list[str] = ENRICHMENT_GROUPS,
+        fields: list[str] | None = None,
+) -> list[str]:
+    """Возвращает ключи полей, входящих в указанные группы (и в fields, если задан), в порядке следования."""
+    return [
+        key for key, group, *_ in _ENRICHED_FIELDS
+        if group in groups and (fields is None or key in fields)
+    ]
+
+
+def upstream_calls_for(fields: list[str]) -> tuple[str, ...]:
+    """Возвращает запросы к ЕВМИАС, необходимые для вычисления указанных полей."""
+    calls = {}
+    for key, _, upstream_calls, _ in _ENRICHED_FIELDS:
+        if key in fields:
+            calls.update(dict.fromkeys(upstream_calls))
+    return tuple(calls)
+
+
+def assemble_enriched_data(groups: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """Собирает поля из готовых групп в один словарь в порядке их следования в ответе."""
+    ready_fields = {key: value for group_fields in groups for key, value in group_fields.items()}
+    return {key: ready_fields[key] for key, *_ in _ENRICHED_FIELDS if key in ready_fields}
+
+
+async def build_enriched_group(ctx: EnrichmentContext, group: str) -> Dict[str, Any]:
+    """
+    Вычисляет выбранные поля одной группы. Поле, вычисление которого упало, получает значение None.
+    """
+    fields = [
+        (key, resolver) for key, field_group, _, resolver in _ENRICHED_FIELDS
+        if field_group == group and key in ctx.fields
+    ]
+    values = await _safe_gather(*(resolver(ctx) for _, resolver in fields))
+    return {key: value for (key, _), value in zip(fields, values)}
+
+
+async def iter_enriched_groups(ctx: EnrichmentContext) -> AsyncIterator[tuple[str, Dict[str, Any]]]:
+    """
+    Отдаёт группы полей по мере их готовности: (имя группы, поля группы).
+    Если итерацию прервали (например, клиент отключился), незавершённые запросы отменяются.
+    """
+    async def build(group: str) -> tuple[str, Dict[str, Any]]:
+        return group, await build_enriched_group(ctx, group)
+
+    ctx.prefetch()
+    tasks = [asyncio.create_task(build(group)) for group in ctx.groups]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        ctx.cancel()
 
-    valid_additional_diagnosis = await _fetch_and_process_additional_diagnosis(cookies, http_service, referred_data)
-
-    referred_organization = await get_referred_organization(cookies, http_service, referred_data)
-    disease_data = await fetch_disease_data(cookies, http_service, movement_data)
-
-    department_name = await get_department_name(started_data)
-    department_code = await get_department_code(department_name)
-
-    bed_profile_code, corrected_bed_profile_name = await get_bed_profile_code(movement_data, department_name)
-    medical_care_profile = await get_medical_care_profile(movement_data, corrected_bed_profile_name)
-
-
-    polis_number = person_data.get("Person_EdNum", "")
-    person_birthday = started_data.get("Person_Birthday", "")
-    gender = person_data.get("Sex_Name", "")
-
-    admission_date = started_data.get("EvnPS_setDate")
-    direction_date = await get_direction_date(admission_date)
-    discharge_date = started_data.get("EvnPS_disDate")
-
-    medical_care_conditions = await get_medical_care_condition(department_name)
-    medical_care_form = await get_medical_care_form(referred_data)
-
-
-    outcome_code = await get_outcome_code(disease_data)
-    disease_type_code = await get_disease_type_code(disease_data)
-
-    # todo: подумать, может быть отдельная функция для этого? посмотрим.
-    # Обрабатываем случай, когда в ЕВМИАС не указан исход заболевания.
-    # если условия оказания медицинской помощи 1 (круглосуточный стационар),
-    # то код исхода заболевания должен начинаться с 1xx (см. справочники https://nsi.ffoms.ru/ [V006, V019])
-    if medical_care_conditions == "1" and outcome_code == 202:
-        outcome_code = "102"
-
-    diag_code = movement_data.get("Diag_Code", "")
-    card_number = started_data.get("EvnPS_NumCard", "").split(" ")[0]
-    treatment_outcome_code = movement_data.get("LeaveType_Code")
-
-    enriched_data = {
-        "input[name='ReferralHospitalizationNumberTicket']": "б/н",
-        "input[name='ReferralHospitalizationDateTicket']": direction_date,
-        "input[name='ReferralHospitalizationMedIndications']": "001",
-        "input[name='Enp']": polis_number,
-        "input[name='DateBirth']": person_birthday,
-        "input[name='Gender']": gender,
-        "input[name='TreatmentDateStart']": admission_date,
-        "input[name='TreatmentDateEnd']": discharge_date,
-        "input[name='VidMpV008']": "31",
-        "input[name='HospitalizationInfoV006']": medical_care_conditions,
-        "input[name='HospitalizationInfoV014']": medical_care_form,
-        "input[name='HospitalizationInfoSpecializedMedicalProfile']": medical_care_profile,
-        "input[name='HospitalizationInfoSubdivision']": "Стационар",
-        "input[name='HospitalizationInfoNameDepartment']": department_name,
-        "input[name='HospitalizationInfoOfficeCode']": department_code,
-        "input[name='HospitalizationInfoV020']": bed_profile_code,
-        "input[name='HospitalizationInfoDiagnosisMainDisease']": diag_code,
-        "input[name='CardNumber']": card_number,
-        "input[name='ResultV009']": treatment_outcome_code,
-        "input[name='IshodV012']": outcome_code,
-        "input[name='HospitalizationInfoC_ZABV027']": disease_type_code,
-        "input[name='ReferralHospitalizationSendingDepartment']": referred_organization,
-        "additional_diagnosis_data": valid_additional_diagnosis,
-        "medical_service_data": medical_service_data,
-        "discharge_summary": pure_discharge_summary,
-    }
 
+def _format_sse_event(event: str, data: Any) -> str:
+    """Форматирует одно событие Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def enrich_data_with_failures(
+        enrich_request: EnrichmentRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+) -> tuple[Dict[str, Any], set[str]]:
+    """
+    Обогащает данные случая. Возвращает поля и источники, завершившиеся с ошибкой (их поля получили
+    значения по умолчанию) - по ним вызывающий решает, можно ли сохранять результат.
+    """
+    logger.info(f"Запрос на обогащение получен.")
+
+    ctx = EnrichmentContext(enrich_request.started_data, cookies, http_service, enrich_request.fields)
+    logger.debug(f"Извлечены данные: person_id={ctx.person_id}, event_id={ctx.event_id}")
+
+    ctx.prefetch()
+    try:
+        groups = await asyncio.gather(*(build_enriched_group(ctx, group) for group in ctx.groups))
+    finally:
+        ctx.cancel()
+
+    return assemble_enriched_data(groups), ctx.failed_sources
+
+
+async def enrich_data(
+        enrich_request: EnrichmentRequestData,
+        cookies: Annotated[dict[str, str], Depends(set_cookies)],
+        http_service: Annotated[HTTPXClient, Depends(get_http_service)],
+        require_complete: bool = False,
+) -> Dict[str, Any]:
+    """
+    Обогащает данные случая. С require_complete=True ошибка любого источника (например, временный
+    сбой ЕВМИАС) приводит к исключению, а не к полям со значениями по умолчанию.
+    """
+    enriched_data, failed_sources = await enrich_data_with_failures(enrich_request, cookies, http_service)
+    if require_complete and failed_sources:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Не получены данные из ЕВМИАС: {', '.join(sorted(failed_sources))}"
+        )
     return enriched_data
+
+
+async def stream_enriched_data(
+        enrich_request: EnrichmentRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient
+) -> AsyncIterator[str]:
+    """
+    Потоковое обогащение: отдаёт события SSE по группам полей по мере их готовности.
+    Имя события - имя группы (см. ENRICHMENT_GROUPS), данные - поля группы в формате JSON.
+    Последним отправляется событие 'done'.
+    """
+    logger.info(f"Запрос на потоковое обогащение получен.")
+
+    ctx = EnrichmentContext(enrich_request.started_data, cookies, http_service, enrich_request.fields)
+    async for group, fields in iter_enriched_groups(ctx):
+        logger.debug(f"event_id: {ctx.event_id}, группа '{group}' готова")
+        yield _format_sse_event(group, fields)
+
+    yield _format_sse_event("done", {"groups": list(ctx.groups)})
@@ -0,0 +1,89 @@
+"""
+Сокращённые строки результатов поиска и дескрипторы (handle) полных строк.
+
+Расширению отдаются только поля для отображения и непрозрачный дескриптор. Полная строка ЕВМИАС
+хранится в Redis под этим дескриптором SEARCH_HANDLE_TTL секунд, и для обогащения расширение
+присылает только дескриптор. Дескриптор - хэш содержимого строки, поэтому повторный поиск
+перезаписывает тот же ключ, а не плодит новые.
+"""
+import hashlib
+import json
+from typing import List, Dict, Any
+
+import redis.asyncio as redis
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+
+from app.core import get_settings, logger
+from app.model import EnrichmentRequestData
+from app.service.cache.cache import load_json
+
+settings = get_settings()
+
+HANDLE_KEY_PREFIX = "search:row:"
+
+# Поля строки поиска, которые нужны расширению для отображения списка
+SLIM_FIELDS = (
+    "EvnPS_id",
+    "Person_Surname",
+    "Person_Firname",
+    "Person_Secname",
+    "Person_Birthday",
+    "EvnPS_NumCard",
+    "EvnPS_setDate",
+    "EvnPS_disDate",
+    "LpuSection_Name",
+)
+
+
+def _row_handle(row_json: str) -> str:
+    return hashlib.sha256(row_json.encode("utf-8")).hexdigest()[:32]
+
+
+async def slim_search_rows(redis_client: redis.Redis, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Сохраняет полные строки поиска в Redis и возвращает сокращённые строки с ключом 'handle'.
+    Если Redis недоступен, возвращает полные строки без дескрипторов.
+    """
+    if not rows:
+        return rows
+
+    serialized = [json.dumps(row, ensure_ascii=False, sort_keys=True) for row in rows]
+    handles = [_row_handle(row_json) for row_json in serialized]
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for handle, row_json in zip(handles, serialized):
+                pipe.set(f"{HANDLE_KEY_PREFIX}{handle}", row_json, ex=settings.SEARCH_HANDLE_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        logger.error(f"Не удалось сохранить строки поиска в Redis, отдаём полные строки: {e}")
+        return rows
+
+    return [
+        {**{field: row.get(field) for field in SLIM_FIELDS}, "handle": handle}
+        for row, handle in zip(rows, handles)
+    ]
+
+
+async def resolve_enrichment_request(
+        redis_client: redis.Redis,
+        enrich_request: EnrichmentRequestData,
+) -> EnrichmentRequestData:
+    """
+    Подставляет в запрос на обогащение полную строку поиска по дескриптору. Дескриптор берётся
+    из поля handle или из started_data (сокращённая строка от старых версий расширения).
+    Запрос с полной строкой без дескриптора возвращается как есть.
+    """
+    started_data = enrich_request.started_data or {}
+    handle = enrich_request.handle or started_data.get("handle")
+    if not handle:
+        return enrich_request
+
+    row = await load_json(redis_client, f"{HANDLE_KEY_PREFIX}{handle}")
+    if not isinstance(row, dict):
+        logger.warning(f"Дескриптор строки поиска '{handle}' не найден или истёк")
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Результаты поиска устарели, выполните поиск заново"
+        )
+    return enrich_request.model_copy(update={"started_data": row, "handle": handle})
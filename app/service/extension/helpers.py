@@ -1,30 +1,37 @@
-import re
 from datetime import datetime, timedelta
 from typing import Any, Tuple
 
 from app.core import logger, get_settings
-from app.mapper import (
-    bed_profiles,
-    disease_outcome_ids,
-    medical_orgs,
-    department_codes,
-    medical_care_profile,
-    bed_profile_correction_rules,
-    medical_care_profile_correction_rules,
-)
 from app.service import fetch_referred_org_by_id
+from app.service.reference.evmias_sync import get_synced_reference
+from app.service.reference.icd import compile_icd_rules, match_icd
+from app.service.reference.mapping_rules import (
+    correct_outcome_code,
+    department_by_name,
+    disease_type_code,
+    medical_care_form_code,
+    medical_care_profile_correction,
+    resolve_department,
+)
+from app.service.reference.medical_orgs import find_medical_org
+from app.service.reference.store import get_reference
 
 settings = get_settings()
 
+# Функции map_* - сопоставление по значениям полей без обращения к ЕВМИАС. Их вызывают и функции get_*
+# для одного случая, и пакетное сопоставление (batch_mapper.py) для уникальных значений столбцов.
+
+# Дополнительные диагнозы, которые передаются в форму: сахарный диабет (E10, E11)
+# и злокачественные новообразования (Cxx)
+ADDITIONAL_DIAGNOSIS_INDEX = compile_icd_rules([(["E10-E11", "C"], True)])
+
 
 async def get_medical_care_condition(lpu_section_name: str) -> str:
     """
     Определяет код условия оказания медицинской помощи, в зависимости от отделения
     """
-    inpatient_care = "1"
-    day_hospital_care = "2"
     logger.debug(f"Определяем условия оказания медицинской помощи. Отделение: {lpu_section_name}")
-    return day_hospital_care if lpu_section_name == "Дневной стационар" else inpatient_care
+    return department_by_name(lpu_section_name)["medical_care_conditions"]
 
 
 async def get_direction_date(admission_date: str) -> str | None:
@@ -32,6 +39,11 @@ async def get_direction_date(admission_date: str) -> str | None:
     Вычисляет дату направления на госпитализацию, в зависимости от даты госпитализации.
     Это должны быть пн, ср или пт. до даты госпитализации.
     """
+    return map_direction_date(admission_date)
+
+
+def map_direction_date(admission_date: str) -> str | None:
+    """Дата направления на госпитализацию (пн, ср или пт до даты госпитализации)."""
     try:
         admission_date = datetime.strptime(admission_date, "%d.%m.%Y")
     except ValueError:
@@ -69,9 +81,9 @@ async def get_referred_organization(cookies, http_service, data: dict) -> str |
         if not org_name:
             return None
 
-        org_data = medical_orgs.get(org_name)
+        # ИНН и ОГРН уточняют поиск, если ЕВМИАС их вернул
+        org_data = find_medical_org(org_name, inn=org_info.get("Org_INN"), ogrn=org_info.get("Org_OGRN"))
         if not org_data:
-            logger.warning(f"Организация '{org_name}' не найдена в справочнике организаций")
             return None
 
         return org_data.get("registry_code")
@@ -86,25 +98,9 @@ async def get_department_name(data: dict) -> str | None:
     """
     Возвращает нормализованное название отделения госпитализации
     """
-    raw_name = data.get("LpuSection_Name", "")
-    name = raw_name.strip()
-    if not name:
-        return None
-
-    if name.startswith("ДС"):
-        return "Дневной стационар"
-
-    name = name.replace(" стационар ММЦ", "").replace(" ММЦ", "")
-
-    replacements = {
-        "Травматолого-ортопедическое отделение": "Травматология",
-        "Отделение реабилитации и восстановительного лечения": "Отделение реабилитации",
-        "Неврологическое отделение": "Неврология",
-        "Гастроэнтерологическое отделение": "Гастроэнтерология",
-        "Терапевтическое отделение": "Отделение терапии",
-    }
-    logger.debug(f"название отделения: {replacements.get(name, name)}")
-    return replacements.get(name, name)
+    name = resolve_department(data.get("LpuSection_Name"))["name"]
+    logger.debug(f"название отделения: {name}")
+    return name
 
 
 async def get_department_code(department_name: str) -> str | None:
@@ -114,7 +110,7 @@ async def get_department_code(department_name: str) -> str | None:
     if not department_name:
         logger.warning("Не передано название отделения")
         return None
-    code = department_codes.get(department_name)
+    code = department_by_name(department_name)["code"]
     if code is None:
         logger.warning(f"Не найден код для отделения: {department_name}")
     return code
@@ -124,24 +120,20 @@ async def get_medical_care_form(data: dict) -> str | None:
     """
     Определяет код формы оказания медицинской помощи, в зависимости от типа госпитализации
     """
-    scheduled_hospitalization_code = "3"
-    emergency_hospitalization_code = "1"
-
     raw_medical_care_form_id = data.get('PrehospType_id')
     if raw_medical_care_form_id is None:
         logger.warning("Не найден PrehospDirect_id в данных")
         return None
 
-    medical_care_form_id = str(raw_medical_care_form_id)
-    logger.debug(f"Определяем код формы медицинской помощи. evmias_id: {medical_care_form_id}")
+    logger.debug(f"Определяем код формы медицинской помощи. evmias_id: {raw_medical_care_form_id}")
+    return map_medical_care_form(raw_medical_care_form_id)
 
-    match medical_care_form_id:
-        case "2":
-            return scheduled_hospitalization_code
-        case "1" | "3":
-            return emergency_hospitalization_code
-        case _:
-            return None
+
+def map_medical_care_form(medical_care_form_id: Any) -> str | None:
+    """Код формы оказания медицинской помощи по PrehospType_id."""
+    if medical_care_form_id is None:
+        return None
+    return medical_care_form_code(str(medical_care_form_id))
 
 
 async def get_medical_care_profile(data: dict, corrected_bed_profile_name: str | None = None) -> str | None:
@@ -149,14 +141,19 @@ async def get_medical_care_profile(data: dict, corrected_bed_profile_name: str |
     Определяет код профиля оказания медицинской помощи.
     Сначала проверяет, есть ли правило коррекции на основе профиля койки.
     """
+    return map_medical_care_profile(data.get('LpuSectionProfile_Name'), corrected_bed_profile_name)
+
+
+def map_medical_care_profile(raw_name: Any, corrected_bed_profile_name: str | None = None) -> str | None:
+    """Код профиля медицинской помощи по LpuSectionProfile_Name с учётом правила коррекции по профилю койки."""
     if corrected_bed_profile_name:
-        target_profile_key = medical_care_profile_correction_rules.get(corrected_bed_profile_name)
+        target_profile_key = medical_care_profile_correction(corrected_bed_profile_name)
         if target_profile_key:
             logger.info(
                 f"Применяется правило коррекции: профиль койки '{corrected_bed_profile_name}' "
                 f"требует профиль медпомощи '{target_profile_key}'."
             )
-            profile_data = medical_care_profile.get(target_profile_key)
+            profile_data = get_reference("medical_care_profile").get(target_profile_key)
             if profile_data and profile_data.get("Code"):
                 return profile_data.get("Code")
             else:
@@ -165,13 +162,12 @@ async def get_medical_care_profile(data: dict, corrected_bed_profile_name: str |
                     f"отсутствует или некорректен в справочнике medical_care_profile."
                 )
 
-    raw_name = data.get('LpuSectionProfile_Name')
     if not raw_name:
         logger.warning("Профиль медицинской помощи не указан.")
         return None
 
     profile_key = str(raw_name).lower().strip()
-    profile = medical_care_profile.get(profile_key)
+    profile = get_reference("medical_care_profile").get(profile_key)
     if not profile:
         logger.warning(f"Профиль '{raw_name}' не найден в справочнике.")
         return None
@@ -195,25 +191,29 @@ async def get_bed_profile_code(movement_data: dict, department_name: str) -> Tup
     if not bed_profile_name:
         logger.warning(f"Не найден профиль койки для person_id: {movement_data.get('Person_id')},")
         return None, None
+    return map_bed_profile(bed_profile_name, diag_code, department_name)
+
+
+def map_bed_profile(
+        bed_profile_name: Any,
+        diag_code: Any,
+        department_name: str | None,
+) -> Tuple[str | None, str | None]:
+    """Код профиля койки и итоговое название профиля (после коррекции по диагнозу и отделению)."""
+    if not bed_profile_name:
+        return None, None
 
     # При необходимости корректируем название профиля койки в соответствии
     # с правилами основными на коде диагноза и имени отделения
-    if department_name in [
-        "Отделение реабилитации",
-        "Хирургическое отделение №1",
-        "Хирургическое отделение №2",
-        "Дневной стационар",
-        "Неврология",
-    ]:
-        for rule in bed_profile_correction_rules[department_name]:
-            if diag_code and rule["pattern"].match(diag_code):
-                original_name = bed_profile_name
-                bed_profile_name = rule["replacement"]
-                logger.info(
-                    f"Скорректирован профиль койки для диагноза {diag_code}: с {original_name} на {bed_profile_name}"
-                )
-
-    bed_profile_id = bed_profiles.get(bed_profile_name)
+    replacement = match_icd(department_by_name(department_name)["bed_profile_rules"], diag_code)
+    if replacement:
+        original_name = bed_profile_name
+        bed_profile_name = replacement
+        logger.info(
+            f"Скорректирован профиль койки для диагноза {diag_code}: с {original_name} на {bed_profile_name}"
+        )
+
+    bed_profile_id = get_reference("bed_profiles").get(bed_profile_name)
     if not bed_profile_id:
         logger.warning(f"Не найден код профиля койки для: {bed_profile_name}")
         return None, bed_profile_name
@@ -226,8 +226,14 @@ async def get_outcome_code(disease_data: dict) -> str | None:
     """
     Определяет код исхода лечения
     """
-    outcome_code_evmias = disease_data.get("ResultDesease_id")
-    outcome_entry = disease_outcome_ids.get(outcome_code_evmias)
+    return map_outcome_code(disease_data.get("ResultDesease_id"))
+
+
+def map_outcome_code(outcome_code_evmias: Any) -> str | None:
+    """Код исхода лечения по ResultDesease_id."""
+    outcome_entry = get_synced_reference("disease_outcome_ids").get(
+        str(outcome_code_evmias) if outcome_code_evmias is not None else None
+    )
 
     if not outcome_entry:
         logger.warning(f"Не найден исход заболевания для evmias_id: {outcome_code_evmias}")
@@ -242,23 +248,32 @@ async def get_disease_type_code(disease_data: dict) -> str | None:
     """
     Определят код характера основного заболевания
     """
-    acute = "1"  # острое заболевание
-    new_chronic = "2"  # впервые в жизни выявленное хроническое заболевание
-    known_chronic = "3"  # ранее установленное хроническое заболевание
+    desease_type_id = disease_data.get("DeseaseType_id")
+    logger.debug(f"Определяем код характера основного заболевания. evmias_id: {desease_type_id}")
+    return map_disease_type_code(desease_type_id)
+
+
+def map_disease_type_code(desease_type_id: Any) -> str | None:
+    """Код характера основного заболевания по DeseaseType_id."""
+    return disease_type_code(desease_type_id) if desease_type_id else None
+
+
+async def get_corrected_outcome_code(outcome_code: Any, medical_care_conditions: str | None) -> Any:
+    """
+    Корректирует код исхода лечения по условиям оказания медицинской помощи.
+    Например, если в ЕВМИАС не указан исход, а помощь оказана в круглосуточном стационаре (1),
+    код исхода должен начинаться с 1xx (см. справочники https://nsi.ffoms.ru/ [V006, V019])
+    """
+    return map_corrected_outcome_code(outcome_code, medical_care_conditions)
 
-    disease_type_code = disease_data.get("DeseaseType_id")
-    logger.debug(f"Определяем код характера основного заболевания. evmias_id: {disease_type_code}")
 
-    if disease_type_code:
-        match disease_type_code:
-            case "1":
-                return new_chronic
-            case "2":
-                return known_chronic
-            case "3":
-                return acute
-            case _:
-                return None
+def map_corrected_outcome_code(outcome_code: Any, medical_care_conditions: str | None) -> Any:
+    """Код исхода лечения, скорректированный по условиям оказания медицинской помощи."""
+    corrected = correct_outcome_code(outcome_code, medical_care_conditions)
+    if corrected != outcome_code:
+        logger.debug(f"Скорректирован код исхода лечения для условий {medical_care_conditions}: "
+                     f"с {outcome_code} на {corrected}")
+    return corrected
 
 
 async def get_valid_additional_diagnosis(data: list) -> list[dict[str, str | Any]]:
@@ -272,17 +287,13 @@ async def get_valid_additional_diagnosis(data: list) -> list[dict[str, str | Any
     if not data:
         return []
 
-    # ^(...|...)$ - ищет соответствие одному из шаблонов от начала до конца строки
-    # E(10|11)\.\d - шаблон для диабета (например, E10.1, E11.9)
-    # C\d{2}\.\d   - шаблон для онкологии (например, C50.1, C18.7)
-    diagnosis_pattern = re.compile(r"^(E(10|11)\.\d|C\d{2}\.\d)$")
     valid_diagnosis = []
 
     for entry in data:
         diagnosis_code = entry.get("code")
         diagnosis_name = entry.get("name")
 
-        if isinstance(diagnosis_code, str) and diagnosis_pattern.match(diagnosis_code):
+        if isinstance(diagnosis_code, str) and match_icd(ADDITIONAL_DIAGNOSIS_INDEX, diagnosis_code, False):
             valid_diagnosis.append({'code': diagnosis_code, 'name': diagnosis_name})
 
     return valid_diagnosis
@@ -0,0 +1,166 @@
+"""
+Идемпотентное обогащение: повторные и одновременные запросы на обогащение одного и того же случая
+(двойной клик по "Выбрать", повтор после сетевой ошибки) не запускают новый набор запросов к ЕВМИАС,
+а присоединяются к уже идущему вычислению и получают тот же результат.
+
+Внутри воркера одинаковые запросы ждут одну и ту же задачу. Между воркерами вычисление
+закрепляется блокировкой в Redis, а результат хранится там же IDEMPOTENCY_RESULT_TTL секунд.
+Неполный результат (часть запросов к ЕВМИАС завершилась с ошибкой) получают только уже ожидающие
+его запросы, в Redis он не сохраняется: повтор после ошибки вычисляет случай заново.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, Awaitable, Callable, Collection
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core import get_settings, logger
+from app.model import EnrichmentRequestData
+from app.service.cache.cache import load_json, save_json
+
+settings = get_settings()
+
+RESULT_KEY_PREFIX = "enrich:result:"
+LOCK_KEY_PREFIX = "enrich:inflight:"
+LOCK_TTL = 120  # секунды, с запасом на самое долгое обогащение
+POLL_INTERVAL = 0.2  # секунды
+
+# Вычисление: результат и источники, завершившиеся с ошибкой (пусто - результат полный)
+Compute = Callable[[], Awaitable[tuple[Dict[str, Any], Collection[str]]]]
+
+# Вычисления, идущие в этом воркере, по ключу идемпотентности
+_inflight: dict[str, asyncio.Task] = {}
+# Сколько запросов ждут каждое из вычислений
+_waiters: dict[asyncio.Task, int] = {}
+
+
+def enrichment_idempotency_key(enrich_request: EnrichmentRequestData, client_key: str | None = None) -> str:
+    """
+    Возвращает ключ идемпотентности запроса на обогащение: EvnPS_id и хэш содержимого запроса,
+    с ключом клиента (заголовок Idempotency-Key) впереди, если он передан. Поэтому ключ клиента,
+    повторно использованный для другого случая или других полей, не вернёт чужой результат.
+    """
+    payload = json.dumps(
+        {"started_data": enrich_request.started_data, "fields": enrich_request.fields},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    payload_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    key = f"{enrich_request.started_data.get('EvnPS_id')}:{payload_hash}"
+    return f"client:{client_key}:{key}" if client_key else key
+
+
+async def load_idempotent_result(redis_client: redis.Redis, key: str) -> Dict[str, Any] | None:
+    """Возвращает недавний результат вычисления по ключу идемпотентности или None."""
+    return await load_json(redis_client, f"{RESULT_KEY_PREFIX}{key}")
+
+
+async def _compute_and_store(
+        redis_client: redis.Redis,
+        key: str,
+        compute: Compute,
+) -> Dict[str, Any]:
+    try:
+        result, failed_sources = await compute()
+        if failed_sources:
+            logger.warning(f"Обогащение '{key}': результат неполный (ошибки источников: "
+                           f"{', '.join(sorted(failed_sources))}), не сохраняется")
+        else:
+            await save_json(redis_client, f"{RESULT_KEY_PREFIX}{key}", result, settings.IDEMPOTENCY_RESULT_TTL)
+        return result
+    finally:
+        try:
+            await redis_client.delete(f"{LOCK_KEY_PREFIX}{key}")
+        except RedisError as e:
+            logger.error(f"Не удалось снять блокировку обогащения '{key}': {e}")
+
+
+async def _wait_for_other_worker(redis_client: redis.Redis, key: str) -> Dict[str, Any] | None:
+    """
+    Ждёт результат вычисления, идущего в другом воркере.
+    Возвращает None, если вычисление завершилось без результата (ошибка) или не уложилось в LOCK_TTL.
+    """
+    deadline = time.monotonic() + LOCK_TTL
+    while time.monotonic() < deadline:
+        await asyncio.sleep(POLL_INTERVAL)
+        result = await load_json(redis_client, f"{RESULT_KEY_PREFIX}{key}")
+        if result is not None:
+            return result
+        try:
+            if not await redis_client.exists(f"{LOCK_KEY_PREFIX}{key}"):
+                return None
+        except RedisError as e:
+            logger.error(f"Не удалось проверить блокировку обогащения '{key}': {e}")
+            return None
+    return None
+
+
+async def _join_or_compute(
+        redis_client: redis.Redis,
+        key: str,
+        compute: Compute,
+) -> Dict[str, Any]:
+    """Вычисляет результат, если блокировка досталась этому воркеру, иначе ждёт результат другого воркера."""
+    try:
+        locked = await redis_client.set(f"{LOCK_KEY_PREFIX}{key}", os.getpid(), nx=True, ex=LOCK_TTL)
+    except RedisError as e:
+        logger.error(f"Не удалось получить блокировку обогащения '{key}', вычисляем без неё: {e}")
+        result, _ = await compute()
+        return result
+    if locked:
+        return await _compute_and_store(redis_client, key, compute)
+
+    logger.info(f"Обогащение '{key}': ждём результат вычисления в другом воркере")
+    result = await _wait_for_other_worker(redis_client, key)
+    if result is not None:
+        return result
+
+    logger.warning(f"Обогащение '{key}': результат другого воркера не получен, вычисляем сами")
+    result, _ = await compute()
+    return result
+
+
+def _forget_inflight(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+async def run_idempotent(
+        redis_client: redis.Redis,
+        key: str,
+        compute: Compute,
+) -> Dict[str, Any]:
+    """
+    Выполняет compute не более одного раза для одновременных запросов с одинаковым ключом.
+    Недавно полученный полный результат отдаётся без повторного вычисления.
+    """
+    result = await load_json(redis_client, f"{RESULT_KEY_PREFIX}{key}")
+    if result is not None:
+        logger.info(f"Обогащение '{key}': отдан недавний результат")
+        return result
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_join_or_compute(redis_client, key, compute))
+        _inflight[key] = task
+        task.add_done_callback(lambda done_task: _forget_inflight(key, done_task))
+    else:
+        logger.info(f"Обогащение '{key}': присоединяемся к вычислению в этом воркере")
+
+    # shield: уход одного из ожидающих не отменяет вычисление, нужное остальным.
+    # Если ушёл последний ожидающий, вычисление больше никому не нужно и отменяется.
+    _waiters[task] = _waiters.get(task, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _waiters[task] -= 1
+        if not _waiters[task]:
+            del _waiters[task]
+            if not task.done():
+                logger.info(f"Обогащение '{key}': ожидающих не осталось, вычисление отменено")
+                task.cancel()
@@ -0,0 +1,121 @@
+"""
+Обогащение с ограничением по времени (budget_ms).
+
+Возвращает поля, готовые к истечению бюджета, и токен продолжения. Оставшиеся группы полей
+досчитываются в фоне и сохраняются в Redis, откуда их забирает запрос GET /extension/enrich-data/{token}
+(в том числе на другом воркере).
+"""
+import asyncio
+import time
+import uuid
+from typing import Dict, Any
+
+import redis.asyncio as redis
+
+from app.core import HTTPXClient, get_settings, logger
+from app.model import EnrichmentRequestData
+from app.service.cache.cache import load_json, save_json
+from app.service.extension.enrich import (
+    EnrichmentContext,
+    build_enriched_group,
+    enriched_field_keys,
+    assemble_enriched_data,
+)
+
+settings = get_settings()
+
+PENDING_KEY_PREFIX = "enrich:pending:"
+PENDING_POLL_INTERVAL = 0.25  # секунды
+
+# Ссылки на фоновые задачи, чтобы их не собрал сборщик мусора до завершения
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _pending_key(token: str) -> str:
+    return f"{PENDING_KEY_PREFIX}{token}"
+
+
+async def _complete_pending_groups(
+        token: str,
+        ctx: EnrichmentContext,
+        pending: dict[asyncio.Task, str],
+        redis_client: redis.Redis,
+) -> None:
+    """Дожидается оставшихся групп полей и сохраняет их в Redis под токеном продолжения."""
+    try:
+        groups = await asyncio.gather(*pending)
+        payload = {"status": "ready", "data": assemble_enriched_data(groups)}
+        logger.info(f"event_id: {ctx.event_id}, дозагружены группы {list(pending.values())} (токен {token})")
+    except Exception as e:
+        logger.exception(f"event_id: {ctx.event_id}, ошибка дозагрузки по токену {token}: {e}")
+        payload = {"status": "failed", "groups": list(pending.values())}
+    finally:
+        ctx.cancel()
+
+    await save_json(redis_client, _pending_key(token), payload, settings.ENRICH_PENDING_TTL)
+
+
+async def enrich_data_within_budget(
+        enrich_request: EnrichmentRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        budget_ms: int,
+) -> Dict[str, Any]:
+    """
+    Обогащает данные, но ждёт не дольше budget_ms.
+    Если к этому времени готовы не все группы, в ответ добавляется ключ 'pending'
+    с токеном продолжения и списком ещё не готовых групп и полей.
+    """
+    logger.info(f"Запрос на обогащение с бюджетом {budget_ms} мс получен.")
+
+    ctx = EnrichmentContext(enrich_request.started_data, cookies, http_service, enrich_request.fields)
+    ctx.prefetch()
+    tasks = {asyncio.create_task(build_enriched_group(ctx, group)): group for group in ctx.groups}
+
+    try:
+        done, not_done = await asyncio.wait(tasks, timeout=budget_ms / 1000)
+    except asyncio.CancelledError:
+        # asyncio.wait не отменяет ожидаемые задачи сам
+        for task in tasks:
+            task.cancel()
+        ctx.cancel()
+        raise
+    enriched_data = assemble_enriched_data([task.result() for task in done])
+
+    if not not_done:
+        ctx.cancel()
+        return enriched_data
+
+    token = uuid.uuid4().hex
+    pending = {task: tasks[task] for task in not_done}
+    pending_groups = [group for group in ctx.groups if group in pending.values()]
+
+    await save_json(
+        redis_client, _pending_key(token), {"status": "pending", "groups": pending_groups}, settings.ENRICH_PENDING_TTL
+    )
+    background_task = asyncio.create_task(_complete_pending_groups(token, ctx, pending, redis_client))
+    _background_tasks.add(background_task)
+    background_task.add_done_callback(_background_tasks.discard)
+
+    logger.info(f"event_id: {ctx.event_id}, бюджет исчерпан, группы {pending_groups} отложены (токен {token})")
+    enriched_data["pending"] = {
+        "token": token,
+        "groups": pending_groups,
+        "fields": enriched_field_keys(pending_groups, ctx.fields),
+    }
+    return enriched_data
+
+
+async def get_pending_enrichment(redis_client: redis.Redis, token: str) -> Dict[str, Any] | None:
+    """
+    Ждёт (не дольше ENRICH_PENDING_WAIT) и возвращает состояние продолжения по токену:
+    {"status": "ready", "data": {...}}, {"status": "pending" | "failed", "groups": [...]}
+    или None, если токен неизвестен или истёк.
+    """
+    deadline = time.monotonic() + settings.ENRICH_PENDING_WAIT
+    while True:
+        state = await load_json(redis_client, _pending_key(token))
+        if state is None or state.get("status") != "pending" or time.monotonic() >= deadline:
+            return state
+        await asyncio.sleep(PENDING_POLL_INTERVAL)
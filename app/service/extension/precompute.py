@@ -0,0 +1,182 @@
+"""
+Фоновая предварительная подготовка обогащённых данных для недавно выписанных пациентов.
+
+Раз в сутки (в час PRECOMPUTE_HOUR) один из воркеров находит госпитализации, выписанные за последние
+PRECOMPUTE_WINDOW_DAYS дней, и обогащает их с малой параллельностью, чтобы не нагружать ЕВМИАС.
+Результаты хранятся в Redis по EvnPS_id, и днём /extension/enrich-data для этих случаев
+отвечает из кэша. Уже подготовленные случаи пропускаются, поэтому прерванный запуск
+можно просто повторить - он продолжит с места остановки.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+
+from app.core import HTTPXClient, get_settings, logger
+from app.model import EnrichmentRequestData
+from app.service.cache.cache import load_json, save_json
+from app.service.cookie.cookie import set_cookies
+from app.service.extension.enrich import enrich_data, select_enriched_fields
+from app.service.extension.started import search_hospitalizations
+
+settings = get_settings()
+
+PREPARED_KEY_PREFIX = "enrich:prepared:"
+LAST_RUN_KEY = "precompute:last_run"
+LOCK_KEY = "precompute:lock"
+LOCK_TTL = 3 * 60 * 60  # секунды, с запасом на самый долгий запуск
+STATS_TTL = 30 * 24 * 60 * 60  # секунды
+
+
+def _prepared_key(event_id: str) -> str:
+    return f"{PREPARED_KEY_PREFIX}{event_id}"
+
+
+async def load_prepared_enrichment(
+        redis_client: redis.Redis,
+        enrich_request: EnrichmentRequestData
+) -> Dict[str, Any] | None:
+    """
+    Возвращает заранее подготовленные обогащённые данные для случая (только запрошенные поля)
+    или None, если случай не подготовлен.
+    """
+    event_id = enrich_request.started_data.get("EvnPS_id")
+    if not event_id:
+        return None
+
+    prepared = await load_json(redis_client, _prepared_key(event_id))
+    if not isinstance(prepared, dict):
+        return None
+
+    logger.info(f"event_id: {event_id}, обогащённые данные взяты из предварительно подготовленных")
+    fields = select_enriched_fields(enrich_request.fields)
+    return {key: value for key, value in prepared.items() if key in fields}
+
+
+async def _prepare_case(
+        row: Dict[str, Any],
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        semaphore: asyncio.Semaphore,
+        stats: Dict[str, Any],
+) -> None:
+    event_id = row.get("EvnPS_id")
+    if not event_id or not row.get("EvnPS_disDate"):
+        return
+
+    if await redis_client.exists(_prepared_key(event_id)):
+        stats["skipped"] += 1
+        return
+
+    async with semaphore:
+        try:
+            # Неполные данные (сбой ЕВМИАС) не сохраняются: их отдавали бы вместо живого обогащения
+            enriched_data = await enrich_data(
+                EnrichmentRequestData(started_data=row), cookies, http_service, require_complete=True
+            )
+        except Exception as e:
+            logger.warning(f"Предподготовка: не удалось обогатить event_id {event_id}: {e}")
+            stats["failed"] += 1
+            return
+
+    if await save_json(redis_client, _prepared_key(event_id), enriched_data, settings.PRECOMPUTE_TTL):
+        stats["prepared"] += 1
+    else:
+        stats["failed"] += 1
+
+
+async def prepare_cases(
+        rows: list[Dict[str, Any]],
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        stats: Dict[str, Any],
+) -> None:
+    """
+    Обогащает случаи (не более PRECOMPUTE_CONCURRENCY одновременно) и сохраняет результаты как подготовленные.
+    Уже подготовленные случаи пропускаются. Счётчики prepared, skipped и failed увеличиваются в stats.
+    """
+    semaphore = asyncio.Semaphore(settings.PRECOMPUTE_CONCURRENCY)
+    await asyncio.gather(*(
+        _prepare_case(row, cookies, http_service, redis_client, semaphore, stats) for row in rows
+    ))
+
+
+async def run_precompute(http_service: HTTPXClient, redis_client: redis.Redis) -> Dict[str, Any] | None:
+    """
+    Выполняет один запуск предварительной подготовки. Возвращает статистику запуска
+    или None, если запуск уже выполняется на другом воркере.
+    """
+    if not await redis_client.set(LOCK_KEY, os.getpid(), nx=True, ex=LOCK_TTL):
+        logger.info("Предподготовка уже выполняется другим воркером, пропускаем.")
+        return None
+
+    started_at = datetime.now()
+    start_time = time.perf_counter()
+    date_from = started_at - timedelta(days=settings.PRECOMPUTE_WINDOW_DAYS)
+    dis_date_range = f"{date_from.strftime('%d.%m.%Y')} - {started_at.strftime('%d.%m.%Y')}"
+    stats = {"started_at": started_at.isoformat(timespec="seconds"), "range": dis_date_range,
+             "found": 0, "prepared": 0, "skipped": 0, "failed": 0}
+
+    try:
+        logger.info(f"Предподготовка обогащённых данных за период {dis_date_range} начата.")
+        cookies = await set_cookies(http_service=http_service, redis_client=redis_client)
+        rows = await search_hospitalizations(cookies, http_service, dis_date_range)
+        stats["found"] = len(rows)
+
+        await prepare_cases(rows, cookies, http_service, redis_client, stats)
+    except Exception as e:
+        logger.error(f"Предподготовка прервана ошибкой: {e}", exc_info=True)
+        stats["error"] = str(e)
+    finally:
+        await redis_client.delete(LOCK_KEY)
+
+    stats["duration_s"] = round(time.perf_counter() - start_time, 2)
+    await save_json(redis_client, LAST_RUN_KEY, stats, STATS_TTL)
+    logger.info(
+        f"Предподготовка завершена за {stats['duration_s']}s: найдено {stats['found']}, "
+        f"подготовлено {stats['prepared']}, пропущено {stats['skipped']}, ошибок {stats['failed']}"
+    )
+    return stats
+
+
+def _seconds_until_next_run(now: datetime) -> float:
+    next_run = now.replace(hour=settings.PRECOMPUTE_HOUR, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def _precompute_scheduler(app: FastAPI) -> None:
+    while True:
+        await asyncio.sleep(_seconds_until_next_run(datetime.now()))
+        try:
+            http_service = HTTPXClient(client=app.state.http_client)
+            await run_precompute(http_service, app.state.redis_client)
+        except Exception as e:
+            logger.error(f"Ошибка планировщика предподготовки: {e}", exc_info=True)
+
+
+def start_precompute_scheduler(app: FastAPI) -> None:
+    """Запускает планировщик предварительной подготовки, если он включён в настройках."""
+    if not settings.PRECOMPUTE_ENABLED:
+        return
+    app.state.precompute_task = asyncio.create_task(_precompute_scheduler(app))
+    logger.info(f"Планировщик предподготовки запущен (ежедневно в {settings.PRECOMPUTE_HOUR}:00).")
+
+
+async def stop_precompute_scheduler(app: FastAPI) -> None:
+    """Останавливает планировщик предварительной подготовки."""
+    task = getattr(app.state, "precompute_task", None)
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Планировщик предподготовки остановлен.")
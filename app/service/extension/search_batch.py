@@ -0,0 +1,69 @@
+"""
+Поиск по списку фамилий (дневной список выписки) в одном запросе.
+
+Фамилии ищутся параллельно, не более SEARCH_BATCH_CONCURRENCY одновременно, с одними cookies
+сессии ЕВМИАС. Каждая фамилия ищется через fetch_started_data, поэтому используются локальный индекс
+и кэш поиска по фамилии. Результаты отдаются в формате NDJSON по мере готовности, одна строка на фамилию.
+"""
+import asyncio
+from typing import List, Dict, Any, AsyncIterator
+
+import redis.asyncio as redis
+from fastapi import HTTPException
+
+from app.core import HTTPXClient, get_settings, logger
+from app.model import BatchSearchRequestData, ExtensionStartedData
+from app.service.extension.handles import slim_search_rows
+from app.service.extension.search_cache import normalize_surname
+from app.service.extension.started import fetch_started_data, format_ndjson_line
+
+settings = get_settings()
+
+
+def _unique_surnames(last_names: List[str]) -> List[str]:
+    """
+    Убирает пустые и повторяющиеся (без учёта регистра и пробелов) фамилии, сохраняя порядок.
+    Остаётся первое написание фамилии: в ЕВМИАС она уходит как введена.
+    """
+    unique: Dict[str, str] = {}
+    for name in last_names:
+        if key := normalize_surname(name):
+            unique.setdefault(key, name.strip())
+    return list(unique.values())
+
+
+async def stream_search_batch(
+        batch: BatchSearchRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        slim: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Отдаёт результаты поиска по каждой фамилии строкой NDJSON по мере готовности:
+    {"last_name": ..., "rows": [...]} или {"last_name": ..., "error": "..."}.
+    При slim строки сокращаются до полей для отображения и дескриптора handle.
+    """
+    surnames = _unique_surnames(batch.last_names)
+    logger.info(f"Пакетный поиск: {len(surnames)} фамилий за {batch.dis_date_range or 'период по умолчанию'}")
+    semaphore = asyncio.Semaphore(settings.SEARCH_BATCH_CONCURRENCY)
+
+    async def search(last_name: str) -> Dict[str, Any]:
+        patient = ExtensionStartedData(last_name=last_name, dis_date_range=batch.dis_date_range, fresh=batch.fresh)
+        try:
+            async with semaphore:
+                rows = await fetch_started_data(patient, cookies, http_service, redis_client)
+        except Exception as e:
+            logger.error(f"Пакетный поиск: ошибка по фамилии '{last_name}': {e}")
+            detail = e.detail if isinstance(e, HTTPException) else "Ошибка при поиске во внешней системе"
+            return {"last_name": last_name, "error": detail}
+        return {"last_name": last_name, "rows": await slim_search_rows(redis_client, rows) if slim else rows}
+
+    tasks = [asyncio.create_task(search(last_name)) for last_name in surnames]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield format_ndjson_line(await next_done)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
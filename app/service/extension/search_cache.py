@@ -0,0 +1,187 @@
+"""
+Кратковременный кэш результатов поиска госпитализаций (Search/searchData).
+
+Результаты хранятся в Redis по нормализованной фамилии и настройкам поиска
+(SEARCH_PAY_TYPE_ID, SEARCH_LPU_BUILDING_CID) вместе с диапазоном дат выписки.
+Запрос с более узким диапазоном отвечается фильтрацией закэшированного широкого
+диапазона, без обращения к ЕВМИАС. ЕВМИАС ищет по дате выписки из отделения (EvnSection_disDate_Range),
+а в строке есть только даты поступления и выписки госпитализации, поэтому строка госпитализации
+с переводом, которую по этим датам не отнести ни к узкому диапазону, ни за его пределы,
+не даёт ответить из кэша (см. section_discharge_in_range).
+
+Отдельно и надолго (SEARCH_SEALED_CHUNK_TTL) хранятся результаты за завершившиеся месяцы,
+на которые делится длинный диапазон поиска.
+"""
+import time
+from datetime import date, datetime
+from typing import List, Dict, Any
+
+import redis.asyncio as redis
+
+from app.core import get_settings, logger
+from app.service.cache.cache import load_json, save_json
+
+settings = get_settings()
+
+SEARCH_CACHE_PREFIX = "search:"
+SEALED_CHUNK_PREFIX = "search:sealed:"
+DATE_FORMAT = "%d.%m.%Y"
+MAX_RANGES_PER_SURNAME = 10
+
+
+def normalize_surname(last_name: str) -> str:
+    """Приводит фамилию к виду, в котором она используется в ключе кэша."""
+    return " ".join(last_name.split()).upper()
+
+
+def parse_date_range(dis_date_range: str) -> tuple[date, date] | None:
+    """Разбирает диапазон вида 'дд.мм.гггг - дд.мм.гггг'. Возвращает None, если формат не распознан."""
+    parts = dis_date_range.split("-")
+    if len(parts) != 2:
+        return None
+    try:
+        start, end = (datetime.strptime(part.strip(), DATE_FORMAT).date() for part in parts)
+    except ValueError:
+        return None
+    return start, end
+
+
+def _cache_key(last_name: str) -> str:
+    return (
+        f"{SEARCH_CACHE_PREFIX}{settings.SEARCH_PAY_TYPE_ID}:{settings.SEARCH_LPU_BUILDING_CID}:"
+        f"{normalize_surname(last_name)}"
+    )
+
+
+def _parse_date(value: Any) -> date | None:
+    try:
+        return datetime.strptime(str(value), DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def section_discharge_in_range(row: Dict[str, Any], start: date, end: date) -> bool | None:
+    """
+    Вернёт ли ЕВМИАС строку госпитализации при поиске за диапазон: поиск идёт по дате выписки
+    из отделения, а в строке - даты поступления (EvnPS_setDate) и выписки (EvnPS_disDate) госпитализации.
+    Выписка из последнего отделения - это выписка из стационара, из остальных - между ними.
+
+    True - да (выписка из стационара в диапазоне), False - нет (выписка раньше диапазона или поступление
+    позже него), None - по датам госпитализации не определить: при переводе в диапазон могла попасть
+    выписка из промежуточного отделения.
+    """
+    dis_date = _parse_date(row.get("EvnPS_disDate"))
+    if dis_date is not None:
+        if start <= dis_date <= end:
+            return True
+        if dis_date < start:
+            return False
+    set_date = _parse_date(row.get("EvnPS_setDate"))
+    if set_date is not None and set_date > end:
+        return False
+    return None
+
+
+def _filter_rows(rows: List[Dict[str, Any]], start: date, end: date) -> List[Dict[str, Any]] | None:
+    """
+    Оставляет строки, которые ЕВМИАС вернула бы за диапазон (см. section_discharge_in_range).
+    Возвращает None, если хотя бы для одной строки это не определить и отфильтровать нельзя.
+    """
+    filtered = []
+    for row in rows:
+        in_range = section_discharge_in_range(row, start, end)
+        if in_range is None:
+            return None
+        if in_range:
+            filtered.append(row)
+    return filtered
+
+
+def _fresh_entries(entries: Any) -> List[Dict[str, Any]]:
+    if not isinstance(entries, list):
+        return []
+    now = time.time()
+    return [entry for entry in entries if now - entry.get("cached_at", 0) < settings.SEARCH_CACHE_TTL]
+
+
+async def load_cached_search(
+        redis_client: redis.Redis,
+        last_name: str,
+        dis_date_range: str,
+) -> List[Dict[str, Any]] | None:
+    """
+    Возвращает результат поиска из кэша: точное совпадение диапазона или отфильтрованный
+    закэшированный диапазон, который его покрывает. None - если подходящего результата нет.
+    """
+    if settings.SEARCH_CACHE_TTL <= 0 or not last_name:
+        return None
+    date_range = parse_date_range(dis_date_range)
+    if date_range is None:
+        return None
+    start, end = date_range
+
+    for entry in _fresh_entries(await load_json(redis_client, _cache_key(last_name))):
+        cached_start = date.fromisoformat(entry["start"])
+        cached_end = date.fromisoformat(entry["end"])
+        if (cached_start, cached_end) == (start, end):
+            return entry["rows"]
+        if cached_start <= start and end <= cached_end:
+            rows = _filter_rows(entry["rows"], start, end)
+            if rows is not None:
+                logger.debug(f"Поиск '{last_name}' за {dis_date_range} отвечен из диапазона "
+                             f"{entry['start']} - {entry['end']}")
+                return rows
+    return None
+
+
+async def store_cached_search(
+        redis_client: redis.Redis,
+        last_name: str,
+        dis_date_range: str,
+        rows: List[Dict[str, Any]],
+) -> None:
+    """Сохраняет результат поиска в кэш. Диапазоны, покрытые новым, из кэша убираются."""
+    if settings.SEARCH_CACHE_TTL <= 0 or not last_name:
+        return
+    date_range = parse_date_range(dis_date_range)
+    if date_range is None:
+        return
+    start, end = date_range
+
+    key = _cache_key(last_name)
+    entries = [
+        entry for entry in _fresh_entries(await load_json(redis_client, key))
+        if not (start <= date.fromisoformat(entry["start"]) and date.fromisoformat(entry["end"]) <= end)
+    ]
+    entries.append({"start": start.isoformat(), "end": end.isoformat(), "cached_at": time.time(), "rows": rows})
+    await save_json(redis_client, key, entries[-MAX_RANGES_PER_SURNAME:], settings.SEARCH_CACHE_TTL)
+
+
+def _sealed_chunk_key(last_name: str | None, start: date, end: date) -> str:
+    surname = normalize_surname(last_name) if last_name else "*"
+    return (
+        f"{SEALED_CHUNK_PREFIX}{settings.SEARCH_PAY_TYPE_ID}:{settings.SEARCH_LPU_BUILDING_CID}:"
+        f"{surname}:{start.isoformat()}:{end.isoformat()}"
+    )
+
+
+async def load_sealed_chunk(
+        redis_client: redis.Redis,
+        last_name: str | None,
+        start: date,
+        end: date,
+) -> List[Dict[str, Any]] | None:
+    """Возвращает закэшированный результат поиска за завершившийся месячный отрезок или None."""
+    rows = await load_json(redis_client, _sealed_chunk_key(last_name, start, end))
+    return rows if isinstance(rows, list) else None
+
+
+async def store_sealed_chunk(
+        redis_client: redis.Redis,
+        last_name: str | None,
+        start: date,
+        end: date,
+        rows: List[Dict[str, Any]],
+) -> None:
+    """Сохраняет результат поиска за завершившийся месячный отрезок на SEARCH_SEALED_CHUNK_TTL секунд."""
+    await save_json(redis_client, _sealed_chunk_key(last_name, start, end), rows, settings.SEARCH_SEALED_CHUNK_TTL)
@@ -0,0 +1,75 @@
+"""
+Поиск с обогащением в одном запросе.
+
+Часто фамилия и диапазон дат однозначно определяют госпитализацию. Тогда она обогащается в том же
+запросе, и расширению не нужен второй запрос. Если найдено несколько госпитализаций, обогащение
+первой (самой свежей) запускается заранее, через run_idempotent: последующий запрос
+/extension/enrich-data с её handle присоединится к этому вычислению или получит готовый результат.
+"""
+import asyncio
+from typing import Dict, Any
+
+import redis.asyncio as redis
+
+from app.core import HTTPXClient, get_settings, logger
+from app.model import EnrichmentRequestData, SearchEnrichRequestData
+from app.service.extension.enrich import enrich_data_with_failures
+from app.service.extension.handles import slim_search_rows
+from app.service.extension.idempotency import enrichment_idempotency_key, run_idempotent
+from app.service.extension.started import fetch_started_data
+
+settings = get_settings()
+
+# Ссылки на фоновые задачи, чтобы их не собрал сборщик мусора до завершения
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _enrich_idempotent(
+        enrich_request: EnrichmentRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+):
+    # Тот же ключ, что и у /extension/enrich-data для этой строки, чтобы запросы объединялись
+    return run_idempotent(
+        redis_client,
+        enrichment_idempotency_key(enrich_request),
+        lambda: enrich_data_with_failures(enrich_request, cookies, http_service),
+    )
+
+
+async def search_and_enrich(
+        search_request: SearchEnrichRequestData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+) -> Dict[str, Any]:
+    """
+    Выполняет поиск и, если госпитализация определена однозначно (или по правилу SEARCH_ENRICH_SELECT),
+    обогащает её. Возвращает {"rows": [...], "enriched": {...} | None, "handle": ..., "speculative_handle": ...}:
+    rows - сокращённые строки поиска, handle - строка, для которой заполнено enriched,
+    speculative_handle - строка, обогащение которой запущено заранее.
+    """
+    rows = await fetch_started_data(search_request, cookies, http_service, redis_client)
+    response = {"rows": await slim_search_rows(redis_client, rows), "enriched": None,
+                "handle": None, "speculative_handle": None}
+    if not rows:
+        return response
+
+    # Строки отсортированы от новых выписок к старым, первая - самая свежая госпитализация
+    enrich_request = EnrichmentRequestData(started_data=rows[0], fields=search_request.fields)
+    first_handle = response["rows"][0].get("handle")
+
+    if len(rows) == 1 or settings.SEARCH_ENRICH_SELECT == "latest":
+        logger.info(f"Поиск с обогащением: обогащаем event_id {rows[0].get('EvnPS_id')} (найдено {len(rows)})")
+        response["enriched"] = await _enrich_idempotent(enrich_request, cookies, http_service, redis_client)
+        response["handle"] = first_handle
+    elif settings.SEARCH_ENRICH_SPECULATIVE:
+        logger.info(f"Поиск с обогащением: найдено {len(rows)}, "
+                    f"заранее обогащаем event_id {rows[0].get('EvnPS_id')}")
+        task = asyncio.create_task(_enrich_idempotent(enrich_request, cookies, http_service, redis_client))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        response["speculative_handle"] = first_handle
+
+    return response
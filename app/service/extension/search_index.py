@@ -0,0 +1,179 @@
+"""
+Локальный индекс госпитализаций для поиска пациентов без обращения к ЕВМИАС.
+
+Индекс - таблица SQLite (файл SEARCH_INDEX_PATH, общий для всех воркеров) с B-tree индексом
+по нормализованной фамилии и дате выписки. Поиск по началу фамилии выполняется как диапазонный
+запрос по этому индексу. Наполняет индекс фоновая синхронизация (search_sync.py).
+
+Индекс отвечает на запрос, только если он синхронизирован не раньше SEARCH_INDEX_MAX_AGE секунд назад,
+с теми же параметрами поиска и покрывает запрошенный диапазон дат. Иначе возвращается None,
+и поиск выполняется в ЕВМИАС. ЕВМИАС ищет по дате выписки из отделения, индекс - по датам
+госпитализации (section_discharge_in_range); если для найденной госпитализации с переводом
+это не одно и то же, индекс тоже не отвечает.
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date, datetime
+from typing import List, Dict, Any
+
+from app.core import get_settings, logger
+from app.service.extension.search_cache import (
+    DATE_FORMAT,
+    normalize_surname,
+    parse_date_range,
+    section_discharge_in_range,
+)
+
+settings = get_settings()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hospitalizations (
+    event_id TEXT PRIMARY KEY,
+    surname TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birthday TEXT,
+    dis_date TEXT,
+    row_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_hospitalizations_surname_dis_date ON hospitalizations (surname, dis_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    connection = sqlite3.connect(settings.SEARCH_INDEX_PATH, timeout=10)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+def _to_iso(value: Any) -> str | None:
+    """Переводит дату ЕВМИАС (дд.мм.гггг) в ISO-формат, по которому сортируется индекс."""
+    try:
+        return datetime.strptime(str(value), DATE_FORMAT).date().isoformat()
+    except ValueError:
+        return None
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Первая строка, которая больше всех строк с началом prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def search_params_signature() -> str:
+    """Параметры поиска, с которыми наполнен индекс. При их смене индекс перестраивается."""
+    return f"{settings.SEARCH_PAY_TYPE_ID}:{settings.SEARCH_LPU_BUILDING_CID}"
+
+
+def init_search_index() -> None:
+    """Создаёт файл и таблицы индекса, если их ещё нет."""
+    directory = os.path.dirname(settings.SEARCH_INDEX_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with closing(_connect()) as connection:
+        connection.execute("PRAGMA journal_mode=WAL")  # чтение из других воркеров не блокируется записью
+        connection.executescript(SCHEMA)
+
+
+def read_sync_state() -> Dict[str, str]:
+    """Возвращает состояние синхронизации: synced_at, synced_from, params."""
+    with closing(_connect()) as connection:
+        return {row["key"]: row["value"] for row in connection.execute("SELECT key, value FROM sync_state")}
+
+
+def replace_index_window(rows: List[Dict[str, Any]], window_start: date, full: bool, synced_from: date) -> int:
+    """
+    Заменяет в индексе госпитализации с выпиской начиная с window_start на rows
+    (при full - весь индекс) и обновляет состояние синхронизации. Возвращает число записанных строк.
+    """
+    records = [
+        (
+            str(row["EvnPS_id"]),
+            normalize_surname(str(row.get("Person_Surname") or "")),
+            normalize_surname(str(row.get("Person_Firname") or "")),
+            _to_iso(row.get("Person_Birthday")),
+            _to_iso(row.get("EvnPS_disDate")),
+            json.dumps(row, ensure_ascii=False),
+        )
+        for row in rows if row.get("EvnPS_id")
+    ]
+    state = {
+        "synced_at": str(time.time()),
+        "synced_from": synced_from.isoformat(),
+        "params": search_params_signature(),
+    }
+
+    with closing(_connect()) as connection, connection:
+        if full:
+            connection.execute("DELETE FROM hospitalizations")
+        else:
+            connection.execute("DELETE FROM hospitalizations WHERE dis_date >= ?", (window_start.isoformat(),))
+        connection.executemany("INSERT OR REPLACE INTO hospitalizations VALUES (?, ?, ?, ?, ?, ?)", records)
+        connection.executemany("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", state.items())
+    return len(records)
+
+
+def _index_covers(state: Dict[str, str], start: date) -> bool:
+    if state.get("params") != search_params_signature() or "synced_at" not in state:
+        return False
+    if time.time() - float(state["synced_at"]) > settings.SEARCH_INDEX_MAX_AGE:
+        return False
+    return date.fromisoformat(state["synced_from"]) <= start
+
+
+def lookup_search_index(
+        last_name: str,
+        dis_date_range: str,
+        first_name: str | None = None,
+        birthday: date | None = None,
+) -> List[Dict[str, Any]] | None:
+    """
+    Ищет госпитализации в локальном индексе по началу фамилии (без учёта регистра) и диапазону дат выписки,
+    при необходимости - по началу имени и дате рождения. Результат - от новых выписок к старым.
+    Возвращает None, если индекс выключен, устарел, не покрывает диапазон, ничего не нашёл или ответ
+    ЕВМИАС мог бы отличаться (госпитализация с переводом, см. section_discharge_in_range).
+    """
+    surname = normalize_surname(last_name)
+    date_range = parse_date_range(dis_date_range)
+    if not settings.SEARCH_INDEX_ENABLED or not surname or date_range is None:
+        return None
+    start, end = date_range
+
+    # Выписанные позже диапазона и ещё не выписанные проверяются по датам госпитализации ниже
+    query = ("SELECT row_json FROM hospitalizations "
+             "WHERE surname >= ? AND surname < ? AND (dis_date >= ? OR dis_date IS NULL)")
+    params = [surname, _prefix_upper_bound(surname), start.isoformat()]
+    if first_name and normalize_surname(first_name):
+        first_name = normalize_surname(first_name)
+        query += " AND first_name >= ? AND first_name < ?"
+        params += [first_name, _prefix_upper_bound(first_name)]
+    if birthday:
+        query += " AND birthday = ?"
+        params.append(birthday.isoformat())
+    query += " ORDER BY dis_date DESC"
+
+    try:
+        with closing(_connect()) as connection:
+            state = {row["key"]: row["value"] for row in connection.execute("SELECT key, value FROM sync_state")}
+            if not _index_covers(state, start):
+                return None
+            candidates = [json.loads(row["row_json"]) for row in connection.execute(query, params)]
+    except sqlite3.Error as e:
+        logger.error(f"Ошибка локального индекса поиска: {e}")
+        return None
+
+    rows = []
+    for row in candidates:
+        in_range = section_discharge_in_range(row, start, end)
+        if in_range is None:
+            logger.debug(f"Госпитализация {row.get('EvnPS_id')} с переводом: поиск '{last_name}' "
+                         f"за {dis_date_range} выполняется в ЕВМИАС")
+            return None
+        if in_range:
+            rows.append(row)
+    return rows or None
@@ -0,0 +1,102 @@
+"""
+Фоновая синхронизация локального индекса госпитализаций (search_index.py) с ЕВМИАС.
+
+Каждые SEARCH_INDEX_SYNC_INTERVAL секунд один из воркеров (под блокировкой в Redis) запрашивает
+госпитализации подразделения с теми же параметрами поиска, что и /extension/search, но без фамилии.
+Первая синхронизация загружает период с SEARCH_PERIOD_START_DATE, следующие - только последние
+SEARCH_INDEX_OVERLAP_DAYS дней до текущей даты, перезаписывая этот отрезок в индексе.
+"""
+import asyncio
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Any
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+
+from app.core import HTTPXClient, get_settings, logger
+from app.service.cookie.cookie import set_cookies
+from app.service.extension.search_cache import DATE_FORMAT
+from app.service.extension.search_index import (
+    init_search_index,
+    read_sync_state,
+    replace_index_window,
+    search_params_signature,
+)
+from app.service.extension.started import search_hospitalizations_by_month
+
+settings = get_settings()
+
+LOCK_KEY = "search_index:lock"
+LOCK_TTL = 30 * 60  # секунды, с запасом на полную синхронизацию
+
+
+async def sync_search_index(http_service: HTTPXClient, redis_client: redis.Redis) -> Dict[str, Any] | None:
+    """
+    Выполняет одну синхронизацию индекса. Возвращает статистику
+    или None, если синхронизация уже выполняется на другом воркере.
+    """
+    if not await redis_client.set(LOCK_KEY, os.getpid(), nx=True, ex=LOCK_TTL):
+        return None
+
+    start_time = time.perf_counter()
+    try:
+        state = await asyncio.to_thread(read_sync_state)
+        period_start = datetime.strptime(settings.SEARCH_PERIOD_START_DATE, DATE_FORMAT).date()
+        today = date.today()
+
+        full = (
+            state.get("params") != search_params_signature()
+            or "synced_at" not in state
+            or period_start < date.fromisoformat(state["synced_from"])
+        )
+        if full:
+            window_start = period_start
+        else:
+            last_sync_date = datetime.fromtimestamp(float(state["synced_at"])).date()
+            window_start = max(period_start, last_sync_date - timedelta(days=settings.SEARCH_INDEX_OVERLAP_DAYS))
+
+        dis_date_range = f"{window_start.strftime(DATE_FORMAT)} - {today.strftime(DATE_FORMAT)}"
+        cookies = await set_cookies(http_service=http_service, redis_client=redis_client)
+        rows = await search_hospitalizations_by_month(cookies, http_service, dis_date_range, redis_client=redis_client)
+        written = await asyncio.to_thread(replace_index_window, rows, window_start, full, period_start)
+    finally:
+        await redis_client.delete(LOCK_KEY)
+
+    stats = {"range": dis_date_range, "full": full, "rows": written,
+             "duration_s": round(time.perf_counter() - start_time, 2)}
+    logger.info(f"Индекс поиска синхронизирован за {stats['duration_s']}s: "
+                f"{'полная' if full else 'частичная'} синхронизация за {dis_date_range}, строк {written}")
+    return stats
+
+
+async def _search_index_scheduler(app: FastAPI) -> None:
+    while True:
+        try:
+            http_service = HTTPXClient(client=app.state.http_client)
+            await sync_search_index(http_service, app.state.redis_client)
+        except Exception as e:
+            logger.error(f"Ошибка синхронизации индекса поиска: {e}", exc_info=True)
+        await asyncio.sleep(settings.SEARCH_INDEX_SYNC_INTERVAL)
+
+
+def start_search_index_sync(app: FastAPI) -> None:
+    """Создаёт локальный индекс поиска и запускает его фоновую синхронизацию, если она включена в настройках."""
+    if not settings.SEARCH_INDEX_ENABLED:
+        return
+    init_search_index()
+    app.state.search_index_task = asyncio.create_task(_search_index_scheduler(app))
+    logger.info(f"Синхронизация индекса поиска запущена (каждые {settings.SEARCH_INDEX_SYNC_INTERVAL} с).")
+
+
+async def stop_search_index_sync(app: FastAPI) -> None:
+    """Останавливает фоновую синхронизацию индекса поиска."""
+    task = getattr(app.state, "search_index_task", None)
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Синхронизация индекса поиска остановлена.")
@@ -1,33 +1,51 @@
-from datetime import datetime
-from typing import List, Dict, Any
+import asyncio
+import json
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, AsyncIterator
 
+import redis.asyncio as redis
 from fastapi import HTTPException
 
 from app.model import ExtensionStartedData
 from app.core import get_settings, HTTPXClient, get_http_service, logger
+from app.service.extension.search_cache import (
+    DATE_FORMAT,
+    load_cached_search,
+    store_cached_search,
+    load_sealed_chunk,
+    store_sealed_chunk,
+    normalize_surname,
+    parse_date_range,
+)
+from app.service.extension.search_index import lookup_search_index
+from app.service.extension.handles import slim_search_rows
 
 settings = get_settings()
 
 SEARCH_PERIOD_START_DATE = settings.SEARCH_PERIOD_START_DATE
 
 
-
-async def fetch_started_data(
-        patient: ExtensionStartedData,
+async def search_hospitalizations(
         cookies: dict[str, str],
-        http_service: HTTPXClient
+        http_service: HTTPXClient,
+        dis_date_range: str,
+        last_name: str | None = None,
 ) -> List[Dict[str, Any]]:
-    """Выполняет поиск по заданным параметрам в ЕВМИАС и возвращает список пациентов с госпитализациями"""
+    """
+    Выполняет поиск госпитализаций в ЕВМИАС (Search/searchData) за диапазон дат выписки.
+    Без фамилии возвращает все госпитализации подразделения за диапазон.
+    """
     url = settings.BASE_URL
     headers = {"Origin": settings.BASE_HEADERS_ORIGIN_URL, "Referer": settings.BASE_HEADERS_REFERER_URL}
     params = {"c": "Search", "m": "searchData"}
     data = {
         "SearchFormType": "EvnPS",
-        "Person_Surname": patient.last_name,
         "PayType_id": settings.SEARCH_PAY_TYPE_ID,
         "LpuBuilding_cid": settings.SEARCH_LPU_BUILDING_CID,
-        "EvnSection_disDate_Range": patient.dis_date_range or f"{SEARCH_PERIOD_START_DATE} - {datetime.now().strftime('%d.%m.%Y')}",
+        "EvnSection_disDate_Range": dis_date_range,
     }
+    if last_name:
+        data["Person_Surname"] = last_name
 
     logger.debug(f"Поиск госпитализаций пациента с параметрами: {data}")
 
@@ -54,4 +72,255 @@ async def fetch_started_data(
         logger.error(f"Ожидался список в ключе 'data', но получено: {type(data)}")
         raise HTTPException(status_code=502, detail="Невалидный формат данных от внешней системы")
 
-    return data
\ No newline at end of file
+    return data
+
+
+def split_date_range_by_month(start: date, end: date) -> List[tuple[date, date]]:
+    """Делит диапазон дат на отрезки в пределах календарного месяца, от новых к старым."""
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        next_month = (chunk_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_end = min(end, next_month - timedelta(days=1))
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = next_month
+    return chunks[::-1]
+
+
+def _dis_date(row: Dict[str, Any]) -> date:
+    # Только для порядка строк: какие госпитализации входят в результат, решает ЕВМИАС по выписке из отделения
+    try:
+        return datetime.strptime(str(row.get("EvnPS_disDate")), DATE_FORMAT).date()
+    except ValueError:
+        return date.min
+
+
+def merge_hospitalizations(chunks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Объединяет результаты поиска по отрезкам без повторов по EvnPS_id, от новых выписок к старым."""
+    merged = {}
+    for rows in chunks:
+        for row in rows:
+            merged.setdefault(row.get("EvnPS_id"), row)
+    return sorted(merged.values(), key=_dis_date, reverse=True)
+
+
+async def _search_chunk(
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis | None,
+        semaphore: asyncio.Semaphore,
+        start: date,
+        end: date,
+        last_name: str | None,
+) -> List[Dict[str, Any]]:
+    """Ищет госпитализации за один месячный отрезок. Завершившиеся месяцы берутся из кэша."""
+    sealed = redis_client is not None and end < date.today().replace(day=1)
+    if sealed:
+        rows = await load_sealed_chunk(redis_client, last_name, start, end)
+        if rows is not None:
+            return rows
+
+    async with semaphore:
+        dis_date_range = f"{start.strftime(DATE_FORMAT)} - {end.strftime(DATE_FORMAT)}"
+        rows = await search_hospitalizations(cookies, http_service, dis_date_range, last_name=last_name)
+
+    if sealed:
+        await store_sealed_chunk(redis_client, last_name, start, end, rows)
+    return rows
+
+
+async def iter_hospitalizations_by_month(
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        dis_date_range: str,
+        last_name: str | None = None,
+        redis_client: redis.Redis | None = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Отдаёт результаты поиска по месячным отрезкам от новых к старым. Отрезки запрашиваются
+    параллельно (не более SEARCH_SPLIT_CONCURRENCY одновременно), каждый отдаётся, как только
+    готовы он и все более новые. Если диапазон не распознан, выполняется один обычный запрос.
+    """
+    date_range = parse_date_range(dis_date_range)
+    if date_range is None:
+        yield await search_hospitalizations(cookies, http_service, dis_date_range, last_name=last_name)
+        return
+
+    chunks = split_date_range_by_month(*date_range)
+    semaphore = asyncio.Semaphore(settings.SEARCH_SPLIT_CONCURRENCY)
+    tasks = [
+        asyncio.create_task(_search_chunk(cookies, http_service, redis_client, semaphore, start, end, last_name))
+        for start, end in chunks
+    ]
+    logger.debug(f"Поиск за {dis_date_range} выполняется по {len(chunks)} месячным отрезкам")
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # ошибка уже обработана вызывающим, не даём asyncio сообщать о ней повторно
+
+
+async def search_hospitalizations_by_month(
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        dis_date_range: str,
+        last_name: str | None = None,
+        redis_client: redis.Redis | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Выполняет поиск госпитализаций, разбивая диапазон на месяцы и запрашивая их параллельно.
+    Результат - без повторов, от новых выписок к старым.
+    """
+    chunks = [
+        rows async for rows in iter_hospitalizations_by_month(
+            cookies, http_service, dis_date_range, last_name=last_name, redis_client=redis_client
+        )
+    ]
+    return merge_hospitalizations(chunks)
+
+
+def _search_params(patient: ExtensionStartedData) -> tuple[str, str]:
+    """Возвращает диапазон дат выписки и фамилию для поиска."""
+    dis_date_range = patient.dis_date_range or f"{SEARCH_PERIOD_START_DATE} - {datetime.now().strftime('%d.%m.%Y')}"
+    # В ЕВМИАС фамилия уходит как введена, нормализуется она только в ключах кэша и в индексе
+    return dis_date_range, patient.last_name
+
+
+def _filter_by_person(rows: List[Dict[str, Any]], patient: ExtensionStartedData) -> List[Dict[str, Any]]:
+    """Оставляет госпитализации, подходящие под необязательные фильтры по имени (началу) и дате рождения."""
+    if patient.first_name and normalize_surname(patient.first_name):
+        prefix = normalize_surname(patient.first_name)
+        rows = [row for row in rows if normalize_surname(str(row.get("Person_Firname") or "")).startswith(prefix)]
+    if patient.birthday:
+        birthday = patient.birthday.strftime(DATE_FORMAT)
+        rows = [row for row in rows if row.get("Person_Birthday") == birthday]
+    return rows
+
+
+async def _lookup_local(
+        patient: ExtensionStartedData, dis_date_range: str, last_name: str
+) -> List[Dict[str, Any]] | None:
+    """
+    Ищет в локальном индексе, если он включён и свежие данные не запрошены явно.
+    SQLite синхронный и может ждать записи синхронизации, поэтому поиск выполняется в потоке.
+    """
+    if patient.fresh or not settings.SEARCH_INDEX_ENABLED:
+        return None
+    rows = await asyncio.to_thread(
+        lookup_search_index, last_name, dis_date_range, patient.first_name, patient.birthday
+    )
+    if rows is not None:
+        logger.info(f"Поиск '{last_name}' за {dis_date_range}: результат взят из локального индекса")
+    return rows
+
+
+async def fetch_started_data(
+        patient: ExtensionStartedData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Выполняет поиск по заданным параметрам и возвращает список пациентов с госпитализациями.
+    Поиск выполняется в локальном индексе, а при промахе - в ЕВМИАС. Если передан redis_client,
+    повторные и уточняющие поиски в ЕВМИАС отвечаются из кэша. С patient.fresh индекс и кэш не используются.
+    """
+    dis_date_range, last_name = _search_params(patient)
+
+    local = await _lookup_local(patient, dis_date_range, last_name)
+    if local is not None:
+        return local
+
+    if redis_client is not None and not patient.fresh:
+        cached = await load_cached_search(redis_client, last_name, dis_date_range)
+        if cached is not None:
+            logger.info(f"Поиск '{last_name}' за {dis_date_range}: результат взят из кэша")
+            return _filter_by_person(cached, patient)
+
+    result = await search_hospitalizations_by_month(
+        cookies, http_service, dis_date_range, last_name=last_name,
+        redis_client=None if patient.fresh else redis_client,
+    )
+
+    if redis_client is not None:
+        await store_cached_search(redis_client, last_name, dis_date_range, result)
+    return _filter_by_person(result, patient)
+
+
+def paginate_started_data(rows: List[Dict[str, Any]], limit: int, cursor: str | None = None) -> Dict[str, Any]:
+    """
+    Возвращает страницу результатов поиска: {"items": [...], "next_cursor": ..., "total": ...}.
+    Курсор - смещение следующей страницы; next_cursor равен None на последней странице.
+    Результаты поиска хранятся в кэше, поэтому соседние страницы берутся из одного и того же списка.
+    """
+    offset = int(cursor) if cursor else 0
+    next_offset = offset + limit
+    return {
+        "items": rows[offset:next_offset],
+        "next_cursor": str(next_offset) if next_offset < len(rows) else None,
+        "total": len(rows),
+    }
+
+
+def format_ndjson_line(data: Any) -> str:
+    """Форматирует одну строку NDJSON."""
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+async def stream_started_data(
+        patient: ExtensionStartedData,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        slim: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Отдаёт результаты поиска в формате NDJSON (одна госпитализация на строку) по мере получения
+    месячных отрезков из ЕВМИАС, от новых выписок к старым. При slim строки сокращаются до полей
+    для отображения и дескриптора handle (см. slim_search_rows).
+    При ошибке внешней системы последней строкой отдаётся {"error": "..."}.
+    """
+    async def output(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return await slim_search_rows(redis_client, rows) if slim else rows
+
+    dis_date_range, last_name = _search_params(patient)
+
+    cached = await _lookup_local(patient, dis_date_range, last_name)
+    if cached is None and not patient.fresh:
+        cached = await load_cached_search(redis_client, last_name, dis_date_range)
+        if cached is not None:
+            logger.info(f"Поиск '{last_name}' за {dis_date_range}: результат взят из кэша")
+            cached = _filter_by_person(cached, patient)
+    if cached is not None:
+        for row in await output(cached):
+            yield format_ndjson_line(row)
+        return
+
+    seen = set()
+    collected = []
+    try:
+        async for rows in iter_hospitalizations_by_month(
+                cookies, http_service, dis_date_range, last_name=last_name,
+                redis_client=None if patient.fresh else redis_client,
+        ):
+            new_rows = []
+            for row in sorted(rows, key=_dis_date, reverse=True):
+                if row.get("EvnPS_id") in seen:
+                    continue
+                seen.add(row.get("EvnPS_id"))
+                new_rows.append(row)
+            collected.extend(new_rows)
+            for row in await output(_filter_by_person(new_rows, patient)):
+                yield format_ndjson_line(row)
+    except Exception as e:
+        # Статус ответа уже отправлен, поэтому ошибка сообщается последней строкой потока
+        logger.error(f"Потоковый поиск '{last_name}' за {dis_date_range} прерван: {e}")
+        detail = e.detail if isinstance(e, HTTPException) else "Ошибка при поиске во внешней системе"
+        yield format_ndjson_line({"error": detail})
+        return
+
+    await store_cached_search(redis_client, last_name, dis_date_range, merge_hospitalizations([collected]))
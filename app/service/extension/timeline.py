@@ -0,0 +1,113 @@
+"""
+Хронология госпитализаций пациента для проверки преемственности случаев перед подачей.
+
+Данные пациента загружаются один раз: по ним находятся все его госпитализации за период
+(поиск по фамилии с отбором по Person_id).
+Для каждого случая вычисляются только поля с кодами (TIMELINE_FIELDS). Если случай недавно
+обогащался целиком (/extension/enrich-data или предподготовка), коды берутся из этого результата.
+"""
+import asyncio
+from datetime import date, datetime
+from typing import Dict, Any
+
+import redis.asyncio as redis
+
+from app.core import HTTPXClient, get_settings, logger
+from app.model import EnrichmentRequestData, ExtensionStartedData
+from app.service.evmias.request import fetch_person_data
+from app.service.extension.enrich import enrich_data_with_failures, select_enriched_fields
+from app.service.extension.handles import slim_search_rows
+from app.service.extension.idempotency import enrichment_idempotency_key, load_idempotent_result, run_idempotent
+from app.service.extension.precompute import load_prepared_enrichment
+from app.service.extension.search_cache import DATE_FORMAT
+from app.service.extension.started import fetch_started_data
+
+settings = get_settings()
+
+# Поля с кодами и датами, по которым проверяется преемственность случаев
+TIMELINE_FIELDS = [
+    "dates",
+    "CardNumber",
+    "HospitalizationInfoV006",
+    "HospitalizationInfoSubdivision",
+    "HospitalizationInfoNameDepartment",
+    "HospitalizationInfoOfficeCode",
+    "HospitalizationInfoSpecializedMedicalProfile",
+    "HospitalizationInfoV020",
+    "HospitalizationInfoDiagnosisMainDisease",
+    "ResultV009",
+    "IshodV012",
+    "HospitalizationInfoC_ZABV027",
+]
+
+PERSON_FIELDS = ("Person_Surname", "Person_Firname", "Person_Secname", "Person_Birthday", "Person_EdNum", "Sex_Name")
+
+
+def _set_date(row: Dict[str, Any]) -> date:
+    try:
+        return datetime.strptime(str(row.get("EvnPS_setDate")), DATE_FORMAT).date()
+    except ValueError:
+        return date.min
+
+
+async def _stay_codes(
+        row: Dict[str, Any],
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Возвращает поля с кодами одного случая, по возможности - из недавнего полного обогащения."""
+    fields = select_enriched_fields(TIMELINE_FIELDS)
+
+    full_request = EnrichmentRequestData(started_data=row)
+    enriched = await load_idempotent_result(redis_client, enrichment_idempotency_key(full_request))
+    if enriched is None:
+        enriched = await load_prepared_enrichment(redis_client, full_request)
+    if enriched:
+        return {key: enriched.get(key) for key in fields}
+
+    request = EnrichmentRequestData(started_data=row, fields=TIMELINE_FIELDS)
+    async with semaphore:
+        return await run_idempotent(
+            redis_client,
+            enrichment_idempotency_key(request),
+            lambda: enrich_data_with_failures(request, cookies, http_service),
+        )
+
+
+async def build_patient_timeline(
+        person_id: str,
+        cookies: dict[str, str],
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        dis_date_range: str | None = None,
+) -> Dict[str, Any] | None:
+    """
+    Возвращает хронологию госпитализаций пациента за период (по умолчанию - с SEARCH_PERIOD_START_DATE):
+    {"person_id": ..., "person": {...}, "stays": [...]}, случаи - от ранних к поздним, каждый с handle
+    и полями с кодами в ключе 'codes'. Возвращает None, если пациент не найден.
+    """
+    person = await fetch_person_data(cookies, http_service, person_id)
+    if not person or not person.get("Person_Surname"):
+        return None
+
+    patient = ExtensionStartedData(last_name=person["Person_Surname"], dis_date_range=dis_date_range)
+    rows = [
+        row for row in await fetch_started_data(patient, cookies, http_service, redis_client)
+        if str(row.get("Person_id")) == str(person_id)
+    ]
+    rows.sort(key=_set_date)
+    logger.info(f"Хронология person_id {person_id}: найдено госпитализаций {len(rows)}")
+
+    semaphore = asyncio.Semaphore(settings.TIMELINE_CONCURRENCY)
+    codes = await asyncio.gather(*(
+        _stay_codes(row, cookies, http_service, redis_client, semaphore) for row in rows
+    ))
+    stays = await slim_search_rows(redis_client, rows)
+
+    return {
+        "person_id": person_id,
+        "person": {key: person.get(key) for key in PERSON_FIELDS},
+        "stays": [{**stay, "codes": stay_codes} for stay, stay_codes in zip(stays, codes)],
+    }
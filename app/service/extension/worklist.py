@@ -0,0 +1,201 @@
+"""
+Отметки о заполнении формы и рабочий список выписанных, но ещё не заполненных госпитализаций.
+
+Расширение после заполнения формы сообщает EvnPS_id случая, и отметка хранится в Redis
+SUBMISSION_TTL секунд. Рабочий список - госпитализации, выписанные за последние WORKLIST_WINDOW_DAYS
+дней. Его обновляет фоновая задача (раз в WORKLIST_REFRESH_INTERVAL секунд, под блокировкой в Redis)
+или первый запрос, если список ещё не построен. Запрос строит только список, а обогащённые данные
+для его случаев (WORKLIST_PREFETCH) готовятся в фоне. Заполненные случаи исключаются из списка
+при каждой выдаче, поэтому отметка действует сразу, не дожидаясь обновления.
+"""
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+from redis.exceptions import RedisError
+
+from app.core import HTTPXClient, get_settings, logger
+from app.service.cache.cache import load_json, save_json
+from app.service.cookie.cookie import set_cookies
+from app.service.extension.handles import slim_search_rows
+from app.service.extension.precompute import prepare_cases
+from app.service.extension.search_cache import DATE_FORMAT
+from app.service.extension.started import search_hospitalizations_by_month
+
+settings = get_settings()
+
+SUBMISSION_KEY_PREFIX = "submission:"
+WORKLIST_KEY = "worklist:current"
+LOCK_KEY = "worklist:lock"
+LOCK_TTL = 5 * 60  # секунды, с запасом на поиск выписок за WORKLIST_WINDOW_DAYS
+PREFETCH_LOCK_KEY = "worklist:prefetch:lock"
+PREFETCH_LOCK_TTL = 30 * 60  # секунды, с запасом на предподготовку всего списка
+
+# Статусы, при которых случай считается заполненным и в рабочий список не попадает
+DONE_STATUSES = {"filled"}
+
+# Ссылки на фоновые задачи предподготовки, чтобы их не собрал сборщик мусора до завершения
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _submission_key(event_id: str) -> str:
+    return f"{SUBMISSION_KEY_PREFIX}{event_id}"
+
+
+async def record_submission(redis_client: redis.Redis, event_id: str, status: str) -> Dict[str, Any]:
+    """Сохраняет отметку о заполнении формы для госпитализации и возвращает её."""
+    submission = {
+        "event_id": event_id,
+        "status": status,
+        "submitted_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    await save_json(redis_client, _submission_key(event_id), submission, settings.SUBMISSION_TTL)
+    logger.info(f"event_id: {event_id}, отметка о заполнении формы: {status}")
+    return submission
+
+
+async def load_submission(redis_client: redis.Redis, event_id: str) -> Dict[str, Any] | None:
+    """Возвращает отметку о заполнении формы для госпитализации или None."""
+    submission = await load_json(redis_client, _submission_key(event_id))
+    return submission if isinstance(submission, dict) else None
+
+
+async def _done_event_ids(redis_client: redis.Redis, event_ids: List[str]) -> set[str]:
+    if not event_ids:
+        return set()
+    try:
+        raw_values = await redis_client.mget([_submission_key(event_id) for event_id in event_ids])
+    except RedisError as e:
+        logger.error(f"Не удалось прочитать отметки о заполнении из Redis: {e}")
+        return set()
+
+    done = set()
+    for event_id, raw_value in zip(event_ids, raw_values):
+        if raw_value is None:
+            continue
+        try:
+            if json.loads(raw_value).get("status") in DONE_STATUSES:
+                done.add(event_id)
+        except (UnicodeDecodeError, json.JSONDecodeError, AttributeError):
+            continue
+    return done
+
+
+async def prefetch_worklist(rows: List[Dict[str, Any]], http_service: HTTPXClient, redis_client: redis.Redis) -> None:
+    """Готовит обогащённые данные для незаполненных случаев рабочего списка (не более одного запуска сразу)."""
+    if not await redis_client.set(PREFETCH_LOCK_KEY, os.getpid(), nx=True, ex=PREFETCH_LOCK_TTL):
+        return
+
+    try:
+        cookies = await set_cookies(http_service=http_service, redis_client=redis_client)
+        done = await _done_event_ids(redis_client, [str(row["EvnPS_id"]) for row in rows])
+        stats = {"prepared": 0, "skipped": 0, "failed": 0}
+        await prepare_cases([row for row in rows if str(row["EvnPS_id"]) not in done],
+                            cookies, http_service, redis_client, stats)
+        logger.info(f"Рабочий список: подготовлено {stats['prepared']}, пропущено {stats['skipped']}, "
+                    f"ошибок {stats['failed']}")
+    finally:
+        await redis_client.delete(PREFETCH_LOCK_KEY)
+
+
+async def _prefetch_in_background(rows: List[Dict[str, Any]], http_service: HTTPXClient,
+                                  redis_client: redis.Redis) -> None:
+    try:
+        await prefetch_worklist(rows, http_service, redis_client)
+    except Exception as e:
+        logger.error(f"Ошибка предподготовки рабочего списка: {e}", exc_info=True)
+
+
+async def refresh_worklist(
+        http_service: HTTPXClient,
+        redis_client: redis.Redis,
+        prefetch: bool = True,
+) -> Dict[str, Any] | None:
+    """
+    Перестраивает рабочий список и, если prefetch и WORKLIST_PREFETCH, готовит обогащённые данные
+    для незаполненных случаев. Возвращает сохранённый список или None, если он уже обновляется на другом воркере.
+    """
+    if not await redis_client.set(LOCK_KEY, os.getpid(), nx=True, ex=LOCK_TTL):
+        return None
+
+    start_time = time.perf_counter()
+    try:
+        today = datetime.now()
+        date_from = today - timedelta(days=settings.WORKLIST_WINDOW_DAYS)
+        dis_date_range = f"{date_from.strftime(DATE_FORMAT)} - {today.strftime(DATE_FORMAT)}"
+        cookies = await set_cookies(http_service=http_service, redis_client=redis_client)
+        rows = await search_hospitalizations_by_month(cookies, http_service, dis_date_range, redis_client=redis_client)
+        rows = [row for row in rows if row.get("EvnPS_id") and row.get("EvnPS_disDate")]
+
+        worklist = {"generated_at": today.isoformat(timespec="seconds"), "range": dis_date_range, "rows": rows}
+        await save_json(redis_client, WORKLIST_KEY, worklist, settings.WORKLIST_REFRESH_INTERVAL * 3)
+    finally:
+        await redis_client.delete(LOCK_KEY)
+
+    logger.info(f"Рабочий список за {dis_date_range} обновлён за {time.perf_counter() - start_time:.2f}s: "
+                f"выписок {len(rows)}")
+    if prefetch and settings.WORKLIST_PREFETCH:
+        await prefetch_worklist(rows, http_service, redis_client)
+    return worklist
+
+
+async def get_worklist(http_service: HTTPXClient, redis_client: redis.Redis) -> Dict[str, Any] | None:
+    """
+    Возвращает рабочий список без заполненных случаев, строки - сокращённые, с handle для обогащения.
+    Если списка ещё нет, строит его. None - если список прямо сейчас строится на другом воркере.
+    """
+    worklist = await load_json(redis_client, WORKLIST_KEY)
+    if not isinstance(worklist, dict):
+        # В запросе строится только список, предподготовка его случаев - в фоне
+        worklist = await refresh_worklist(http_service, redis_client, prefetch=False)
+        if worklist is None:
+            return None
+        if settings.WORKLIST_PREFETCH:
+            task = asyncio.create_task(_prefetch_in_background(worklist["rows"], http_service, redis_client))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    rows = worklist["rows"]
+    done = await _done_event_ids(redis_client, [str(row["EvnPS_id"]) for row in rows])
+    pending = [row for row in rows if str(row["EvnPS_id"]) not in done]
+    return {
+        "generated_at": worklist["generated_at"],
+        "range": worklist["range"],
+        "total": len(pending),
+        "rows": await slim_search_rows(redis_client, pending),
+    }
+
+
+async def _worklist_scheduler(app: FastAPI) -> None:
+    while True:
+        try:
+            http_service = HTTPXClient(client=app.state.http_client)
+            await refresh_worklist(http_service, app.state.redis_client)
+        except Exception as e:
+            logger.error(f"Ошибка обновления рабочего списка: {e}", exc_info=True)
+        await asyncio.sleep(settings.WORKLIST_REFRESH_INTERVAL)
+
+
+def start_worklist_refresh(app: FastAPI) -> None:
+    """Запускает фоновое обновление рабочего списка, если оно включено в настройках."""
+    if not settings.WORKLIST_ENABLED:
+        return
+    app.state.worklist_task = asyncio.create_task(_worklist_scheduler(app))
+    logger.info(f"Обновление рабочего списка запущено (каждые {settings.WORKLIST_REFRESH_INTERVAL} с).")
+
+
+async def stop_worklist_refresh(app: FastAPI) -> None:
+    """Останавливает фоновое обновление рабочего списка."""
+    task = getattr(app.state, "worklist_task", None)
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Обновление рабочего списка остановлено.")
@@ -0,0 +1,201 @@
+"""
+Синхронизация справочников с ЕВМИАС (MongoDBWork/getData).
+
+Справочник ЕВМИАС и наш справочник, в который он сопоставляется, описаны в SYNCED_DIRECTORIES.
+Раз в REFERENCE_SYNC_INTERVAL секунд один из воркеров (под блокировкой в Redis) загружает справочники
+из ЕВМИАС и сохраняет их в Redis, остальные воркеры берут их оттуда. Каждый воркер объединяет загруженное
+со своим справочником (app/service/reference/store.py) и хранит объединённый справочник в памяти
+(get_synced_reference), поэтому поиск по нему - обращение к словарю без запросов к Redis.
+
+При объединении записи нашего справочника главнее. Новые id ЕВМИАС добавляются с кодом из ЕВМИАС,
+поэтому исход с новым id не теряется. Новые id, id с другим кодом в ЕВМИАС и id, которых в ЕВМИАС
+больше нет, попадают в отчёт (предупреждение в логе и /extension/reference/sync).
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+
+from app.core import HTTPXClient, get_settings, logger
+from app.service.cache.cache import load_json, save_json
+from app.service.cookie.cookie import set_cookies
+from app.service.evmias.request import fetch_evmias_directory
+from app.service.reference.store import get_reference
+
+settings = get_settings()
+
+# Наш справочник -> справочник ЕВМИАС и поля его записей
+SYNCED_DIRECTORIES = {
+    "disease_outcome_ids": {
+        "object": "ResultDesease",
+        "id_field": "ResultDesease_id",
+        "code_field": "ResultDesease_Code",
+        "name_field": "ResultDesease_Name",
+    },
+}
+
+KEY_PREFIX = "reference_sync:"
+LOCK_KEY = "reference_sync:lock"
+LOCK_TTL = 5 * 60  # секунды
+
+# Загруженные из ЕВМИАС справочники и объединённые с нашими: имя -> состояние
+_synced: Dict[str, Dict[str, Any]] = {}
+
+
+def _directory_key(name: str) -> str:
+    return f"{KEY_PREFIX}{name}"
+
+
+def _normalize_code(code: Any) -> Any:
+    """Код из ЕВМИАС к виду нашего справочника (числовые коды хранятся числами)."""
+    if isinstance(code, str) and code.strip().isdigit():
+        return int(code)
+    return code
+
+
+def _normalize_rows(rows: List[Dict[str, Any]], spec: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    entries = {}
+    for row in rows:
+        if isinstance(row, dict) and row.get(spec["id_field"]) is not None:
+            entries[str(row[spec["id_field"]])] = {
+                "name": row.get(spec["name_field"]),
+                "code": _normalize_code(row.get(spec["code_field"])),
+            }
+    return entries
+
+
+def merge_directory(ours: Dict[str, Dict[str, Any]], evmias: Dict[str, Dict[str, Any]]) -> tuple[Dict, Dict]:
+    """Объединяет наш справочник со справочником ЕВМИАС. Возвращает (объединённый справочник, отчёт)."""
+    merged = dict(ours)
+    report: Dict[str, List[Dict[str, Any]]] = {"new": [], "changed": [], "missing": []}
+    for entry_id, entry in evmias.items():
+        our_entry = ours.get(entry_id)
+        if our_entry is None:
+            merged[entry_id] = entry
+            report["new"].append({"id": entry_id, **entry})
+        elif our_entry.get("code") != entry.get("code"):
+            report["changed"].append({"id": entry_id, "name": entry.get("name"),
+                                      "code": our_entry.get("code"), "evmias_code": entry.get("code")})
+    report["missing"] = [{"id": entry_id, **entry} for entry_id, entry in ours.items() if entry_id not in evmias]
+    return merged, report
+
+
+def _apply(name: str, synced: Dict[str, Any]) -> Dict[str, Any]:
+    """Объединяет загруженный справочник ЕВМИАС с текущим нашим и запоминает результат."""
+    base = get_reference(name)
+    merged, report = merge_directory(base, synced["entries"])
+    state = {"base": base, "synced_at": synced["synced_at"], "entries": synced["entries"],
+             "merged": merged, "report": report}
+    _synced[name] = state
+    return state
+
+
+def get_synced_reference(name: str) -> Dict[str, Any]:
+    """Справочник, объединённый с ЕВМИАС, или наш справочник, если синхронизации ещё не было."""
+    base = get_reference(name)
+    state = _synced.get(name)
+    if state is None:
+        return base
+    if state["base"] is not base:
+        # Наш справочник перезагружен - объединяем заново
+        state = _apply(name, state)
+    return state["merged"]
+
+
+def get_sync_report() -> Dict[str, Any]:
+    """Время синхронизации и отчёт о расхождениях по каждому справочнику (данные этого воркера)."""
+    return {
+        "pid": os.getpid(),
+        "directories": {
+            name: {
+                "object": spec["object"],
+                "synced_at": _synced[name]["synced_at"] if name in _synced else None,
+                "evmias_records": len(_synced[name]["entries"]) if name in _synced else None,
+                "report": _synced[name]["report"] if name in _synced else None,
+            }
+            for name, spec in SYNCED_DIRECTORIES.items()
+        },
+    }
+
+
+async def sync_evmias_directories(http_service: HTTPXClient, redis_client: redis.Redis) -> bool:
+    """
+    Загружает справочники из ЕВМИАС в Redis. Возвращает False, если загрузка уже выполняется
+    на другом воркере или недавно выполнена.
+    """
+    if not await redis_client.set(LOCK_KEY, os.getpid(), nx=True, ex=LOCK_TTL):
+        return False
+
+    try:
+        cookies = await set_cookies(http_service=http_service, redis_client=redis_client)
+        for name, spec in SYNCED_DIRECTORIES.items():
+            start_time = time.perf_counter()
+            fields = [spec["id_field"], spec["code_field"], spec["name_field"]]
+            rows = await fetch_evmias_directory(cookies, http_service, spec["object"], fields)
+            entries = _normalize_rows(rows, spec)
+            if not entries:
+                logger.warning(f"ЕВМИАС вернул пустой справочник {spec['object']}, сохранённый не изменён")
+                continue
+
+            synced = {"synced_at": datetime.now().isoformat(timespec="seconds"), "entries": entries}
+            await save_json(redis_client, _directory_key(name), synced, settings.REFERENCE_SYNC_TTL)
+            report = _apply(name, synced)["report"]
+            logger.info(f"Справочник {spec['object']} загружен из ЕВМИАС за {time.perf_counter() - start_time:.2f}s: "
+                        f"записей {len(entries)}")
+            if report["new"] or report["changed"]:
+                logger.warning(f"Справочник {spec['object']}: новые id без сопоставления {report['new']}, "
+                               f"другой код в ЕВМИАС {report['changed']}")
+    except Exception:
+        # Следующая попытка - на любом воркере, не дожидаясь истечения блокировки
+        await redis_client.delete(LOCK_KEY)
+        raise
+    # Блокировка не снимается: она не даёт другим воркерам повторить загрузку до следующего периода
+    await redis_client.expire(LOCK_KEY, max(settings.REFERENCE_SYNC_INTERVAL - 1, 1))
+    return True
+
+
+async def load_synced_directories(redis_client: redis.Redis) -> None:
+    """Берёт загруженные из ЕВМИАС справочники из Redis, если они новее тех, что в памяти."""
+    for name in SYNCED_DIRECTORIES:
+        synced = await load_json(redis_client, _directory_key(name))
+        if not isinstance(synced, dict) or not isinstance(synced.get("entries"), dict):
+            continue
+        current = _synced.get(name)
+        if current is None or current["synced_at"] != synced.get("synced_at"):
+            _apply(name, synced)
+
+
+async def _reference_sync_scheduler(app: FastAPI) -> None:
+    while True:
+        try:
+            await load_synced_directories(app.state.redis_client)
+            http_service = HTTPXClient(client=app.state.http_client)
+            await sync_evmias_directories(http_service, app.state.redis_client)
+        except Exception as e:
+            logger.error(f"Ошибка синхронизации справочников с ЕВМИАС: {e}", exc_info=True)
+        # Чаще периода загрузки: воркеры без блокировки подхватывают свежие данные из Redis
+        await asyncio.sleep(max(settings.REFERENCE_SYNC_INTERVAL // 10, 30))
+
+
+def start_reference_sync(app: FastAPI) -> None:
+    """Запускает фоновую синхронизацию справочников с ЕВМИАС, если она включена в настройках."""
+    if not settings.REFERENCE_SYNC_ENABLED:
+        return
+    app.state.reference_sync_task = asyncio.create_task(_reference_sync_scheduler(app))
+    logger.info(f"Синхронизация справочников с ЕВМИАС запущена (каждые {settings.REFERENCE_SYNC_INTERVAL} с).")
+
+
+async def stop_reference_sync(app: FastAPI) -> None:
+    """Останавливает фоновую синхронизацию справочников с ЕВМИАС."""
+    task = getattr(app.state, "reference_sync_task", None)
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Синхронизация справочников с ЕВМИАС остановлена.")
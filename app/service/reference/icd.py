@@ -0,0 +1,67 @@
+"""
+Индекс кодов МКБ-10 для правил, зависящих от диагноза.
+
+Правило задаётся списком диапазонов кодов вместо регулярного выражения:
+    "C"        - вся буква (C00.0-C99.9)
+    "E10"      - рубрика (E10.0-E10.9)
+    "K80.1"    - один код
+    "K60-K64"  - диапазон, границы - буква, рубрика или код ("M16.2-M17" - от M16.2 до M17.9)
+
+Набор правил компилируется один раз (compile_icd_rules) в словарь "код -> значение" по всем кодам вида
+A00.0, попадающим в диапазоны. Проверка кода - одно обращение к словарю, и число правил в наборе
+на неё не влияет. Коды другого вида (без подрубрики, с двумя знаками после точки) ни в одно правило не входят.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+ICD_BOUND_RE = re.compile(r"^([A-Z])(?:(\d{2})(?:\.(\d))?)?$")
+
+
+def _icd_code(position: int) -> str:
+    letter, rest = divmod(position, 1000)
+    return f"{chr(ord('A') + letter)}{rest // 10:02d}.{rest % 10}"
+
+
+def _icd_bounds(bound: str) -> Tuple[int, int]:
+    """Первая и последняя позиции кодов буквы, рубрики или кода (позиция - буква * 1000 + рубрика * 10 + подрубрика)."""
+    match = ICD_BOUND_RE.match(bound.strip().upper())
+    if not match:
+        raise ValueError(f"Некорректная граница диапазона МКБ-10: '{bound}'")
+    letter, category, subcategory = match.groups()
+    base = (ord(letter) - ord("A")) * 1000
+    if category is None:
+        return base, base + 999
+    base += int(category) * 10
+    if subcategory is None:
+        return base, base + 9
+    return base + int(subcategory), base + int(subcategory)
+
+
+def icd_range_codes(spec: str) -> List[str]:
+    """Все коды вида A00.0, входящие в диапазон spec ("C", "E10", "K80.1", "K60-K64")."""
+    first, _, last = spec.partition("-")
+    start = _icd_bounds(first)[0]
+    end = _icd_bounds(last or first)[1]
+    if start > end:
+        raise ValueError(f"Некорректный диапазон МКБ-10: '{spec}'")
+    return [_icd_code(position) for position in range(start, end + 1)]
+
+
+def compile_icd_rules(rules: Iterable[Tuple[Iterable[str], Any]]) -> Dict[str, Any]:
+    """
+    Компилирует набор правил (диапазоны кодов, значение) в индекс "код -> значение".
+    Если код попадает в несколько правил, действует первое.
+    """
+    index: Dict[str, Any] = {}
+    for specs, value in rules:
+        for spec in specs:
+            for code in icd_range_codes(spec):
+                index.setdefault(code, value)
+    return index
+
+
+def match_icd(index: Dict[str, Any], code: str | None, default: Any = None) -> Any:
+    """Значение правила, в которое попадает код диагноза, или default."""
+    if not code:
+        return default
+    return index.get(code.strip().upper(), default)
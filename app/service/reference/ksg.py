@@ -0,0 +1,208 @@
+"""
+Группировщик случаев по клинико-статистическим группам (КСГ) и расчёт стоимости случая.
+
+Таблицы КСГ года KSG_YEAR - файл KSG_DATA_DIR/ksg_<год>.json (готовит финансовый отдел по тарифному
+соглашению, в поставку не входит):
+    version             - версия таблиц
+    base_rates          - условия оказания помощи ("1" - стационар, "2" - дневной стационар) -> базовая ставка
+    level_coefficient   - коэффициент уровня медицинской организации (по умолчанию 1)
+    interrupted         - прерванный случай: max_bed_days (не больше стольких койко-дней), surgical_share
+                          и therapeutic_share (доля стоимости для групп по услуге и по диагнозу)
+    groups              - код КСГ -> name, conditions, kz (коэффициент затратоемкости), ku (управленческий
+                          коэффициент, по умолчанию 1), interruption (false - группа не бывает прерванной)
+    rules               - строки группировщика: ksg, diagnosis (коды МКБ-10 или рубрики), service (коды услуг),
+                          age ([от, до] лет) и bed_days ([от, до] койко-дней); пустой критерий не проверяется
+
+Таблицы компилируются при загрузке в индексы "код диагноза -> строки" и "код услуги -> строки",
+критерии строк и коэффициенты групп - в списки по номеру строки и группы, стоимость группы
+(базовая ставка * КЗ * КУ * коэффициент уровня) вычисляется заранее. Группировка случая - несколько
+обращений к словарям по его диагнозу и услугам и проверка найденных строк.
+
+Из подходящих строк выбирается группа с наибольшим КЗ, при равных КЗ - строка с большим числом
+критериев (диагноз и услуга). Файл проверяется при каждом обращении и перечитывается после изменения;
+если новый файл не читается, остаются прежние таблицы.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from app.core import get_settings, logger
+
+settings = get_settings()
+
+_tables: Dict[str, Any] | None = None
+
+
+def _tables_path() -> Path:
+    return Path(settings.KSG_DATA_DIR) / f"ksg_{settings.KSG_YEAR}.json"
+
+
+def _normalize_code(code: Any) -> str:
+    return str(code or "").strip().upper()
+
+
+def _range(value: Any, default_max: int) -> tuple[int, int]:
+    if not value:
+        return 0, default_max
+    low, high = value
+    return (0 if low is None else int(low)), (default_max if high is None else int(high))
+
+
+def compile_ksg_tables(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Компилирует таблицы КСГ в индексы группировщика."""
+    base_rates = {str(conditions): float(rate) for conditions, rate in document["base_rates"].items()}
+    level_coefficient = float(document.get("level_coefficient", 1.0))
+    interrupted = document.get("interrupted", {})
+
+    group_codes = list(document["groups"])
+    group_numbers = {code: number for number, code in enumerate(group_codes)}
+    groups = [document["groups"][code] for code in group_codes]
+    group_conditions = [str(group["conditions"]) for group in groups]
+    group_kz = [float(group["kz"]) for group in groups]
+    group_cost = [
+        base_rates[conditions] * kz * float(group.get("ku", 1.0)) * level_coefficient
+        for conditions, kz, group in zip(group_conditions, group_kz, groups)
+    ]
+
+    row_group: List[int] = []
+    row_diagnoses: List[frozenset | None] = []
+    row_age: List[tuple[int, int]] = []
+    row_bed_days: List[tuple[int, int]] = []
+    by_diagnosis: Dict[str, List[int]] = {}
+    by_service: Dict[str, List[int]] = {}
+    for number, rule in enumerate(document["rules"]):
+        if rule["ksg"] not in group_numbers:
+            raise ValueError(f"строка {number} группировщика ссылается на неизвестную КСГ {rule['ksg']}")
+        diagnoses = frozenset(_normalize_code(code) for code in rule.get("diagnosis") or ())
+        services = [_normalize_code(code) for code in rule.get("service") or ()]
+        if not diagnoses and not services:
+            raise ValueError(f"в строке {number} группировщика нет ни диагноза, ни услуги")
+
+        row_group.append(group_numbers[rule["ksg"]])
+        row_diagnoses.append(diagnoses or None)
+        row_age.append(_range(rule.get("age"), 200))
+        row_bed_days.append(_range(rule.get("bed_days"), 100_000))
+        # Строка с услугой ищется по услуге (диагноз проверяется отдельно), без услуги - по диагнозу
+        for code in services or diagnoses:
+            (by_service if services else by_diagnosis).setdefault(code, []).append(number)
+
+    return {
+        "version": str(document.get("version", "")),
+        "group_codes": group_codes,
+        "group_names": [group.get("name") for group in groups],
+        "group_conditions": group_conditions,
+        "group_kz": group_kz,
+        "group_cost": group_cost,
+        "group_interruption": [group.get("interruption", True) for group in groups],
+        "row_group": row_group,
+        "row_diagnoses": row_diagnoses,
+        "row_age": row_age,
+        "row_bed_days": row_bed_days,
+        "by_diagnosis": by_diagnosis,
+        "by_service": by_service,
+        "interrupted_max_bed_days": int(interrupted.get("max_bed_days", 3)),
+        "surgical_share": float(interrupted.get("surgical_share", 0.8)),
+        "therapeutic_share": float(interrupted.get("therapeutic_share", 0.5)),
+    }
+
+
+def get_ksg_tables() -> Dict[str, Any] | None:
+    """Таблицы КСГ года KSG_YEAR (перечитываются после изменения файла) или None, если их нет."""
+    global _tables
+    path = _tables_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return _tables
+    state = (str(path), stat.st_mtime_ns, stat.st_size)
+    if _tables is not None and _tables["state"] == state:
+        return _tables
+
+    try:
+        tables = compile_ksg_tables(json.loads(path.read_bytes()))
+    except Exception as e:
+        logger.error(f"Таблицы КСГ {path} не загружены: {e}", exc_info=True)
+        return _tables
+    tables.update(state=state, year=settings.KSG_YEAR, rules=len(tables["row_group"]))
+    _tables = tables
+    logger.info(f"Таблицы КСГ {settings.KSG_YEAR} загружены: версия {tables['version']}, "
+                f"групп {len(tables['group_codes'])}, строк {tables['rules']}")
+    return _tables
+
+
+def _diagnosis_matches(diagnoses: frozenset | None, code: str, rubric: str) -> bool:
+    return diagnoses is None or code in diagnoses or rubric in diagnoses
+
+
+def group_case(
+        tables: Dict[str, Any],
+        diagnosis: str | None,
+        services: Iterable[str] = (),
+        bed_days: int = 0,
+        age: int = 0,
+        medical_care_conditions: str = "1",
+) -> Dict[str, Any]:
+    """КСГ и стоимость одного случая по основному диагнозу, кодам услуг, койко-дням, возрасту и условиям."""
+    code = _normalize_code(diagnosis)
+    rubric = code[:3]
+    row_group, row_diagnoses = tables["row_group"], tables["row_diagnoses"]
+    row_age, row_bed_days = tables["row_age"], tables["row_bed_days"]
+    group_conditions, group_kz = tables["group_conditions"], tables["group_kz"]
+
+    best = None  # (КЗ, число критериев, номер строки, найдена по услуге)
+    candidates = [(number, False) for number in tables["by_diagnosis"].get(code, ())]
+    if rubric != code:
+        candidates += [(number, False) for number in tables["by_diagnosis"].get(rubric, ())]
+    for service in services:
+        candidates += [(number, True) for number in tables["by_service"].get(_normalize_code(service), ())]
+
+    for number, by_service in candidates:
+        group = row_group[number]
+        age_from, age_to = row_age[number]
+        days_from, days_to = row_bed_days[number]
+        if (group_conditions[group] != medical_care_conditions
+                or not age_from <= age <= age_to
+                or not days_from <= bed_days <= days_to
+                or not _diagnosis_matches(row_diagnoses[number], code, rubric)):
+            continue
+        key = (group_kz[group], by_service + (row_diagnoses[number] is not None), number, by_service)
+        if best is None or key[:2] > best[:2]:
+            best = key
+
+    if best is None:
+        return {"ksg": None, "cost": None}
+
+    _, _, number, by_service = best
+    group = row_group[number]
+    interrupted = tables["group_interruption"][group] and bed_days <= tables["interrupted_max_bed_days"]
+    cost = tables["group_cost"][group]
+    if interrupted:
+        cost *= tables["surgical_share"] if by_service else tables["therapeutic_share"]
+    return {
+        "ksg": tables["group_codes"][group],
+        "name": tables["group_names"][group],
+        "kz": group_kz[group],
+        "grouped_by": "service" if by_service else "diagnosis",
+        "interrupted": interrupted,
+        "cost": round(cost, 2),
+    }
+
+
+def group_cases(tables: Dict[str, Any], cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Группирует пакет случаев. Одинаковые по критериям случаи (частые за месяц) группируются один раз.
+    """
+    results, grouped = [], {}
+    for case in cases:
+        key = (
+            _normalize_code(case.get("diagnosis")),
+            tuple(sorted(_normalize_code(service) for service in case.get("services") or ())),
+            case.get("bed_days", 0),
+            case.get("age", 0),
+            case.get("medical_care_conditions", "1"),
+        )
+        result = grouped.get(key)
+        if result is None:
+            result = grouped[key] = group_case(tables, *key)
+        results.append({"case_id": case.get("case_id"), **result})
+    return results
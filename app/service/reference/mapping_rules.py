@@ -0,0 +1,141 @@
+"""
+Правила сопоставления данных ЕВМИАС с полями формы (app/mapper/mapping_rules.json).
+
+Файл правил:
+    department_name                   - нормализация LpuSection_Name: prefixes (начало названия -> отделение),
+                                        remove (удаляемые части названия), aliases (название -> отделение)
+    departments                       - отделение -> code (код отделения), medical_care_conditions (условия
+                                        оказания помощи, по умолчанию default_medical_care_conditions) и
+                                        bed_profile_rules (имя набора правил коррекции профиля койки)
+    bed_profile_rules                 - наборы правил: диапазоны кодов МКБ-10 (app/service/reference/icd.py)
+                                        -> название профиля койки; действует первое совпавшее правило
+    medical_care_profile_corrections  - скорректированный профиль койки -> профиль медицинской помощи
+    medical_care_form                 - PrehospType_id -> код формы оказания помощи
+    disease_type                      - DeseaseType_id -> код характера основного заболевания
+    outcome_corrections               - замена кода исхода при заданных условиях оказания помощи
+
+Правила компилируются в таблицы решений при каждой загрузке файла (app/service/reference/store.py).
+Для каждого известного варианта LpuSection_Name (название отделения, его синонимы и варианты с удаляемыми
+частями) заранее вычислено отделение со всеми зависящими от него значениями, поэтому цепочка
+"LpuSection_Name -> название, код, условия, правила профиля койки" - одно обращение к словарю. Неизвестные названия вычисляются по правилам
+и запоминаются (до MAX_COMPUTED_SECTIONS штук).
+"""
+from typing import Any, Dict
+
+from app.service.reference.icd import compile_icd_rules
+from app.service.reference.store import get_reference_index, register_reference_index
+
+MAX_COMPUTED_SECTIONS = 1024
+
+
+def _normalize_department_name(rules: Dict[str, Any], lpu_section_name: str | None) -> str | None:
+    name = (lpu_section_name or "").strip()
+    if not name:
+        return None
+
+    naming = rules["department_name"]
+    for prefix, department_name in naming["prefixes"].items():
+        if name.startswith(prefix):
+            return department_name
+    for part in naming["remove"]:
+        name = name.replace(part, "")
+    return naming["aliases"].get(name, name)
+
+
+def _department_entry(tables: Dict[str, Any], department_name: str | None) -> Dict[str, Any]:
+    return tables["departments"].get(department_name) or {
+        "name": department_name,
+        "code": None,
+        "medical_care_conditions": tables["default_medical_care_conditions"],
+        "bed_profile_rules": {},
+    }
+
+
+def compile_mapping_rules(rules: Dict[str, Any]) -> Dict[str, Any]:
+    """Компилирует правила сопоставления в таблицы решений."""
+    bed_profile_indexes = {
+        rule_set: compile_icd_rules((rule["codes"], rule["replacement"]) for rule in rule_list)
+        for rule_set, rule_list in rules["bed_profile_rules"].items()
+    }
+    tables: Dict[str, Any] = {
+        "rules": rules,
+        "default_medical_care_conditions": rules["default_medical_care_conditions"],
+        "departments": {
+            department_name: {
+                "name": department_name,
+                "code": department.get("code"),
+                "medical_care_conditions": department.get(
+                    "medical_care_conditions", rules["default_medical_care_conditions"]
+                ),
+                "bed_profile_rules": bed_profile_indexes[department["bed_profile_rules"]]
+                if department.get("bed_profile_rules") else {},
+            }
+            for department_name, department in rules["departments"].items()
+        },
+        "medical_care_profile_corrections": dict(rules["medical_care_profile_corrections"]),
+        "medical_care_form": dict(rules["medical_care_form"]),
+        "disease_type": dict(rules["disease_type"]),
+        "outcome_corrections": {
+            (correction["medical_care_conditions"], correction["outcome_code"]): correction["replacement"]
+            for correction in rules["outcome_corrections"]
+        },
+    }
+
+    # Все известные варианты LpuSection_Name: названия отделений и синонимы, в том числе с удаляемыми частями
+    naming = rules["department_name"]
+    known_names = [*tables["departments"], *naming["aliases"]]
+    candidates = {name: None for name in known_names}
+    for name in known_names:
+        for part in naming["remove"]:
+            candidates[f"{name}{part}"] = None
+    sections: Dict[str | None, Dict[str, Any]] = {}
+    for section_name in candidates:
+        sections[section_name] = _department_entry(tables, _normalize_department_name(rules, section_name))
+    sections[None] = sections[""] = _department_entry(tables, None)
+    tables["sections"] = sections
+    tables["computed_sections"] = 0
+    return tables
+
+
+register_reference_index("mapping_rules", compile_mapping_rules)
+
+
+def resolve_department(lpu_section_name: str | None) -> Dict[str, Any]:
+    """
+    Отделение по LpuSection_Name: name (нормализованное название), code, medical_care_conditions
+    и bed_profile_rules (индекс МКБ-10 -> профиль койки).
+    """
+    tables = get_reference_index("mapping_rules")
+    entry = tables["sections"].get(lpu_section_name)
+    if entry is None:
+        entry = _department_entry(tables, _normalize_department_name(tables["rules"], lpu_section_name))
+        if tables["computed_sections"] < MAX_COMPUTED_SECTIONS:
+            tables["sections"][lpu_section_name] = entry
+            tables["computed_sections"] += 1
+    return entry
+
+
+def department_by_name(department_name: str | None) -> Dict[str, Any]:
+    """Отделение по уже нормализованному названию."""
+    return _department_entry(get_reference_index("mapping_rules"), department_name)
+
+
+def medical_care_profile_correction(bed_profile_name: str | None) -> str | None:
+    """Профиль медицинской помощи, которого требует скорректированный профиль койки, или None."""
+    return get_reference_index("mapping_rules")["medical_care_profile_corrections"].get(bed_profile_name)
+
+
+def medical_care_form_code(prehosp_type_id: str) -> str | None:
+    """Код формы оказания медицинской помощи по PrehospType_id."""
+    return get_reference_index("mapping_rules")["medical_care_form"].get(prehosp_type_id)
+
+
+def disease_type_code(desease_type_id: Any) -> str | None:
+    """Код характера основного заболевания по DeseaseType_id."""
+    return get_reference_index("mapping_rules")["disease_type"].get(desease_type_id)
+
+
+def correct_outcome_code(outcome_code: Any, medical_care_conditions: str | None) -> Any:
+    """Код исхода с учётом замен для условий оказания помощи (исходный, если замены нет)."""
+    corrections = get_reference_index("mapping_rules")["outcome_corrections"]
+    return corrections.get((medical_care_conditions, outcome_code), outcome_code)
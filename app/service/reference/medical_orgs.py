@@ -0,0 +1,178 @@
+"""
+Индекс справочника медицинских организаций (app/mapper/medical_orgs.json) для поиска направившей организации.
+
+Ключ справочника - полное наименование организации, в aliases - другие наименования той же организации
+в ЕВМИАС (сокращённые, устаревшие), которые не сводятся к полному нормализацией регистра, пробелов и кавычек.
+
+Индекс строится при каждой загрузке справочника (app/service/reference/store.py). Наименования (полное, сокращённое и aliases) приводятся
+к одному виду: верхний регистр, Ё -> Е, кавычки любого вида заменены пробелом, без пробелов вокруг
+дефиса и после "№", пробелы схлопнуты. Поиск по нормализованному наименованию, ИНН, ОГРН и коду
+организации - обращение к словарю. Если точного совпадения нет, наименование ищется по триграммам
+(как pg_trgm): кандидаты берутся только из списков триграмм запроса, и организация принимается,
+если числа в наименованиях совпадают и сходство не меньше MEDICAL_ORG_FUZZY_THRESHOLD (среди организаций
+с ИНН или ОГРН направившей - не меньше MEDICAL_ORG_INN_FUZZY_THRESHOLD).
+"""
+import re
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from app.core import get_settings, logger
+from app.service.reference.store import get_reference_index, register_reference_index
+
+settings = get_settings()
+
+QUOTES_RE = re.compile(r"[\"'`«»“”„]")
+HYPHEN_RE = re.compile(r"\s*-\s*")
+NUMBER_SIGN_RE = re.compile(r"№\s*")
+NUMBER_RE = re.compile(r"\d+")
+
+
+def normalize_org_name(name: str) -> str:
+    """Приводит наименование организации к виду, в котором оно хранится в индексе."""
+    name = QUOTES_RE.sub(" ", name.upper().replace("Ё", "Е"))
+    name = NUMBER_SIGN_RE.sub("№", HYPHEN_RE.sub("-", name))
+    return " ".join(name.split())
+
+
+def _trigrams(normalized_name: str) -> set[str]:
+    """Триграммы наименования; каждое слово дополняется двумя пробелами в начале и одним в конце."""
+    trigrams = set()
+    for word in normalized_name.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def _build_index(medical_orgs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    by_name: Dict[str, Dict[str, Any]] = {}
+    by_code: Dict[str, Dict[str, Any]] = {}
+    by_inn: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    by_ogrn: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    for key, org in medical_orgs.items():
+        for name in (key, org.get("name"), org.get("short_name"), *org.get("aliases", [])):
+            if not name:
+                continue
+            normalized = normalize_org_name(name)
+            existing = by_name.setdefault(normalized, org)
+            if existing is not org:
+                logger.warning(f"Наименование '{name}' относится к нескольким организациям справочника")
+        by_code[str(org["code"])] = org
+        by_inn[str(org["inn"])].append(org)
+        by_ogrn[str(org["ogrn"])].append(org)
+
+    names = list(by_name)
+    name_trigrams = [_trigrams(name) for name in names]
+    name_numbers = [set(NUMBER_RE.findall(name)) for name in names]
+    by_trigram: Dict[str, List[int]] = defaultdict(list)
+    for position, trigrams in enumerate(name_trigrams):
+        for trigram in trigrams:
+            by_trigram[trigram].append(position)
+
+    return {
+        "by_name": by_name,
+        "by_code": by_code,
+        "by_inn": dict(by_inn),
+        "by_ogrn": dict(by_ogrn),
+        "names": names,
+        "name_trigrams": name_trigrams,
+        "name_numbers": name_numbers,
+        "by_trigram": dict(by_trigram),
+    }
+
+
+register_reference_index("medical_orgs", _build_index)
+
+
+def _fuzzy_match(
+        index: Dict[str, Any],
+        normalized_name: str,
+        candidates: List[Dict[str, Any]] | None = None,
+        threshold: float | None = None,
+) -> tuple[Dict[str, Any], float] | None:
+    """
+    Наиболее похожая по триграммам организация и её сходство или None, если сходство ниже порога
+    (threshold, по умолчанию MEDICAL_ORG_FUZZY_THRESHOLD). candidates - ограничить поиск этими организациями.
+    Числа в наименованиях должны совпадать: "поликлиника № 1" и "поликлиника № 5" похожи по триграммам,
+    но это разные организации.
+    """
+    query = _trigrams(normalized_name)
+    numbers = set(NUMBER_RE.findall(normalized_name))
+    shared: Dict[int, int] = defaultdict(int)
+    for trigram in query:
+        for position in index["by_trigram"].get(trigram, ()):
+            shared[position] += 1
+
+    best, best_similarity = None, 0.0
+    for position, count in shared.items():
+        if index["name_numbers"][position] != numbers:
+            continue
+        org = index["by_name"][index["names"][position]]
+        if candidates is not None and not any(org is candidate for candidate in candidates):
+            continue
+        similarity = count / (len(query) + len(index["name_trigrams"][position]) - count)
+        if similarity > best_similarity:
+            best, best_similarity = org, similarity
+
+    if threshold is None:
+        threshold = settings.MEDICAL_ORG_FUZZY_THRESHOLD
+    if best is None or best_similarity < threshold:
+        return None
+    return best, best_similarity
+
+
+def find_medical_org(
+        name: str | None = None,
+        *,
+        inn: str | None = None,
+        ogrn: str | None = None,
+        code: str | None = None,
+) -> Dict[str, Any] | None:
+    """
+    Ищет организацию в справочнике. Возвращает запись справочника или None.
+
+    - по коду: find_medical_org(code="1234") - организация с этим кодом;
+    - по нормализованному наименованию: find_medical_org('ГБУЗ "ГКБ № 1"') и 'гбуз гкб №1' - одна запись;
+    - только по ИНН или ОГРН: find_medical_org(inn="7701234567") - единственная организация с этим ИНН;
+      если у ИНН несколько организаций (головная и филиалы), выбрать без наименования нельзя - None;
+    - по наименованию среди организаций с тем же ИНН или ОГРН: find_medical_org("ГКБ 1 филиал 2", inn=...) -
+      наиболее похожая из них, сходство не ниже MEDICAL_ORG_INN_FUZZY_THRESHOLD. Порог ниже общего:
+      реквизиты уже совпали, наименование только выбирает между головной организацией и филиалами;
+    - по похожему наименованию среди всех организаций (сходство не ниже MEDICAL_ORG_FUZZY_THRESHOLD).
+    """
+    index = get_reference_index("medical_orgs")
+    if code and (org := index["by_code"].get(str(code).strip())):
+        return org
+
+    normalized = normalize_org_name(name) if name else ""
+    if normalized and (org := index["by_name"].get(normalized)):
+        return org
+
+    for label, value, by_value in (("ИНН", inn, index["by_inn"]), ("ОГРН", ogrn, index["by_ogrn"])):
+        orgs = by_value.get(str(value).strip()) if value else None
+        if not orgs:
+            continue
+        if not normalized:
+            if len(orgs) == 1:
+                return orgs[0]
+            logger.warning(f"По {label} {value} найдено {len(orgs)} организаций, без наименования выбрать нельзя")
+            continue
+        # ИНН и ОГРН общие у организации и её филиалов, поэтому и единственная запись с ними
+        # принимается только при похожем наименовании: иначе неизвестный филиал получил бы код головной организации
+        match = _fuzzy_match(index, normalized, orgs, settings.MEDICAL_ORG_INN_FUZZY_THRESHOLD)
+        if match:
+            org, similarity = match
+            logger.info(f"Организация '{name}' сопоставлена по {label} {value} и сходству наименования "
+                        f"({similarity:.2f}) с '{org['name']}'")
+            return org
+
+    if not normalized:
+        return None
+    match = _fuzzy_match(index, normalized)
+    if match is None:
+        logger.warning(f"Организация '{name}' не найдена в справочнике организаций")
+        return None
+
+    org, similarity = match
+    logger.info(f"Организация '{name}' сопоставлена по сходству наименования ({similarity:.2f}) с '{org['name']}'")
+    return org
@@ -0,0 +1,232 @@
+"""
+Справочники (профили коек, исходы, профили медицинской помощи, медицинские организации, правила
+сопоставления) с версиями и перезагрузкой без перезапуска воркеров.
+
+Справочник - JSON-файл {"version": "...", "data": ...}. Файлы из поставки лежат в app/mapper,
+файл с тем же именем в REFERENCE_DATA_DIR их заменяет (каталог data смонтирован в контейнер,
+поэтому новую версию справочника, например НСИ V020, можно положить без пересборки образа).
+
+Каждый воркер держит снимок: данные всех справочников и построенные по ним индексы
+(register_reference_index). Раз в REFERENCE_RELOAD_INTERVAL секунд или по сигналу SIGUSR2,
+отправленному воркеру, изменённые файлы читаются заново. Новый снимок собирается целиком, включая
+индексы, и заменяет прежний одним присваиванием, поэтому запрос видит либо старые, либо новые
+данные и индексы, но не их смесь. Если файл не читается или индекс по нему не строится,
+остаётся прежний снимок. Загруженные версии каждый воркер сообщает в Redis (get_worker_reference_versions).
+"""
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+from redis.exceptions import RedisError
+
+from app.core import get_settings, logger
+
+settings = get_settings()
+
+BUNDLED_DIR = Path(__file__).resolve().parents[2] / "mapper"
+REFERENCE_NAMES = ("bed_profiles", "disease_outcome_ids", "medical_care_profile", "medical_orgs", "mapping_rules")
+WORKERS_KEY = "reference:workers"
+
+_builders: Dict[str, Callable[[Any], Any]] = {}
+_snapshot: Dict[str, Any] | None = None
+
+
+def register_reference_index(name: str, builder: Callable[[Any], Any]) -> None:
+    """Регистрирует построение индекса по данным справочника; индекс перестраивается при каждой его загрузке."""
+    _builders[name] = builder
+
+
+def _source_path(name: str) -> Path:
+    override = Path(settings.REFERENCE_DATA_DIR) / f"{name}.json"
+    return override if override.is_file() else BUNDLED_DIR / f"{name}.json"
+
+
+def _file_state(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _load_directory(name: str) -> Dict[str, Any]:
+    path = _source_path(name)
+    state = _file_state(path)
+    content = path.read_bytes()
+    document = json.loads(content)
+    if not isinstance(document, dict) or "data" not in document:
+        raise ValueError(f"в {path} нет ключа data")
+    return {
+        "data": document["data"],
+        "version": str(document.get("version", "")),
+        "source": str(path),
+        "sha256": hashlib.sha256(content).hexdigest()[:16],
+        "state": state,
+        "index": _builders[name](document["data"]) if name in _builders else None,
+    }
+
+
+def _build_snapshot(previous: Dict[str, Any] | None, force: bool) -> Dict[str, Any] | None:
+    """Новый снимок с перечитанными изменёнными справочниками или None, если ничего не изменилось."""
+    directories = dict(previous["directories"]) if previous else {}
+    changed = []
+    for name in REFERENCE_NAMES:
+        current = directories.get(name)
+        if not force and current and _file_state(_source_path(name)) == current["state"]:
+            continue
+        directories[name] = _load_directory(name)
+        changed.append(name)
+    if not changed:
+        return None
+    return {"loaded_at": datetime.now().isoformat(timespec="seconds"), "changed": changed, "directories": directories}
+
+
+def _current_snapshot() -> Dict[str, Any]:
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = _build_snapshot(None, force=True)
+    return _snapshot
+
+
+def get_reference(name: str) -> Any:
+    """Данные справочника из текущего снимка."""
+    return _current_snapshot()["directories"][name]["data"]
+
+
+def get_reference_index(name: str) -> Any:
+    """Индекс, построенный по справочнику зарегистрированной функцией."""
+    directory = _current_snapshot()["directories"][name]
+    if directory["index"] is None and name in _builders:
+        # Функция зарегистрирована после загрузки снимка (при импорте модулей)
+        directory["index"] = _builders[name](directory["data"])
+    return directory["index"]
+
+
+def reload_reference_data(force: bool = False) -> bool:
+    """Перечитывает изменённые справочники (force - все). Возвращает True, если снимок заменён."""
+    global _snapshot
+    try:
+        snapshot = _build_snapshot(_snapshot, force)
+    except Exception as e:
+        logger.error(f"Справочники не перезагружены, остаются прежние версии: {e}", exc_info=True)
+        return False
+    if snapshot is None:
+        return False
+
+    _snapshot = snapshot
+    versions = ", ".join(f"{name} {snapshot['directories'][name]['version']}" for name in snapshot["changed"])
+    logger.info(f"Справочники перезагружены: {versions}")
+    return True
+
+
+def get_reference_versions() -> Dict[str, Any]:
+    """Версии справочников, загруженных этим воркером."""
+    snapshot = _current_snapshot()
+    return {
+        "pid": os.getpid(),
+        "loaded_at": snapshot["loaded_at"],
+        "directories": {
+            name: {
+                "version": directory["version"],
+                "source": directory["source"],
+                "sha256": directory["sha256"],
+                "records": len(directory["data"]) if isinstance(directory["data"], (dict, list)) else None,
+            }
+            for name, directory in snapshot["directories"].items()
+        },
+    }
+
+
+async def _report_versions(redis_client: redis.Redis) -> None:
+    report = {**get_reference_versions(), "reported_at": time.time()}
+    try:
+        await redis_client.hset(WORKERS_KEY, str(report["pid"]), json.dumps(report, ensure_ascii=False))
+    except RedisError as e:
+        logger.warning(f"Не удалось сохранить версии справочников в Redis: {e}")
+
+
+async def get_worker_reference_versions(redis_client: redis.Redis) -> Dict[str, Any]:
+    """
+    Версии справочников по воркерам, которые сообщали о себе за последние три периода проверки,
+    и по текущему воркеру. Записи остановленных воркеров удаляются. Если Redis недоступен -
+    только по текущему воркеру.
+    """
+    max_age = max(settings.REFERENCE_RELOAD_INTERVAL, 1) * 3
+    try:
+        reports = await redis_client.hgetall(WORKERS_KEY)
+    except RedisError as e:
+        logger.warning(f"Не удалось прочитать версии справочников воркеров из Redis: {e}")
+        reports = {}
+    workers, stale = {}, []
+    for pid, raw_report in reports.items():
+        pid = pid.decode() if isinstance(pid, bytes) else pid
+        try:
+            report = json.loads(raw_report)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            stale.append(pid)
+            continue
+        if time.time() - report.get("reported_at", 0) > max_age:
+            stale.append(pid)
+            continue
+        workers[pid] = report
+    if stale:
+        try:
+            await redis_client.hdel(WORKERS_KEY, *stale)
+        except RedisError as e:
+            logger.warning(f"Не удалось удалить устаревшие версии справочников воркеров из Redis: {e}")
+    # Ответивший воркер - по текущему снимку, даже если проверка справочников отключена
+    workers[str(os.getpid())] = {**get_reference_versions(), "reported_at": time.time()}
+    return {"current_pid": os.getpid(), "workers": workers}
+
+
+async def _reference_watcher(app: FastAPI, reload_requested: asyncio.Event) -> None:
+    while True:
+        force = reload_requested.is_set()
+        reload_requested.clear()
+        reload_reference_data(force=force)
+        await _report_versions(app.state.redis_client)
+        # Без периодической проверки (REFERENCE_RELOAD_INTERVAL <= 0) - только по сигналу
+        timeout = settings.REFERENCE_RELOAD_INTERVAL if settings.REFERENCE_RELOAD_INTERVAL > 0 else None
+        try:
+            await asyncio.wait_for(reload_requested.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_reference_watch(app: FastAPI) -> None:
+    """
+    Запускает перезагрузку справочников по сигналу SIGUSR2 и, если REFERENCE_RELOAD_INTERVAL > 0,
+    периодическую проверку их файлов.
+    """
+    _current_snapshot()
+    reload_requested = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, reload_requested.set)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        logger.warning("Перезагрузка справочников по сигналу недоступна, только по изменению файлов")
+    app.state.reference_task = asyncio.create_task(_reference_watcher(app, reload_requested))
+    if settings.REFERENCE_RELOAD_INTERVAL > 0:
+        logger.info(f"Проверка справочников запущена (каждые {settings.REFERENCE_RELOAD_INTERVAL} с).")
+    else:
+        logger.info("Периодическая проверка справочников отключена, перезагрузка - по сигналу SIGUSR2.")
+
+
+async def stop_reference_watch(app: FastAPI) -> None:
+    """Останавливает проверку справочников."""
+    task = getattr(app.state, "reference_task", None)
+    if task:
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR2)
+        except (AttributeError, NotImplementedError, RuntimeError):
+            pass
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Проверка справочников остановлена.")
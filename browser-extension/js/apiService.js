@@ -1,10 +1,14 @@
 // browser-extension/js/apiService.js
 
 //const API_SEARCH_URL = "http://192.168.0.249:8082/extension/search";
+//const API_SEARCH_STREAM_URL = "http://192.168.0.249:8082/extension/search/stream";
 //const API_ENRICH_URL = "http://192.168.0.249:8082/extension/enrich-data";
+//const API_SUBMISSIONS_URL = "http://192.168.0.249:8082/extension/submissions";
 
 const API_SEARCH_URL = "http://0.0.0.0:8082/extension/search";
+const API_SEARCH_STREAM_URL = "http://0.0.0.0:8082/extension/search/stream";
 const API_ENRICH_URL = "http://0.0.0.0:8082/extension/enrich-data";
+const API_SUBMISSIONS_URL = "http://0.0.0.0:8082/extension/submissions";
 
 /**
  * Вспомогательная функция для обработки ответа API.
@@ -59,6 +63,50 @@ export async function fetchSearchResults(searchPayload) {
     return handleApiResponse(response, "поиска пациентов");
 }
 
+/**
+ * Запрашивает список пациентов потоково (NDJSON) и передаёт каждую запись в onItem по мере получения.
+ * @param {object} searchPayload - Объект с параметрами поиска.
+ * @param {function(object): void} onItem - Вызывается для каждой полученной записи.
+ * @returns {Promise<number>} - Promise с количеством полученных записей.
+ */
+export async function streamSearchResults(searchPayload, onItem) {
+    console.log("[API] Запрос на потоковый поиск пациентов:", searchPayload);
+    const response = await fetch(API_SEARCH_STREAM_URL, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(searchPayload),
+    });
+    if (!response.ok) {
+        await handleApiResponse(response, "поиска пациентов");
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let count = 0;
+
+    const handleLine = (line) => {
+        if (!line.trim()) return;
+        const item = JSON.parse(line);
+        if (item.error) {
+            throw new Error(item.error);
+        }
+        count += 1;
+        onItem(item);
+    };
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split("\n");
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+    }
+    handleLine(buffer + decoder.decode());
+    return count;
+}
+
 /**
  * Запрашивает обогащенные данные для пациента.
  * @param {object} enrichmentPayload - Объект с данными для обогащения.
@@ -72,4 +120,19 @@ export async function fetchEnrichedDataForPatient(enrichmentPayload) {
         body: JSON.stringify(enrichmentPayload),
     });
     return handleApiResponse(response, "обогащения данных");
-}
\ No newline at end of file
+}
+/**
+ * Сообщает серверу результат заполнения формы для госпитализации.
+ * @param {string} eventId - EvnPS_id госпитализации.
+ * @param {string} status - "filled" или "failed".
+ * @returns {Promise<object>} - Promise с сохранённой отметкой.
+ */
+export async function reportSubmission(eventId, status = "filled") {
+    console.log(`[API] Отметка о заполнении формы: ${eventId} (${status})`);
+    const response = await fetch(API_SUBMISSIONS_URL, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ event_id: String(eventId), status }),
+    });
+    return handleApiResponse(response, "отметки о заполнении");
+}
@@ -1,10 +1,29 @@
 // browser-extension/js/background.js
 import { injectionTargetFunction } from './pageInjector.js';
+import { reportSubmission } from './apiService.js';
 
 const TITLE_ENABLED = 'ЕВМИАС -> ОМС: Заполнить форму';
 const TITLE_DISABLED = 'ЕВМИАС -> ОМС (неактивно)';
 const REASON_DISABLED = 'Перейдите на страницу ввода данных в ГИС ОМС для активации.';
 
+// Госпитализация, форма для которой заполняется на вкладке. Хранится в session storage,
+// так как service worker может быть выгружен до окончания заполнения.
+async function rememberFillCase(tabId, caseId) {
+    await chrome.storage.session.set({ [`fillCase:${tabId}`]: caseId });
+}
+
+async function reportFillResult(tabId, status) {
+    const key = `fillCase:${tabId}`;
+    const { [key]: caseId } = await chrome.storage.session.get(key);
+    if (!caseId) return;
+    await chrome.storage.session.remove(key);
+    try {
+        await reportSubmission(caseId, status);
+    } catch (error) {
+        console.error(`[Background] Не удалось отправить отметку о заполнении для ${caseId}:`, error);
+    }
+}
+
 async function setActionState(tabId, enabled) {
     if (enabled) {
         await chrome.action.enable(tabId);
@@ -36,6 +55,10 @@ chrome.runtime.onMessage.addListener(async (message, sender, sendResponse) => {
 
         console.log(`[Background] Получены данные для автозаполнения на вкладке ${tab.id}. Запускаем инъекцию...`);
 
+        if (message.caseId) {
+            await rememberFillCase(tab.id, message.caseId);
+        }
+
         try {
             await chrome.scripting.executeScript({
                 target: { tabId: tab.id }, // Используем ID найденной вкладки
@@ -67,11 +90,18 @@ chrome.runtime.onMessage.addListener(async (message, sender, sendResponse) => {
     // Логируем финальные сообщения в консоль, так как уведомлений у нас нет
     if (message.action === 'injectionError' || message.action === 'formFillError') {
         console.error(`[Background] Ошибка от pageInjector: ${message.error}`);
+        if (message.action === 'formFillError' && sender.tab) {
+            await reportFillResult(sender.tab.id, 'failed');
+        }
         return;
     }
 
 
     if (message.action === 'formFillError' || message.action === 'formFillComplete') {
+        if (message.action === 'formFillComplete' && sender.tab) {
+            await reportFillResult(sender.tab.id, 'filled');
+        }
+
         // По-прежнему останавливаем аудио, это важно
         if (isOffscreenApiSupported && await chrome.offscreen.hasDocument()) {
             await sendActionToOffscreen('stop_audio');
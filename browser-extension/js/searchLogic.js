@@ -31,64 +31,21 @@ export async function searchPatient() {
   };
 
   try {
-    const results = await api.fetchSearchResults(searchPayload);
-    if (!Array.isArray(results)) {
-      console.error("[SearchLogic] API поиска вернул не массив:", results);
-      throw new Error("Получен некорректный формат данных от сервера поиска.");
-    }
+    // Записи отображаются по мере получения, не дожидаясь всего списка
+    const count = await api.streamSearchResults(searchPayload, (item) => {
+      if (resultsList.childElementCount === 0) {
+        ui.hideLoading();
+      }
+      renderResultItem(item);
+    });
 
-    if (results.length === 0) {
+    if (count === 0) {
       ui.showUserMessage("Записи не найдены", "info");
       return;
     }
 
     ui.hideLoading();
     ui.setSearchButtonState(true, "Искать");
-
-    results.forEach((item) => {
-      const person =
-        `${item.Person_Surname || ""} ${item.Person_Firname || ""} ${item.Person_Secname || ""} (${item.Person_Birthday || "N/A"})`.trim();
-      const card = item.EvnPS_NumCard || "N/A";
-      const hospDate = item.EvnPS_setDate || "N/A";
-
-      const li = document.createElement("li");
-      li.innerHTML = `
-                <div><strong>${person}</strong></div>
-                <div><br></div>
-                <div>Номер карты: ${card}</div>
-                <div>Дата госпитализации: ${hospDate}</div>
-                <div><br></div>
-                <button class="select-btn">Выбрать</button>
-            `;
-      resultsList.appendChild(li);
-
-      const selectButton = li.querySelector("button");
-      selectButton.addEventListener("click", async () => {
-        ui.showLoading();
-        ui.setSelectButtonState(selectButton, false, "Обработка...");
-        ui.clearUserMessages();
-
-        try {
-          const enrichmentPayload = { started_data: item };
-          const enrichedDataForForm = await api.fetchEnrichedDataForPatient(enrichmentPayload);
-
-          // 1. Отправляем сообщение с данными фоновому скрипту для выполнения в фоне.
-          chrome.runtime.sendMessage({
-              action: 'startFormFill',
-              data: enrichedDataForForm
-          });
-
-          // 2. Немедленно закрываем popup. Фоновый скрипт сделает остальную работу.
-          window.close();
-
-        } catch (err) {
-          console.error("[SearchLogic] Ошибка при обогащении:", err);
-          ui.showUserError(err.message);
-          ui.setSelectButtonState(selectButton, true, "Выбрать");
-          ui.hideLoading();
-        }
-      });
-    });
   } catch (err) {
     console.error("[SearchLogic] Ошибка API поиска:", err);
     ui.showUserError(err.message);
@@ -98,4 +55,51 @@ export async function searchPatient() {
       const finalSearchBtn = document.getElementById("searchBtn");
       if (finalSearchBtn && finalSearchBtn.disabled) ui.setSearchButtonState(true, "Искать");
   }
-}
\ No newline at end of file
+}
+
+function renderResultItem(item) {
+  const person =
+    `${item.Person_Surname || ""} ${item.Person_Firname || ""} ${item.Person_Secname || ""} (${item.Person_Birthday || "N/A"})`.trim();
+  const card = item.EvnPS_NumCard || "N/A";
+  const hospDate = item.EvnPS_setDate || "N/A";
+
+  const li = document.createElement("li");
+  li.innerHTML = `
+            <div><strong>${person}</strong></div>
+            <div><br></div>
+            <div>Номер карты: ${card}</div>
+            <div>Дата госпитализации: ${hospDate}</div>
+            <div><br></div>
+            <button class="select-btn">Выбрать</button>
+        `;
+  resultsList.appendChild(li);
+
+  const selectButton = li.querySelector("button");
+  selectButton.addEventListener("click", async () => {
+    ui.showLoading();
+    ui.setSelectButtonState(selectButton, false, "Обработка...");
+    ui.clearUserMessages();
+
+    try {
+      // Сервер хранит полную строку поиска под handle; полные строки приходят только без handle
+      const enrichmentPayload = item.handle ? { handle: item.handle } : { started_data: item };
+      const enrichedDataForForm = await api.fetchEnrichedDataForPatient(enrichmentPayload);
+
+      // 1. Отправляем сообщение с данными фоновому скрипту для выполнения в фоне.
+      chrome.runtime.sendMessage({
+          action: 'startFormFill',
+          data: enrichedDataForForm,
+          caseId: item.EvnPS_id
+      });
+
+      // 2. Немедленно закрываем popup. Фоновый скрипт сделает остальную работу.
+      window.close();
+
+    } catch (err) {
+      console.error("[SearchLogic] Ошибка при обогащении:", err);
+      ui.showUserError(err.message);
+      ui.setSelectButtonState(selectButton, true, "Выбрать");
+      ui.hideLoading();
+    }
+  });
+}
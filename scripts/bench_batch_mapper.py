@@ -0,0 +1,143 @@
+"""
+Сверка и замер пакетного сопоставления (app/service/extension/batch_mapper.py) с последовательным
+вызовом функций app/service/extension/helpers.py для каждого случая (как в enrich_data).
+
+Случаи строятся из известных названий отделений, кодов МКБ-10 из правил, профилей коек и медицинской
+помощи, дат госпитализации и значений PrehospType_id, DeseaseType_id и ResultDesease_id, включая
+пустые и неизвестные значения.
+
+Запуск из корня репозитория:
+    python -m scripts.bench_batch_mapper [--rows 10000 100000] [--seed 1]
+
+Код возврата 1, если хотя бы для одного случая результаты различаются.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+from app.core import logger
+from app.service.extension.batch_mapper import BATCH_INPUT_FIELDS, map_cases_columnar
+from app.service.extension.helpers import (
+    get_bed_profile_code,
+    get_corrected_outcome_code,
+    get_department_code,
+    get_department_name,
+    get_direction_date,
+    get_disease_type_code,
+    get_medical_care_condition,
+    get_medical_care_form,
+    get_medical_care_profile,
+    get_outcome_code,
+)
+from app.service.reference.icd import icd_range_codes
+from app.service.reference.store import get_reference
+
+
+async def map_case(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Последовательное сопоставление одного случая функциями helpers.py."""
+    started_data = {key: row[key] for key in ("LpuSection_Name", "EvnPS_setDate")}
+    movement = {key: row[key] for key in ("LpuSectionBedProfile_Name", "Diag_Code", "LpuSectionProfile_Name")}
+    referral = {"PrehospType_id": row["PrehospType_id"]}
+    disease = {key: row[key] for key in ("ResultDesease_id", "DeseaseType_id")}
+
+    department_name = await get_department_name(started_data)
+    medical_care_conditions = await get_medical_care_condition(department_name)
+    bed_profile_code, bed_profile_name = await get_bed_profile_code(movement, department_name)
+    outcome_code = await get_outcome_code(disease)
+    return {
+        "department_name": department_name,
+        "department_code": await get_department_code(department_name),
+        "medical_care_conditions": medical_care_conditions,
+        "direction_date": await get_direction_date(started_data["EvnPS_setDate"]),
+        "medical_care_form": await get_medical_care_form(referral),
+        "bed_profile_code": bed_profile_code,
+        "bed_profile_name": bed_profile_name,
+        "medical_care_profile": await get_medical_care_profile(movement, bed_profile_name),
+        "disease_type_code": await get_disease_type_code(disease),
+        "outcome_code": await get_corrected_outcome_code(outcome_code, medical_care_conditions),
+    }
+
+
+def value_pools() -> Dict[str, List[Any]]:
+    """Возможные значения каждого поля ЕВМИАС."""
+    rules = get_reference("mapping_rules")
+    naming = rules["department_name"]
+    section_names = [None, "", "ДС терапия", "Неизвестное отделение ММЦ"]
+    for name in [*rules["departments"], *naming["aliases"]]:
+        section_names += [name] + [f"{name}{part}" for part in naming["remove"]]
+
+    diag_codes = {"I10", "C50.11", "J18.9", "K59.9", "K80.0", "M51.2"}
+    for rule_list in rules["bed_profile_rules"].values():
+        for rule in rule_list:
+            for spec in rule["codes"]:
+                codes = icd_range_codes(spec)
+                diag_codes.update({codes[0], codes[len(codes) // 2], codes[-1]})
+
+    first_day = date(2025, 1, 1)
+    dates = [(first_day + timedelta(days=days)).strftime("%d.%m.%Y") for days in range(90)]
+    return {
+        "LpuSection_Name": section_names,
+        "EvnPS_setDate": dates + ["", "2025-01-10", "31.02.2025"],
+        "LpuSectionBedProfile_Name": ["", *list(get_reference("bed_profiles"))[:20], "неизвестный профиль"],
+        "Diag_Code": ["", *sorted(diag_codes)],
+        "LpuSectionProfile_Name": ["", *list(get_reference("medical_care_profile"))[:20], "Неизвестный"],
+        "PrehospType_id": [None, "1", "2", "3", "4", 2],
+        "ResultDesease_id": [None, "0", *get_reference("disease_outcome_ids")],
+        "DeseaseType_id": [None, "", "1", "2", "3", "4", 1],
+    }
+
+
+def generate_rows(count: int, pools: Dict[str, List[Any]], rng: random.Random) -> List[Dict[str, Any]]:
+    return [{field: rng.choice(pools[field]) for field in BATCH_INPUT_FIELDS} for _ in range(count)]
+
+
+async def bench(count: int, pools: Dict[str, List[Any]], rng: random.Random) -> int:
+    rows = generate_rows(count, pools, rng)
+
+    start_time = time.perf_counter()
+    expected = [await map_case(row) for row in rows]
+    per_case_s = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    columns = {field: [row[field] for row in rows] for field in BATCH_INPUT_FIELDS}
+    result = map_cases_columnar(columns)
+    batch_s = time.perf_counter() - start_time
+
+    mismatches = 0
+    for number, expected_case in enumerate(expected):
+        actual_case = {name: values[number] for name, values in result.items()}
+        if actual_case != expected_case:
+            mismatches += 1
+            if mismatches <= 10:
+                diff = {key: (expected_case[key], actual_case[key])
+                        for key in expected_case if expected_case[key] != actual_case[key]}
+                print(f"Расхождение в случае {rows[number]}: {diff}")
+
+    print(f"Случаев: {count}, расхождений: {mismatches}")
+    print(f"  по случаям: {per_case_s * 1000:8.1f} мс ({count / per_case_s:,.0f} случаев/с)")
+    print(f"  пакетом:    {batch_s * 1000:8.1f} мс ({count / batch_s:,.0f} случаев/с, {per_case_s / batch_s:.1f}x)")
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Размеры пакетов")
+    parser.add_argument("--seed", type=int, default=1, help="Начальное значение генератора случаев")
+    args = parser.parse_args()
+
+    # Сообщения функций сопоставления при замере не нужны
+    logger.remove()
+    rng = random.Random(args.seed)
+    pools = value_pools()
+    mismatches = 0
+    for count in args.rows:
+        mismatches += asyncio.run(bench(count, pools, rng))
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Сравнение и замер разбора выписного эпикриза: app/service/evmias/discharge_parser.py
+против прежней реализации (шаг 5 fetch_patient_discharge_summary, скопирован ниже без изменений).
+
+Корпус - каталог с JSON-файлами ответов XmlTemplate6E/getXmlTemplateForEvnXml (объект с ключами
+template и xmlData) или с результатами fetch_patient_discharge_summary (ответ лежит в ключе raw).
+Файл может содержать и список таких объектов.
+
+Запуск из корня репозитория:
+    python -m scripts.bench_discharge_parser path/to/corpus [--repeat 200]
+
+Код возврата 1, если хотя бы для одного эпикриза результаты различаются.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.service.evmias.discharge_parser import parse_discharge_summary
+
+
+# ============== Прежняя реализация (для сравнения) ==============
+def legacy_clean_html(raw_html):
+    if not raw_html:
+        return ""
+    text = re.sub(r'<.*?>', ' ', raw_html)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_combine_parts(*args):
+    valid_parts = [str(part).strip() for part in args if part]
+    return " ".join(valid_parts) if valid_parts else None
+
+
+def legacy_parse(template_raw: str, xml_data: Dict[str, Any]) -> Dict[str, Any]:
+    LABELS_PRIMARY = r"Диагноз основной|Основное заболевание" # noqa
+    LABELS_COMPLICATION = r"Осложнения основного заболевания|Осложнения" # noqa
+    LABELS_CONCOMITANT = r"Сопутствующие заболевания" # noqa
+
+    STOP_LABELS = [ # noqa
+        LABELS_COMPLICATION,
+        LABELS_CONCOMITANT,
+        r"Внешняя причина при травмах",
+        r"Дополнительные сведения о заболевании",
+        r"@#@ОсложненияОсновногоДиагнозаДвижРасш",
+        r"ОсновногоДиагнозаДвижРасш",
+        r"@#@СопутствующиеДиагнозы",
+        r"@#@КодОсновногоДиагнозаДвижения",
+        r"Состояние при поступлении:",
+        r"основного: ",
+        r"@#@НаименованиеОсновногоДиагнозаДвижения"
+    ]
+    STOP_PATTERN = r"(?:" + "|".join(STOP_LABELS) + r")" # noqa
+
+    def extract_raw_section(template, start_labels_pattern):
+        pattern = rf"({start_labels_pattern})\s*:?\s*(.*?)(?={STOP_PATTERN}|$)"
+        match = re.search(pattern, template, re.DOTALL | re.IGNORECASE)
+        return match.group(2).strip() if match else ""
+
+    raw_primary = extract_raw_section(template_raw, LABELS_PRIMARY)
+    raw_complication = extract_raw_section(template_raw, LABELS_COMPLICATION)
+    raw_concomitant = extract_raw_section(template_raw, LABELS_CONCOMITANT)
+
+    marker_pattern = r"@#@([\w\d]+)@#@"
+
+    primary_text = legacy_clean_html(re.sub(marker_pattern, '', raw_primary))
+    primary_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_primary)]
+    primary_diagnosis = legacy_combine_parts(primary_text, *primary_markers)
+
+    complication_text = legacy_clean_html(re.sub(marker_pattern, '', raw_complication))
+    complication_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_complication)]
+    primary_complication = legacy_combine_parts(complication_text, *complication_markers)
+    if primary_complication:
+        primary_complication = primary_complication.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
+
+    concomitant_text = legacy_clean_html(re.sub(marker_pattern, '', raw_concomitant))
+    concomitant_markers = [xml_data.get(marker_name) for marker_name in re.findall(marker_pattern, raw_concomitant)]
+    concomitant_diseases = legacy_combine_parts(concomitant_text, *concomitant_markers)
+    if concomitant_diseases:
+        concomitant_diseases = concomitant_diseases.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
+
+    diagnos = xml_data.get("diagnos")
+    if diagnos:
+        diagnos = diagnos.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
+
+    item_659 = xml_data.get("specMarker_659")
+    if item_659:
+        item_659 = item_659.replace('Сахарный диабет', '<b>Сахарный диабет</b>')
+
+    return {
+        "diagnos": diagnos,
+        "primary_diagnosis": primary_diagnosis,
+        "primary_complication": primary_complication,
+        "concomitant_diseases": concomitant_diseases,
+        "item_90": xml_data.get("specMarker_90"),
+        "item_94": xml_data.get("specMarker_94"),
+        "item_272": xml_data.get("specMarker_272"),
+        "item_284": xml_data.get("specMarker_284"),
+        "item_659": item_659,
+        "item_145": xml_data.get("specMarker_145"),
+        "AdditionalInf": xml_data.get("AdditionalInf"),
+    }
+# ============== Конец прежней реализации ==============
+
+
+def load_corpus(corpus_dir: Path) -> List[Dict[str, Any]]:
+    """Загружает ответы getXmlTemplateForEvnXml из всех JSON-файлов каталога."""
+    documents = []
+    for path in sorted(corpus_dir.rglob("*.json")):
+        content = json.loads(path.read_text(encoding="utf-8"))
+        for item in content if isinstance(content, list) else [content]:
+            if isinstance(item, dict) and isinstance(item.get("raw"), dict):
+                item = item["raw"]
+            if isinstance(item, dict) and "xmlData" in item:
+                documents.append({"name": path.name, "template": item.get("template") or "",
+                                  "xmlData": item.get("xmlData") or {}})
+    return documents
+
+
+def measure(parse, documents: List[Dict[str, Any]], repeat: int) -> float:
+    """Среднее время разбора одного эпикриза, микросекунды."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for document in documents:
+            parse(document["template"], document["xmlData"])
+    return (time.perf_counter() - start_time) / (repeat * len(documents)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", type=Path, help="Каталог с JSON-файлами эпикризов")
+    parser.add_argument("--repeat", type=int, default=200, help="Сколько раз разбирать корпус при замере")
+    args = parser.parse_args()
+
+    documents = load_corpus(args.corpus)
+    if not documents:
+        print(f"В {args.corpus} не найдено эпикризов")
+        return 1
+
+    mismatches = 0
+    for document in documents:
+        expected = legacy_parse(document["template"], document["xmlData"])
+        actual = parse_discharge_summary(document["template"], document["xmlData"])
+        if actual != expected:
+            mismatches += 1
+            diff = {key: (expected[key], actual.get(key)) for key in expected if expected[key] != actual.get(key)}
+            print(f"Расхождение в {document['name']}: {json.dumps(diff, ensure_ascii=False)}")
+
+    total_kb = sum(len(document["template"]) for document in documents) / 1024
+    legacy_us = measure(legacy_parse, documents, args.repeat)
+    current_us = measure(parse_discharge_summary, documents, args.repeat)
+    print(f"Эпикризов: {len(documents)} (шаблоны {total_kb:.0f} КБ), расхождений: {mismatches}")
+    print(f"Прежний разбор: {legacy_us:.1f} мкс на эпикриз")
+    print(f"Новый разбор:   {current_us:.1f} мкс на эпикриз ({legacy_us / current_us:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
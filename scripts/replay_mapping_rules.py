@@ -0,0 +1,481 @@
+"""
+Сверка правил сопоставления (app/mapper/mapping_rules.json) с прежней реализацией
+(функции app/service/extension/helpers.py и замена исхода из enrich_data, скопированы ниже без изменений).
+
+Записанные случаи - каталог с JSON-файлами. Случай - объект с ключами started_data, movement,
+referral и disease (ответы ЕВМИАС, из которых собираются обогащённые данные), файл может содержать
+и список случаев. С ключом --synthetic к ним добавляются случаи из всех известных названий отделений,
+кодов МКБ-10 из правил и значений PrehospType_id, DeseaseType_id и ResultDesease_id.
+
+Запуск из корня репозитория:
+    python -m scripts.replay_mapping_rules path/to/cases [--synthetic] [--repeat 20]
+
+Код возврата 1, если хотя бы для одного случая результаты различаются.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from app.core import logger
+from app.service.extension.helpers import (
+    get_bed_profile_code,
+    get_corrected_outcome_code,
+    get_department_code,
+    get_department_name,
+    get_disease_type_code,
+    get_medical_care_condition,
+    get_medical_care_form,
+    get_medical_care_profile,
+    get_outcome_code,
+)
+from app.service.reference.icd import icd_range_codes
+from app.service.reference.store import get_reference
+
+
+# ============== Прежняя реализация (для сравнения) ==============
+bed_profiles = get_reference("bed_profiles")
+disease_outcome_ids = get_reference("disease_outcome_ids")
+medical_care_profile = get_reference("medical_care_profile")
+
+LEGACY_DEPARTMENT_CODES = {
+    "Дневной стационар": "36",
+    "Кардиологическое отделение": "21",
+    "Хирургическое отделение №1": "3",
+    "Хирургическое отделение №2": "13",
+    "Урологическое отделение": "5",
+    "Гинекологическое отделение": "7",
+    "Травматология": "26",
+    "Отделение реабилитации": "130",
+    "Неврология": "22",
+    "Гастроэнтерология": "27",
+    "Отделение терапии": "12"
+}
+
+
+LEGACY_BED_PROFILE_CORRECTION_RULES = {
+    "Отделение реабилитации": [
+        {
+            "pattern": re.compile(r"^(M(16|17)\.\d)$"),
+            "replacement": "реабилитационные для больных с заболеваниями опорно-двигательного аппарата "
+                           "и периферической нервной системы"
+        },
+        {
+            "pattern": re.compile(r"^M42\.1$"),
+            "replacement": "реабилитационные для больных с заболеваниями опорно-двигательного аппарата "
+                           "и периферической нервной системы"
+        },
+        {
+            "pattern": re.compile(r"^I\d+\.\d$"),
+            "replacement": "реабилитационные для больных с заболеваниями центральной нервной системы и органов чувств"
+        },
+        {
+            "pattern": re.compile(r"^G\d+\.\d$"),
+            "replacement": "реабилитационные для больных с заболеваниями опорно-двигательного аппарата "
+                           "и периферической нервной системы"
+        },
+    ],
+    "Хирургическое отделение №1": [
+        {
+            "pattern": re.compile(r"^K6[0-4]\.\d$"),
+            "replacement": "проктологические"
+        },
+        {
+            "pattern": re.compile(r"^(K4[0-6]\.\d|K80\.1)$"),
+            "replacement": "абдоминальной хирургии"
+        },
+        {
+            "pattern": re.compile(r"^(I70\.2|I70\.8)$"),
+            "replacement": "сосудистой хирургии"
+        },
+    ],
+    "Хирургическое отделение №2": [
+        {
+            "pattern": re.compile(r"^K6[0-4]\.\d$"),
+            "replacement": "проктологические"
+        },
+        {
+            "pattern": re.compile(r"^(K4[0-6]\.\d|K80\.1)$"),
+            "replacement": "абдоминальной хирургии"
+        },
+        {
+            "pattern": re.compile(r"^(I70\.2|I70\.8)$"),
+            "replacement": "сосудистой хирургии"
+        },
+    ],
+    "Дневной стационар": [
+        {
+            "pattern": re.compile(r"^K6[0-4]\.\d$"),
+            "replacement": "проктологические"
+        },
+        {
+            "pattern": re.compile(r"^(K4[0-6]\.\d|K80\.1)$"),
+            "replacement": "абдоминальной хирургии"
+        },
+        {
+            "pattern": re.compile(r"^(I70\.2|I70\.8)$"),
+            "replacement": "сосудистой хирургии"
+        },
+    ],
+    "Неврология": [
+        {
+            "pattern": re.compile(r"^(M42\.1|M51\.1)$"),
+            "replacement": "нейрохирургические"
+        },
+        {
+            "pattern": re.compile(r"^(I65.3)$"),
+            "replacement": "сосудистой хирургии"
+        },
+    ]
+}
+
+
+LEGACY_MEDICAL_CARE_PROFILE_CORRECTION_RULES = {
+    "абдоминальной хирургии": "хирургии (абдоминальной)",
+    "нейрохирургические": "нейрохирургии",
+    "сосудистой хирургии": "сердечно-сосудистой хирургии",
+}
+
+
+async def legacy_get_medical_care_condition(lpu_section_name: str) -> str:
+    """
+    Определяет код условия оказания медицинской помощи, в зависимости от отделения
+    """
+    inpatient_care = "1"
+    day_hospital_care = "2"
+    logger.debug(f"Определяем условия оказания медицинской помощи. Отделение: {lpu_section_name}")
+    return day_hospital_care if lpu_section_name == "Дневной стационар" else inpatient_care
+
+
+async def legacy_get_department_name(data: dict) -> str | None:
+    """
+    Возвращает нормализованное название отделения госпитализации
+    """
+    raw_name = data.get("LpuSection_Name", "")
+    name = raw_name.strip()
+    if not name:
+        return None
+
+    if name.startswith("ДС"):
+        return "Дневной стационар"
+
+    name = name.replace(" стационар ММЦ", "").replace(" ММЦ", "")
+
+    replacements = {
+        "Травматолого-ортопедическое отделение": "Травматология",
+        "Отделение реабилитации и восстановительного лечения": "Отделение реабилитации",
+        "Неврологическое отделение": "Неврология",
+        "Гастроэнтерологическое отделение": "Гастроэнтерология",
+        "Терапевтическое отделение": "Отделение терапии",
+    }
+    logger.debug(f"название отделения: {replacements.get(name, name)}")
+    return replacements.get(name, name)
+
+
+async def legacy_get_department_code(department_name: str) -> str | None:
+    """
+    Определяет код отделения госпитализации
+    """
+    if not department_name:
+        logger.warning("Не передано название отделения")
+        return None
+    code = LEGACY_DEPARTMENT_CODES.get(department_name)
+    if code is None:
+        logger.warning(f"Не найден код для отделения: {department_name}")
+    return code
+
+
+async def legacy_get_medical_care_form(data: dict) -> str | None:
+    """
+    Определяет код формы оказания медицинской помощи, в зависимости от типа госпитализации
+    """
+    scheduled_hospitalization_code = "3"
+    emergency_hospitalization_code = "1"
+
+    raw_medical_care_form_id = data.get('PrehospType_id')
+    if raw_medical_care_form_id is None:
+        logger.warning("Не найден PrehospDirect_id в данных")
+        return None
+
+    medical_care_form_id = str(raw_medical_care_form_id)
+    logger.debug(f"Определяем код формы медицинской помощи. evmias_id: {medical_care_form_id}")
+
+    match medical_care_form_id:
+        case "2":
+            return scheduled_hospitalization_code
+        case "1" | "3":
+            return emergency_hospitalization_code
+        case _:
+            return None
+
+
+async def legacy_get_medical_care_profile(data: dict, corrected_bed_profile_name: str | None = None) -> str | None:
+    """
+    Определяет код профиля оказания медицинской помощи.
+    Сначала проверяет, есть ли правило коррекции на основе профиля койки.
+    """
+    if corrected_bed_profile_name:
+        target_profile_key = LEGACY_MEDICAL_CARE_PROFILE_CORRECTION_RULES.get(corrected_bed_profile_name)
+        if target_profile_key:
+            logger.info(
+                f"Применяется правило коррекции: профиль койки '{corrected_bed_profile_name}' "
+                f"требует профиль медпомощи '{target_profile_key}'."
+            )
+            profile_data = medical_care_profile.get(target_profile_key)
+            if profile_data and profile_data.get("Code"):
+                return profile_data.get("Code")
+            else:
+                logger.warning(
+                    f"Правило коррекции найдено, но ключ '{target_profile_key}' "
+                    f"отсутствует или некорректен в справочнике medical_care_profile."
+                )
+
+    raw_name = data.get('LpuSectionProfile_Name')
+    if not raw_name:
+        logger.warning("Профиль медицинской помощи не указан.")
+        return None
+
+    profile_key = str(raw_name).lower().strip()
+    profile = medical_care_profile.get(profile_key)
+    if not profile:
+        logger.warning(f"Профиль '{raw_name}' не найден в справочнике.")
+        return None
+
+    code = profile.get("Code")
+    if not code:
+        logger.warning(f"У профиля '{raw_name}' нет кода в справочнике.")
+        return None
+
+    logger.debug(f"Определен код профиля: '{raw_name}' -> '{code}'")
+    return code
+
+
+async def legacy_get_bed_profile_code(movement_data: dict, department_name: str) -> Tuple[str | None, str | None]:
+    """
+    Возвращает кортеж (код профиля койки, итоговое название профиля койки).
+    """
+    bed_profile_name = movement_data.get("LpuSectionBedProfile_Name", "")
+    diag_code = movement_data.get("Diag_Code", "")
+
+    if not bed_profile_name:
+        logger.warning(f"Не найден профиль койки для person_id: {movement_data.get('Person_id')},")
+        return None, None
+
+    # При необходимости корректируем название профиля койки в соответствии
+    # с правилами основными на коде диагноза и имени отделения
+    if department_name in [
+        "Отделение реабилитации",
+        "Хирургическое отделение №1",
+        "Хирургическое отделение №2",
+        "Дневной стационар",
+        "Неврология",
+    ]:
+        for rule in LEGACY_BED_PROFILE_CORRECTION_RULES[department_name]:
+            if diag_code and rule["pattern"].match(diag_code):
+                original_name = bed_profile_name
+                bed_profile_name = rule["replacement"]
+                logger.info(
+                    f"Скорректирован профиль койки для диагноза {diag_code}: с {original_name} на {bed_profile_name}"
+                )
+
+    bed_profile_id = bed_profiles.get(bed_profile_name)
+    if not bed_profile_id:
+        logger.warning(f"Не найден код профиля койки для: {bed_profile_name}")
+        return None, bed_profile_name
+
+    logger.debug(f"Определяем код профиля койки: {bed_profile_name}, код: {bed_profile_id}")
+    return str(bed_profile_id), bed_profile_name
+
+
+async def legacy_get_outcome_code(disease_data: dict) -> str | None:
+    """
+    Определяет код исхода лечения
+    """
+    outcome_code_evmias = disease_data.get("ResultDesease_id")
+    outcome_entry = disease_outcome_ids.get(outcome_code_evmias)
+
+    if not outcome_entry:
+        logger.warning(f"Не найден исход заболевания для evmias_id: {outcome_code_evmias}")
+        return None
+
+    outcome_code = outcome_entry.get("code")
+    logger.debug(f"Определяем код исхода лечения: evmias_id {outcome_code_evmias}, код: {outcome_code}")
+    return outcome_code
+
+
+async def legacy_get_disease_type_code(disease_data: dict) -> str | None:
+    """
+    Определят код характера основного заболевания
+    """
+    acute = "1"  # острое заболевание
+    new_chronic = "2"  # впервые в жизни выявленное хроническое заболевание
+    known_chronic = "3"  # ранее установленное хроническое заболевание
+
+    disease_type_code = disease_data.get("DeseaseType_id")
+    logger.debug(f"Определяем код характера основного заболевания. evmias_id: {disease_type_code}")
+
+    if disease_type_code:
+        match disease_type_code:
+            case "1":
+                return new_chronic
+            case "2":
+                return known_chronic
+            case "3":
+                return acute
+            case _:
+                return None
+
+
+async def legacy_correct_outcome_code(outcome_code, medical_care_conditions):
+    if medical_care_conditions == "1" and outcome_code == 202:
+        outcome_code = "102"
+    return outcome_code
+# ============== Конец прежней реализации ==============
+
+
+async def map_case_legacy(case: Dict[str, Any]) -> Dict[str, Any]:
+    department_name = await legacy_get_department_name(case["started_data"])
+    medical_care_conditions = await legacy_get_medical_care_condition(department_name)
+    bed_profile_code, bed_profile_name = await legacy_get_bed_profile_code(case["movement"], department_name)
+    outcome_code = await legacy_get_outcome_code(case["disease"])
+    return {
+        "department_name": department_name,
+        "department_code": await legacy_get_department_code(department_name),
+        "medical_care_conditions": medical_care_conditions,
+        "bed_profile": [bed_profile_code, bed_profile_name],
+        "medical_care_profile": await legacy_get_medical_care_profile(case["movement"], bed_profile_name),
+        "medical_care_form": await legacy_get_medical_care_form(case["referral"]),
+        "disease_type_code": await legacy_get_disease_type_code(case["disease"]),
+        "outcome_code": await legacy_correct_outcome_code(outcome_code, medical_care_conditions),
+    }
+
+
+async def map_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    department_name = await get_department_name(case["started_data"])
+    medical_care_conditions = await get_medical_care_condition(department_name)
+    bed_profile_code, bed_profile_name = await get_bed_profile_code(case["movement"], department_name)
+    outcome_code = await get_outcome_code(case["disease"])
+    return {
+        "department_name": department_name,
+        "department_code": await get_department_code(department_name),
+        "medical_care_conditions": medical_care_conditions,
+        "bed_profile": [bed_profile_code, bed_profile_name],
+        "medical_care_profile": await get_medical_care_profile(case["movement"], bed_profile_name),
+        "medical_care_form": await get_medical_care_form(case["referral"]),
+        "disease_type_code": await get_disease_type_code(case["disease"]),
+        "outcome_code": await get_corrected_outcome_code(outcome_code, medical_care_conditions),
+    }
+
+
+def load_cases(cases_dir: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """Загружает записанные случаи из всех JSON-файлов каталога."""
+    cases = []
+    for path in sorted(cases_dir.rglob("*.json")):
+        content = json.loads(path.read_text(encoding="utf-8"))
+        for item in content if isinstance(content, list) else [content]:
+            if isinstance(item, dict) and isinstance(item.get("started_data"), dict):
+                cases.append((path.name, {
+                    "started_data": item["started_data"],
+                    "movement": item.get("movement") or {},
+                    "referral": item.get("referral") or {},
+                    "disease": item.get("disease") or {},
+                }))
+    return cases
+
+
+def synthetic_cases() -> List[Tuple[str, Dict[str, Any]]]:
+    """Случаи из всех известных названий отделений и всех кодов МКБ-10, упомянутых в правилах."""
+    rules = get_reference("mapping_rules")
+    naming = rules["department_name"]
+    section_names = ["", "ДС терапия", "Неизвестное отделение ММЦ"]
+    for name in [*rules["departments"], *naming["aliases"]]:
+        section_names += [name, f" {name} "] + [f"{name}{part}" for part in naming["remove"]]
+
+    diag_codes = {"", "I10", "C50.11"}
+    for rule_list in rules["bed_profile_rules"].values():
+        for rule in rule_list:
+            for spec in rule["codes"]:
+                codes = icd_range_codes(spec)
+                diag_codes.update({codes[0], codes[len(codes) // 2], codes[-1]})
+    diag_codes.update({"K59.9", "K65.0", "K39.9", "K47.0", "K80.0", "K80.2", "I70.1", "M15.9", "M18.0", "M51.2"})
+
+    bed_profile_names = ["", next(iter(bed_profiles))]
+    profile_names = ["", next(iter(medical_care_profile))]
+    outcome_ids = [None, *disease_outcome_ids]
+
+    cases = []
+    for section_name, diag_code, bed_profile_name, profile_name in itertools.product(
+            section_names, sorted(diag_codes), bed_profile_names, profile_names):
+        cases.append(("synthetic", {
+            "started_data": {"LpuSection_Name": section_name},
+            "movement": {"LpuSectionBedProfile_Name": bed_profile_name, "Diag_Code": diag_code,
+                         "LpuSectionProfile_Name": profile_name},
+            "referral": {},
+            "disease": {},
+        }))
+    for index, (prehosp_type_id, desease_type_id, outcome_id) in enumerate(itertools.product(
+            [None, "1", "2", "3", "4", 2], [None, "", "1", "2", "3", "4", 1], outcome_ids)):
+        section_name = section_names[index % len(section_names)]
+        cases.append(("synthetic", {
+            "started_data": {"LpuSection_Name": section_name},
+            "movement": {},
+            "referral": {} if prehosp_type_id is None else {"PrehospType_id": prehosp_type_id},
+            "disease": {"DeseaseType_id": desease_type_id, "ResultDesease_id": outcome_id},
+        }))
+    return cases
+
+
+async def measure(map_function, cases: List[Tuple[str, Dict[str, Any]]], repeat: int) -> float:
+    """Среднее время сопоставления одного случая, микросекунды."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for _, case in cases:
+            await map_function(case)
+    return (time.perf_counter() - start_time) / (repeat * len(cases)) * 1e6
+
+
+async def replay(cases: List[Tuple[str, Dict[str, Any]]], repeat: int) -> int:
+    mismatches = 0
+    for name, case in cases:
+        expected = await map_case_legacy(case)
+        actual = await map_case(case)
+        if actual != expected:
+            mismatches += 1
+            diff = {key: (expected[key], actual[key]) for key in expected if expected[key] != actual[key]}
+            print(f"Расхождение в {name} ({json.dumps(case, ensure_ascii=False)}): "
+                  f"{json.dumps(diff, ensure_ascii=False)}")
+
+    legacy_us = await measure(map_case_legacy, cases, repeat)
+    current_us = await measure(map_case, cases, repeat)
+    print(f"Случаев: {len(cases)}, расхождений: {mismatches}")
+    print(f"Прежнее сопоставление: {legacy_us:.1f} мкс на случай")
+    print(f"Правила:               {current_us:.1f} мкс на случай ({legacy_us / current_us:.1f}x)")
+    return 1 if mismatches else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", type=Path, nargs="?", help="Каталог с JSON-файлами записанных случаев")
+    parser.add_argument("--synthetic", action="store_true", help="Добавить случаи, построенные по правилам")
+    parser.add_argument("--repeat", type=int, default=20, help="Сколько раз сопоставлять случаи при замере")
+    args = parser.parse_args()
+
+    cases = load_cases(args.cases) if args.cases else []
+    if args.synthetic:
+        cases += synthetic_cases()
+    if not cases:
+        print("Нет случаев для сверки: укажите каталог или --synthetic")
+        return 1
+
+    # Сообщения функций сопоставления при сверке не нужны
+    logger.remove()
+    return asyncio.run(replay(cases, args.repeat))
+
+
+if __name__ == "__main__":
+    sys.exit(main())